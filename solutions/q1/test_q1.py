@@ -4,7 +4,7 @@
 
 import unittest
 import re
-from mirrored_boyermoore import mirrored_boyermoore as find_all
+from stringalgos.mirrored_boyermoore import mirrored_boyermoore as find_all
 
 
 def load_test_files():
@@ -5,7 +5,7 @@
 import unittest
 import re
 import random
-from wildcard_matching import find_all
+from stringalgos.wildcard_matching import find_all
 
 
 def load_test_files():
@@ -29,6 +29,21 @@ def insert_random_wildcards(string):
     return pattern, re_pattern
 
 
+def insert_random_classes(string):
+    pattern = list(string.strip())
+    re_pattern = list(pattern)
+    for _ in range(random.randint(1, 3)):
+        index = random.randint(0, len(pattern)-1)
+        chars = ''.join(random.sample('ACGT', random.randint(1, 3)))
+        pattern[index] = re_pattern[index] = f'[{chars}]'
+    index = random.randint(1, len(pattern)-1)
+    low = random.randint(0, 2)
+    high = low + random.randint(0, 2)
+    pattern.insert(index, f'x{{{low},{high}}}')
+    re_pattern.insert(index, f'.{{{low},{high}}}')
+    return ''.join(pattern), ''.join(re_pattern)
+
+
 class TestFindAll(unittest.TestCase):
     def subcase(self, n, actual, expected):
         print('Subcase', n)
@@ -84,6 +99,33 @@ class TestFindAll(unittest.TestCase):
         self.subcase(6, find_all('??c', 'cbacd'), [1])
         self.subcase(7, find_all('?a?', 'cbacd'), [1])
 
+    def test_class(self):
+        print('\nTest Class')
+        self.subcase(1, find_all('[ab]c', 'acbcdc'), [0, 2])
+        self.subcase(2, find_all('[^ab]c', 'acbcdc'), [4])
+        self.subcase(3, find_all('a[bc]?', 'abdacea'), [0, 3])
+        self.subcase(4, find_all('[ab]', ''), [])
+
+    def test_gap(self):
+        print('\nTest Gap')
+        self.subcase(1, find_all('ax{1,2}b', 'abaxbaxxbaxxxb'), [2, 5])
+        self.subcase(2, find_all('ax{0,1}b', 'abaxb'), [0, 2])
+        self.subcase(3, find_all('a{2}b', 'aabab'), [0])
+        self.subcase(4, find_all('[ab]{2,3}c', 'abcbbbac'), [0, 4, 5])
+        self.subcase(5, find_all('ab{0,2}', 'abbac'), [0, 3])
+
+    def test_iupac(self):
+        print('\nTest IUPAC')
+        self.subcase(1, find_all('NRY', 'ACGTACGT', iupac=True), [1, 3, 5])
+        self.subcase(2, find_all('NRY', 'ACGTNRY'), [4])
+        self.subcase(3, find_all('ANG', 'AAGACG', iupac=True), [0, 3])
+
+    def test_invalid_extended(self):
+        print('\nTest Invalid Extended')
+        for pat in ['[ab', 'a{2', '{2}a', 'a{3,1}', 'x{0,2}']:
+            with self.assertRaises(ValueError):
+                find_all(pat, 'abc')
+
     def test_pat1(self):
         print('\nTest Pat 1')
         text, pat1, _ = load_test_files()
@@ -182,6 +224,32 @@ class TestFindAll(unittest.TestCase):
                 raise e
         print(f'{len(pat2)}/{len(pat2)}')
 
+    def test_pat1_extended(self):
+        print('\nTest Pat 1 Randomized Classes and Gaps')
+        random.seed(3)
+
+        text, pat1, _ = load_test_files()
+
+        # test all patterns in pat1 with random classes and a gap inserted
+        for index, pat in enumerate(pat1):
+            if index % 10 == 0:
+                print(f'{index}/{len(pat1)}')
+            pattern, re_pattern = insert_random_classes(pat)
+            expected = [m.start() for m in re.finditer(f'(?={re_pattern})', text)]
+
+            try:
+                actual = find_all(pattern, text)
+            except KeyboardInterrupt as e:
+                print(index, pattern, re_pattern)
+                raise e
+            
+            try:
+                self.assertEqual(actual, expected)
+            except AssertionError as e:
+                print(index, pattern, re_pattern)
+                raise e
+        print(f'{len(pat1)}/{len(pat1)}')
+
 
 if __name__ == '__main__':
     op = input('1: unit test\n2: profile\n3: time\n4: scalability\n> ')
@@ -6,7 +6,7 @@ import unittest
 import re
 import random
 
-from modified_kmp import kmp as find_all
+from stringalgos.modified_kmp import kmp as find_all
 
 
 def load_test_files():
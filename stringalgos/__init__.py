@@ -0,0 +1,49 @@
+'''
+String matching algorithms. Submodules are imported lazily on first attribute access, so that
+importing the package (e.g. for the command line interface) only loads the engines in use.
+'''
+import importlib
+
+
+SUBMODULES = (
+    'adversarial',
+    'asyncsearch',
+    'automaton',
+    'batch',
+    'boyermoore',
+    'budget',
+    'cache',
+    'client',
+    'document',
+    'engines',
+    'folding',
+    'incremental',
+    'kmerindex',
+    'kmismatch',
+    'kmp',
+    'lce',
+    'memory',
+    'mirrored_boyermoore',
+    'modified_kmp',
+    'npsearch',
+    'prefilter',
+    'rabinkarp',
+    'server',
+    'shards',
+    'strand',
+    'twoway',
+    'wildcard_matching',
+    'zalgo',
+)
+
+
+def __getattr__(name):
+    if name in SUBMODULES:
+        module = importlib.import_module(f'.{name}', __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(SUBMODULES))
@@ -0,0 +1,100 @@
+'''
+Command line interface searching many patterns in many texts in one process.
+
+    python -m stringalgos [-e ENGINE] (-p PATTERN_FILE | -s PATTERN)... TEXT_FILE...
+
+Each pattern file holds one pattern per line. For every text and pattern one line
+'<text_file>\t<pattern>\t<offsets>' is written, offsets separated by spaces.
+'''
+import argparse
+import sys
+import time
+
+from .engines import ENGINES, BINARY_ENGINES, get_engine, get_compiler
+
+
+def read_patterns(pattern_files, patterns):
+    '''
+    Returns the patterns given directly followed by those in each pattern file (one per line,
+    without the trailing newline), dropping empty lines and duplicates while keeping order.
+    '''
+    result = list(patterns)
+    for path in pattern_files:
+        with open(path) as f:
+            result.extend(line.rstrip('\r\n') for line in f)
+    return [pat for pat in dict.fromkeys(result) if pat]
+
+
+def search_text(engine, pats, compiled, text, one_based):
+    '''
+    Yields (pattern, offsets) for every pattern searched in text with the selected engine.
+    '''
+    if compiled is None:  # multi-pattern engine
+        found = get_engine(engine)[0](pats, text)
+        for pat in pats:
+            yield pat, found[pat]
+        return
+    for pat, pattern in zip(pats, compiled):
+        offsets = sorted(pattern.find_all(text))  # mirrored engines report right to left
+        if one_based:
+            offsets = [offset + 1 for offset in offsets]
+        yield pat, offsets
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m stringalgos', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('texts', nargs='+', metavar='TEXT_FILE', help='text files to search in')
+    parser.add_argument('-e', '--engine', default='bm', choices=list(ENGINES),
+                        help='search engine (default: bm)')
+    parser.add_argument('-p', '--patterns', action='append', default=[], metavar='PATTERN_FILE',
+                        help='file with one pattern per line, may be repeated')
+    parser.add_argument('-s', '--pattern', action='append', default=[], metavar='PATTERN',
+                        help='pattern to search for, may be repeated')
+    parser.add_argument('-o', '--output', help='output file (default: stdout)')
+    parser.add_argument('--one-based', action='store_true', help='report 1-based offsets')
+    parser.add_argument('--timing', action='store_true',
+                        help='report startup, preprocessing and search times on stderr')
+    args = parser.parse_args(argv)
+    startup = time.process_time()  # CPU time of interpreter startup, imports and parsing
+
+    pats = read_patterns(args.patterns, args.pattern)
+    if not pats:
+        parser.error('no patterns given, use -p or -s')
+    binary = args.engine in BINARY_ENGINES
+    if binary:
+        pats = [pat.encode() for pat in pats]
+
+    start = time.perf_counter()
+    kind = get_engine(args.engine)[1]
+    compiled = None
+    if kind != 'multi':
+        compile = get_compiler(args.engine)
+        compiled = [compile(pat) for pat in pats]
+    preprocessing = time.perf_counter() - start
+
+    start = time.perf_counter()
+    out = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        for path in args.texts:
+            with open(path, 'rb' if binary else 'r') as f:
+                text = f.read()
+            for pat, offsets in search_text(args.engine, pats, compiled, text, args.one_based):
+                if binary:
+                    pat = pat.decode()
+                out.write(f'{path}\t{pat}\t{" ".join(map(str, offsets))}\n')
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    searching = time.perf_counter() - start
+
+    if args.timing:
+        print(f'startup: {startup * 1000:.1f} ms cpu', file=sys.stderr)
+        print(f'preprocessing: {preprocessing * 1000:.1f} ms ({len(pats)} patterns)',
+              file=sys.stderr)
+        print(f'search: {searching * 1000:.1f} ms ({len(args.texts)} texts)', file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
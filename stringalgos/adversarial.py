@@ -0,0 +1,153 @@
+'''
+Pathological inputs for the search engines and a benchmark fitting their running time against the
+text length n and the pattern length m, flagging growth beyond the documented complexity.
+
+    python -m stringalgos.adversarial [-e ENGINE]... [-c CASE]... [--repeat R]
+
+Also reports the compiled tables' size and the peak allocation of preprocessing, scan and result
+rendering at n = FIXED_N and m = FIXED_M, see memory.profile_memory. Exits with status 1 if any
+engine grows faster than documented.
+'''
+from math import log
+from timeit import default_timer as timer
+import argparse
+import sys
+
+from .engines import get_compiler
+from .memory import PHASES, profile_memory
+
+
+def fibonacci_word(length):
+    '''
+    Returns the prefix of the given length of the infinite Fibonacci word abaababaabaab...
+    '''
+    a, b = 'a', 'ab'
+    while len(b) < length:
+        a, b = b, b + a
+    return b[:length]
+
+
+def repeat_to(unit, length):
+    return (unit * (length // len(unit) + 1))[:length]
+
+
+# name: (text(n), pat(m)); every text is over {a, b}
+CASES = {
+    'unary': (lambda n: 'a' * n, lambda m: 'a' * m),
+    'unary-last-mismatch': (lambda n: 'a' * n, lambda m: 'a' * (m - 1) + 'b'),
+    'unary-first-mismatch': (lambda n: 'a' * n, lambda m: 'b' + 'a' * (m - 1)),
+    'periodic': (lambda n: repeat_to('ab', n), lambda m: repeat_to('ab', m)),
+    'periodic-mismatch': (lambda n: repeat_to('ab', n), lambda m: repeat_to('ab', m - 1) + 'a'),
+    'fibonacci': (fibonacci_word, fibonacci_word),
+    'self-overlapping-suffix': (lambda n: repeat_to('aab', n),
+                                lambda m: 'b' + repeat_to('aab', m - 1)),
+    'wildcard-dense': (lambda n: 'a' * n, lambda m: repeat_to('a?', m)),
+    'wildcard-only': (lambda n: repeat_to('ab', n), lambda m: '?' * m),
+}
+WILDCARD_CASES = {'wildcard-dense', 'wildcard-only'}  # only meaningful for the wildcard engine
+
+# engine: documented (exponent of n, exponent of m) of the scan for m << n
+COMPLEXITY = {
+    'bm': (1, 0),
+    'kmp': (1, 0),
+    'mirrored-bm': (1, 0),
+    'modified-kmp': (1, 0),
+    'twoway': (1, 0),
+    'wildcard': (1, 1),  # z_algo_special is O(nm/2)
+}
+N_SIZES = (20_000, 40_000, 80_000, 160_000)  # text lengths at fixed m
+M_SIZES = (8, 32, 128, 512)  # pattern lengths at fixed n
+FIXED_N = 40_000
+FIXED_M = 16
+TOLERANCE = 0.35  # slack on fitted exponents for timer noise and caching effects
+
+
+def fit_exponent(sizes, times):
+    '''
+    Returns the slope of the least squares line through (log size, log time), i.e. the exponent e
+    of the best fit time ~ c * size^e.
+        sizes:  Sequence of at least two distinct positive sizes
+        times:  Sequence of positive times measured at sizes
+    '''
+    xs = [log(size) for size in sizes]
+    ys = [log(max(time, 1e-9)) for time in times]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return covariance / variance
+
+
+def time_search(engine, text, pat, repeat=3):
+    '''
+    Returns the best of 'repeat' timings of compiling pat and searching text with engine.
+    '''
+    compile = get_compiler(engine)
+    best = None
+    for _ in range(repeat):
+        start = timer()
+        compile(pat).find_all(text)
+        elapsed = timer() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def get_cases(engine, cases=None):
+    '''
+    Returns the names of the cases run for engine.
+    '''
+    names = CASES if cases is None else cases
+    return [name for name in names if engine == 'wildcard' or name not in WILDCARD_CASES]
+
+
+def benchmark(engines=None, cases=None, repeat=3, n_sizes=N_SIZES, m_sizes=M_SIZES,
+              fixed_n=FIXED_N, fixed_m=FIXED_M, tolerance=TOLERANCE):
+    '''
+    Times every engine on every case while growing n at fixed m and growing m at fixed n. Returns a
+    list of (engine, case, n_exponent, m_exponent, flagged, memory) where the exponents are fitted
+    by fit_exponent, flagged tells whether either exceeds the documented one in COMPLEXITY by more
+    than tolerance and memory is the profile_memory result at fixed_n and fixed_m.
+    '''
+    results = []
+    for engine in engines or COMPLEXITY:
+        expected_n, expected_m = COMPLEXITY[engine]
+        for case in get_cases(engine, cases):
+            make_text, make_pat = CASES[case]
+            pat = make_pat(fixed_m)
+            n_times = [time_search(engine, make_text(n), pat, repeat) for n in n_sizes]
+            text = make_text(fixed_n)
+            m_times = [time_search(engine, text, make_pat(m), repeat) for m in m_sizes]
+            n_exponent = fit_exponent(n_sizes, n_times)
+            m_exponent = fit_exponent(m_sizes, m_times)
+            flagged = n_exponent > expected_n + tolerance or m_exponent > expected_m + tolerance
+            memory = profile_memory(get_compiler(engine), pat, text)
+            results.append((engine, case, n_exponent, m_exponent, flagged, memory))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m stringalgos.adversarial', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-e', '--engine', action='append', choices=list(COMPLEXITY),
+                        help='engine to benchmark, may be repeated (default: all)')
+    parser.add_argument('-c', '--case', action='append', choices=list(CASES),
+                        help='case to run, may be repeated (default: all)')
+    parser.add_argument('--repeat', type=int, default=3, help='timings per size, best is kept')
+    args = parser.parse_args(argv)
+
+    flagged = False
+    columns = ('tables',) + PHASES
+    print(f'{"engine":<14}{"case":<26}{"n exp":>7}{"m exp":>7}'
+          + ''.join(f'{column[:7] + " KiB":>12}' for column in columns) + '  documented')
+    for engine, case, n_exponent, m_exponent, flag, memory in benchmark(args.engine, args.case,
+                                                                        args.repeat):
+        expected_n, expected_m = COMPLEXITY[engine]
+        print(f'{engine:<14}{case:<26}{n_exponent:>7.2f}{m_exponent:>7.2f}'
+              + ''.join(f'{memory[column] / 1024:>12.1f}' for column in columns)
+              + f'  n^{expected_n} m^{expected_m}{"  SUPERLINEAR" if flag else ""}', flush=True)
+        flagged |= flag
+    return 1 if flagged else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
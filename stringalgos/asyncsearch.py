@@ -0,0 +1,80 @@
+import asyncio
+
+from .budget import get_max_length
+from .engines import get_compiler
+
+
+CHUNK = 1 << 14  # number of alignments scanned between yields to the event loop
+
+
+async def asearch(pat, text, engine='bm', chunk=CHUNK, deadline=None, executor=None,
+                  overlap=None, results=None):
+    '''
+    Finds the starting index of all occurrences of pat in text without blocking the event loop. The
+    pattern is compiled once and the text is scanned in chunks of 'chunk' alignments through the
+    compiled pattern's start/end bounds, each window extended by 'overlap' characters so that
+    matches spanning chunk borders are found. Control is returned to the event loop after every
+    chunk, either by yielding (default) or by awaiting the chunk on 'executor', which is handed a
+    slice of the window so that process pools do not receive the whole text. The scan stops at the
+    first chunk border after 'deadline' (in event loop time, see loop.time()) and the offsets found
+    so far are returned.
+    On cancellation the scan stops at the next chunk border and asyncio.CancelledError propagates;
+    offsets of every chunk scanned before that are available in 'results' if it was passed in.
+    Returns (occ, end) where occ is the sorted list of offsets and every alignment before end has
+    been checked, i.e. end == len(text) if the scan completed.
+        pat:        String of characters representing pattern to search for
+        text:       String of characters representing text to search in
+        engine:     Name of an engine in engines.ENGINES, or a function compiling pat into an
+                    object with a find_all(text, start, end) method
+        chunk:      Number of alignments per chunk
+        deadline:   Event loop time after which the scan stops, or None
+        executor:   concurrent.futures.Executor to run chunks on, None to run them inline
+        overlap:    Maximum match length - 1, defaults to the compiled pattern's max_length - 1
+                    (see budget.get_max_length)
+        results:    List to append offsets to as they are found
+        Time:       O(m) preprocessing once, then O(n/c) chunks of the engine's time complexity
+                    over c + overlap characters
+        Space:      O(occ), plus O(c + overlap) per chunk with an executor
+            where:
+                n = |text|
+                m = |pat|
+                c = chunk
+    '''
+    if chunk < 1:
+        raise ValueError('chunk must be positive')
+
+    occ = results if results is not None else []
+    if len(pat) == 0:
+        occ.append(0)
+        return occ, len(text)
+
+    compile = get_compiler(engine) if isinstance(engine, str) else engine
+    compiled = compile(pat)
+    if overlap is None:
+        overlap = get_max_length(compiled) - 1
+    loop = asyncio.get_running_loop()
+    n = len(text)
+    start = 0
+    while start < n:
+        if deadline is not None and loop.time() >= deadline:
+            break
+        stop = min(start + chunk + overlap, n)
+        if executor is None:
+            found = compiled.find_all(text, start, stop)
+        else:
+            window = text[start:stop]
+            found = [start + i for i in await loop.run_in_executor(executor, compiled.find_all,
+                                                                   window)]
+        occ.extend(sorted(i for i in found if i < start + chunk))
+        start += chunk
+        if executor is None:
+            await asyncio.sleep(0)  # cooperative yield, also a cancellation point
+    return occ, min(start, n)
+
+
+async def asearch_timeout(pat, text, timeout, **kwargs):
+    '''
+    Convenience wrapper around asearch which stops the scan 'timeout' seconds from now.
+    '''
+    deadline = asyncio.get_running_loop().time() + timeout
+    return await asearch(pat, text, deadline=deadline, **kwargs)
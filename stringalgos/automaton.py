@@ -0,0 +1,192 @@
+from array import array
+from bisect import bisect_left
+from functools import cached_property
+
+
+class SuffixAutomaton:
+    '''
+    Suffix automaton (DAWG) of a static text for substring queries. States are integers indexing
+    parallel typed arrays. Transitions are stored in compressed sparse rows: the outgoing edges of v
+    are edge_codes[edge_start[v]:edge_start[v + 1]] (sorted alphabet codes) with targets at the same
+    indices of edge_targets. A suffix automaton has at most 2n - 1 states and 3n - 4 edges, so
+    every array is O(n) regardless of the alphabet. Arrays hold 4 byte integers unless the text has
+    2^31 / 3 characters or more.
+        length[v]:  Length of the longest string reaching state v
+        link[v]:    Suffix link of v (-1 for the initial state 0)
+        first[v]:   End index of the first occurrence of the strings of v
+        counts[v]:  Number of occurrences (end positions) of the strings of v
+        text:   String of characters representing text to index
+        Time:   O(n log n + c * sigma)
+        Space:  O(n)
+            where:
+                n = |text|
+                sigma = number of distinct characters of text
+                c = number of cloned states (at most n)
+    '''
+    def __init__(self, text):
+        self.text = text
+        self.alphabet = {c: code for code, c in enumerate(sorted(set(text)))}
+        self.build(text)
+
+    def build(self, text):
+        '''
+        Builds the automaton online (Blumer et al.) with transitions in a dict keyed by
+        state * sigma + code, then packs them into sorted edge arrays and accumulates occurrence
+        counts along the suffix links in decreasing order of length.
+        '''
+        alphabet = self.alphabet
+        sigma = max(len(alphabet), 1)
+        capacity = max(2 * len(text), 2)
+        typecode = 'i' if 3 * len(text) < 2 ** 31 else 'q'  # edge indices reach 3n
+        length = array(typecode, [0]) * capacity
+        link = array(typecode, [-1]) * capacity
+        first = array(typecode, [-1]) * capacity
+        count = array(typecode, [0]) * capacity
+        edges = {}  # state * sigma + code -> target
+        size = 1
+        last = 0
+        for i, c in enumerate(text):
+            c = alphabet[c]
+            cur = size
+            size += 1
+            length[cur] = length[last] + 1
+            first[cur] = i
+            count[cur] = 1  # every non-clone state ends one occurrence at i
+            p = last
+            while p != -1 and p * sigma + c not in edges:
+                edges[p * sigma + c] = cur
+                p = link[p]
+            if p == -1:
+                link[cur] = 0
+            else:
+                q = edges[p * sigma + c]
+                if length[p] + 1 == length[q]:
+                    link[cur] = q
+                else:  # split q by cloning it with the shorter length
+                    clone = size
+                    size += 1
+                    length[clone] = length[p] + 1
+                    link[clone] = link[q]
+                    first[clone] = first[q]
+                    for code in range(sigma):
+                        target = edges.get(q * sigma + code)
+                        if target is not None:
+                            edges[clone * sigma + code] = target
+                    while p != -1 and edges.get(p * sigma + c) == q:
+                        edges[p * sigma + c] = clone
+                        p = link[p]
+                    link[q] = link[cur] = clone
+            last = cur
+
+        # trim to the states used and propagate counts from longest to shortest
+        del length[size:], link[size:], first[size:], count[size:]
+        for v in sorted(range(1, size), key=length.__getitem__, reverse=True):
+            count[link[v]] += count[v]
+
+        # keys sort by state, then by code
+        edge_start = array(typecode, [0]) * (size + 1)
+        edge_codes = array(typecode, [0]) * len(edges)
+        edge_targets = array(typecode, [0]) * len(edges)
+        for e, key in enumerate(sorted(edges)):
+            v, edge_codes[e] = divmod(key, sigma)
+            edge_targets[e] = edges[key]
+            edge_start[v + 1] += 1
+        del edges
+        for v in range(size):
+            edge_start[v + 1] += edge_start[v]
+        self.sigma = sigma
+        self.size = size
+        self.length, self.link, self.first, self.counts = length, link, first, count
+        self.edge_start, self.edge_codes, self.edge_targets = edge_start, edge_codes, edge_targets
+
+    def get_state(self, pat):
+        '''
+        Returns the state reached by reading pat from the initial state, or -1 if pat is not a
+        substring of the text.
+            Time:   O(m log sigma)
+            Space:  O(1)
+                where:
+                m = |pat|
+        '''
+        alphabet = self.alphabet
+        edge_start, edge_codes, edge_targets = self.edge_start, self.edge_codes, self.edge_targets
+        v = 0
+        for c in pat:
+            code = alphabet.get(c)
+            if code is None:
+                return -1
+            lo, hi = edge_start[v], edge_start[v + 1]
+            e = bisect_left(edge_codes, code, lo, hi)
+            if e == hi or edge_codes[e] != code:
+                return -1
+            v = edge_targets[e]
+        return v
+
+    def contains(self, pat):
+        '''
+        Returns whether pat occurs in the text.
+            Time:   O(m log sigma)
+        '''
+        return self.get_state(pat) != -1
+
+    def count(self, pat):
+        '''
+        Returns the number of (possibly overlapping) occurrences of pat in the text. The empty
+        pattern counts once, consistent with find_all returning [0].
+            Time:   O(m log sigma)
+        '''
+        if len(pat) == 0:
+            return 1
+        v = self.get_state(pat)
+        return 0 if v == -1 else self.counts[v]
+
+    @cached_property
+    def children(self):
+        '''
+        Inverse suffix link tree in compressed form (start, child) where the children of v are
+        child[start[v]:start[v + 1]]. Built on the first find_all call only.
+        '''
+        typecode = self.link.typecode
+        start = array(typecode, [0]) * (self.size + 1)
+        link = self.link
+        for v in range(1, self.size):
+            start[link[v] + 1] += 1
+        for v in range(self.size):
+            start[v + 1] += start[v]
+        fill = array(typecode, start)
+        child = array(typecode, [0]) * (self.size - 1)
+        for v in range(1, self.size):
+            child[fill[link[v]]] = v
+            fill[link[v]] += 1
+        return start, child
+
+    def find_all(self, pat):
+        '''
+        Returns the sorted starting indices of all occurrences of pat in the text, found by
+        walking the subtree of pat's state in the inverse suffix link tree. Every non-clone state in
+        the subtree ends exactly one occurrence.
+            Time:   O(m log sigma + occ log occ) after the O(n) first call
+            Space:  O(occ)
+                where:
+                m = |pat|
+                occ = number of occurrences
+        '''
+        m = len(pat)
+        if m == 0:
+            return [0]
+        v = self.get_state(pat)
+        if v == -1:
+            return []
+        start, child = self.children
+        first = self.first
+        ends = set()  # a clone repeats the first end of the state it was cloned from
+        stack = [v]
+        while stack:
+            u = stack.pop()
+            ends.add(first[u])
+            stack.extend(child[start[u]:start[u + 1]])
+        return sorted(end - m + 1 for end in ends)
+
+
+def build_automaton(text):
+    return SuffixAutomaton(text)
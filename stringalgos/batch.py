@@ -0,0 +1,98 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+import os
+
+from .boyermoore import compile_pattern
+
+
+_worker_pattern = None  # compiled pattern shipped to each worker process by _init_worker
+
+
+def _init_worker(compiled):
+    '''
+    Pool initializer storing the compiled pattern in the worker process, so that it is pickled once
+    per worker instead of once per task.
+    '''
+    global _worker_pattern
+    _worker_pattern = compiled
+
+
+def _search_batch(compiled, start, texts):
+    '''
+    Searches each text of a contiguous batch and returns (doc_index, offsets) pairs.
+    '''
+    find_all = compiled.find_all
+    return [(start + index, find_all(text)) for index, text in enumerate(texts)]
+
+
+def _search_batch_in_worker(start, texts):
+    return _search_batch(_worker_pattern, start, texts)
+
+
+def get_batches(texts, batch_size):
+    '''
+    Splits texts into contiguous (start, batch) pairs of at most batch_size texts.
+        texts:      Sequence of texts
+        batch_size: Maximum number of texts per batch
+    '''
+    return [(start, texts[start:start + batch_size]) for start in range(0, len(texts), batch_size)]
+
+
+def search_many(pat, texts, executor=None, compile=compile_pattern, workers=None, batch_size=None):
+    '''
+    Searches one pattern in many texts, compiling the pattern tables once. Returns a list of
+    (doc_index, offsets) pairs in input order.
+    'compile' selects the engine, e.g. boyermoore.compile_pattern (default), kmp.compile_pattern or
+    wildcard_matching.compile_pattern; it must return an object with a find_all(text) method.
+    'executor' selects how batches are run:
+        None        inline in the calling thread
+        'thread'    on a new ThreadPoolExecutor sharing the compiled pattern
+        'process'   on a new ProcessPoolExecutor, the compiled pattern is shipped once per worker
+                    through the pool initializer
+        Executor    on the given executor, the compiled pattern is sent with every batch
+        pat:        String of characters representing pattern to search for
+        texts:      Sequence of strings to search in
+        executor:   None, 'thread', 'process' or a concurrent.futures.Executor
+        compile:    Function compiling pat into a pattern with a find_all(text) method
+        workers:    Number of workers for 'thread' and 'process', defaults to os.cpu_count()
+        batch_size: Number of texts per batch, defaults to spreading texts over 4 batches per worker
+        Time:       O(m + sum(engine time over each text))
+        Space:      O(m + occ)
+            where:
+                m = |pat|
+                occ = total number of offsets returned
+    '''
+    compiled = compile(pat)
+    if not isinstance(texts, (list, tuple)):
+        texts = list(texts)
+    if executor is None:
+        return _search_batch(compiled, 0, texts)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if batch_size is None:
+        batch_size = max(1, -(-len(texts) // (workers * 4)))
+    batches = get_batches(texts, batch_size)
+
+    if executor == 'process':
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(compiled,)) as pool:
+            futures = [pool.submit(_search_batch_in_worker, start, batch) for start, batch in batches]
+            return [result for future in futures for result in future.result()]
+
+    if executor == 'thread':
+        with ThreadPoolExecutor(workers) as pool:
+            return search_batches(pool, compiled, batches)
+
+    if isinstance(executor, Executor):
+        return search_batches(executor, compiled, batches)
+    raise ValueError(f'unknown executor {executor!r}')
+
+
+def search_batches(executor, compiled, batches):
+    '''
+    Runs every (start, batch) pair on executor with the given compiled pattern and returns the
+    concatenated (doc_index, offsets) pairs in input order.
+    '''
+    search = partial(_search_batch, compiled)
+    futures = [executor.submit(search, start, batch) for start, batch in batches]
+    return [result for future in futures for result in future.result()]
@@ -0,0 +1,412 @@
+from functools import cached_property, lru_cache
+import sys
+
+from .folding import FoldedPattern
+from .memory import deep_sizeof, get_table_nbytes
+from .zalgo import z_algo
+
+
+ALPHABET = [chr(i) for i in range(128)]  # all ascii characters
+
+
+def get_bad_char_lookup(pat):
+    '''
+    Returns 2D lookup table to be used in the 'bad character' rule of the Boyer Moore algorithm.
+    Looking up a pattern shift will never return a value less than 1 if the lookup character is 
+    not the same as the character in the pattern at that position (in which case you should
+    not be shifting anyway).
+        pat:    String of characters representing the pattern to be used in lookup table 
+                generation.
+        Time:   O(m)
+        Space:  O(m)
+            where:
+            m = length of 'pat'
+    '''
+    # rows for non-ascii pattern chars, bytes patterns get no rows and always shift by the default
+    size = max([len(ALPHABET)] + [ord(char) + 1 for char in pat if isinstance(char, str)])
+    lookup_table = [None for _ in range(size)]  # O(|alphabet|) time, upper bound of O(|alphabet| * m) space
+    for index, char in enumerate(pat):  # O(m) time
+        for i in range(len(lookup_table)):  # O(|alphabet|) time
+            row = lookup_table[i]
+            if chr(i) == char:
+                if row is None:
+                    lookup_table[i] = [-1 for _ in range(len(pat))]  # O(m) size array created at most |alphabet| times
+                lookup_table[i][index] = index
+            elif row is not None:
+                lookup_table[i][index] = row[index-1]
+    return lookup_table
+
+
+def get_good_suffix_lookup(pat):
+    '''
+    Returns the lookup table to be used in the 'good suffix' rule of the Boyer Moore algorithm. 
+    Each value (v) in the lookup table is such that len(pat) - v = leftwards shift of pattern 
+    possible such that the already matched characters in pat align with the text.
+        pat:    String of characters to generate lookup table for.
+        Time:   O(n)
+        Space:  O(n)
+            where:
+            n = length of 'pat'
+    '''
+    z_suffix = list(reversed(z_algo(reversed(pat))))
+    m = len(pat)
+    good_suffix = [0 for _ in range(m + 1)]
+    for p in range(m - 1):  # zs[-1] is always len(pat), hence gs[0] is always len(pat) - 1, but gs[0] is never lookup anyway
+        good_suffix[m - z_suffix[p]] = p + 1
+    
+    return good_suffix
+
+
+def get_matched_prefix(pat):
+    '''
+    Returns the 'matched prefix' lookup table to be used in the Boyer Moore algorithm. Each value 
+    (v) in the lookup table represents the length of the longest suffix that matches the prefix of 
+    pat.
+        pat:    String of characters to generate lookup table for.
+        Time:   O(n)
+        Space:  O(n)
+            where:
+            n = length of 'pat'
+    '''
+    z_array = z_algo(pat)
+    matched_prefix = [0 for _ in range(len(pat) + 1)]
+    for i in range(len(pat) - 1, -1, -1):
+        matched_prefix[i] = z_array[i] if z_array[i] + i == len(pat) else matched_prefix[i + 1]
+
+        if matched_prefix[i] > len(pat) - 1:  # limit max value of mp such that m - mp will always be at least 1
+            matched_prefix[i] = len(pat) - 1
+    return matched_prefix
+
+
+def count():
+    '''
+    Dummy function used to count the number of times a certain point in code is reached. Intended 
+    to be used with CProfile.
+    '''
+    pass
+
+
+def get_last_mismatch_shift(pat):
+    '''
+    Returns the good suffix shift for a mismatch at the last character of pat, i.e. the value the
+    good suffix and matched prefix tables give for an empty good suffix. It is computed without
+    the tables so that mismatches at the last character never require building them.
+        pat:    String of characters to compute the shift for.
+        Time:   O(m)
+        Space:  O(1)
+            where:
+            m = length of 'pat'
+    '''
+    m = len(pat)
+    for p in range(m - 2, -1, -1):
+        if pat[p] != pat[m - 1]:
+            return m - p - 1
+    return m
+
+
+class CompiledPattern:
+    '''
+    Preprocessed Boyer Moore tables for a single pattern. Compiling once and calling find_all on
+    many texts avoids rebuilding the tables for every search. The good suffix and matched prefix
+    tables are only built (and then kept) the first time a scan needs them, i.e. on a full match
+    or on a mismatch after at least one matched character.
+        pat:    String of characters representing pattern to search for.
+        Time:   O(m) preprocessing
+        Space:  O(m)
+            where:
+            m = length of 'pat'
+    '''
+    TABLES = ('bad_char', 'good_suffix', 'matched_prefix')
+
+    def __init__(self, pat):
+        self.pat = pat
+        self.bad_char = get_bad_char_lookup(pat)
+        self.last_shift = get_last_mismatch_shift(pat)
+
+    @cached_property
+    def good_suffix(self):
+        return get_good_suffix_lookup(self.pat)
+
+    @cached_property
+    def matched_prefix(self):
+        return get_matched_prefix(self.pat)
+
+    @property
+    def nbytes(self):
+        '''
+        Returns a dict mapping each preprocessing table built so far to its size in bytes.
+        '''
+        return get_table_nbytes(self, self.TABLES)
+
+    def find_all(self, text, start=0, end=None):
+        '''
+        Finds the starting index of all occurrances of the pattern in text[start:end], without
+        copying the window. Offsets are relative to text.
+            text:   String of characters representing text to search in.
+            start:  Start of the window, interpreted like a slice index.
+            end:    End of the window (exclusive), interpreted like a slice index.
+            Time:   O(n) worst case
+            Space:  O(n)
+                where:
+                n = length of the window
+        '''
+        return self.scan(text, False, start, end)
+
+    def contains(self, text, start=0, end=None):
+        '''
+        Returns True if the pattern occurs in text[start:end], stopping the scan at the first
+        occurrence.
+            text:   String of characters representing text to search in.
+        '''
+        return len(self.scan(text, True, start, end)) > 0
+
+    def scan(self, text, first, start=0, end=None):
+        '''
+        Runs the Boyer Moore scan over text[start:end] and returns the list of occurrences, or only
+        the first occurrence if first is True.
+        '''
+        start, end, _ = slice(start, end).indices(len(text))
+        pat = self.pat
+        if len(pat) == 0:
+            return [start]
+
+        bad_char = self.bad_char
+        last_shift = self.last_shift
+        good_suffix = None  # fetched from self on first need
+        matched_prefix = None
+
+        occ = []
+        j = start  # denotes start of pat relative to text (inclusive)
+        m = len(pat)  # denotes length of pat
+        k = m - 1  # denotes current index relative to pat
+        i = start + m  # denotes end of pat relative to text
+        galil_br = -1  # denotes breakpoint for Galil's optimization relative to text
+        galil_rs = -1  # denotes resume point for Galil's optimization relative to text
+        n = end  # denotes end of the searched window of text
+        bc_row = None
+        previous_char = None
+        while i <= n:
+            # print(text)
+            # print(' ' * j + pat)
+            # print(' ' * (j + k) + 'k')
+            if k < 0:  # full match found
+                occ.append(j)
+                if first:
+                    break
+                if matched_prefix is None:
+                    matched_prefix = self.matched_prefix
+                shift = m - matched_prefix[1]
+                galil_br = i - 1  # the overlap with this match is known to match the next alignment
+                j += shift
+                i += shift
+                galil_rs = j - 1  # resuming before the start of pat completes the match
+                k = m - 1  # k resets to m (end of pat)
+                continue
+
+            global_index = j + k
+            if global_index == galil_br:  # galil's optimization
+                galil_br = -1
+                k = galil_rs - j
+                continue
+
+            current_char = text[global_index]
+            if current_char == pat[k]:
+                k -= 1
+            else:
+                try:
+                    if current_char != previous_char:
+                        bc_row = bad_char[ord(current_char)]
+                        previous_char = current_char
+                    bc = k - bc_row[k]
+                except (TypeError, IndexError):
+                    bc = k + 1  # bad char does not exist in pat, therefore shift entire pat length
+                if k == m - 1:  # empty good suffix, no tables needed
+                    gs = last_shift
+                else:
+                    if good_suffix is None:
+                        good_suffix = self.good_suffix
+                        matched_prefix = self.matched_prefix
+                    gs = good_suffix[k + 1]
+                    gs = m - matched_prefix[k + 1] if gs == 0 else m - gs
+
+                if bc > gs:  # shifting by bad character
+                    shift = bc
+                    galil_br = global_index
+                    galil_rs = galil_br
+                else:  # shifting by good suffix
+                    shift = gs
+                    galil_br = i - 1  # break value for Galil's optimization
+                    galil_rs = global_index  # resume value for Galil's optimization
+            
+                j += shift
+                i += shift
+                k = m - 1  # k resets to m (end of pat)
+
+        return occ
+
+
+UNROLL = 4  # number of trailing pattern characters compared inline by specialized matchers
+SPECIALIZED_CACHE_SIZE = 256  # number of specialized matchers kept by get_specialized
+
+
+def get_mismatch_shift(compiled, k, char):
+    '''
+    Returns the shift taken by the Boyer Moore scan when char mismatches pat[k], i.e. the larger of
+    the bad character and good suffix shifts.
+        compiled:   CompiledPattern of the pattern
+        k:          Index of the mismatch relative to pat
+        char:       Mismatched text character, or None for a character not in pat
+    '''
+    pat = compiled.pat
+    m = len(pat)
+    bc = k - pat.rfind(char, 0, k) if char is not None else k + 1
+    gs = compiled.good_suffix[k + 1]
+    gs = m - compiled.matched_prefix[k + 1] if gs == 0 else m - gs
+    return bc if bc > gs else gs
+
+
+def get_weak_suffix_shift(pat, length):
+    '''
+    Returns the smallest shift which keeps the last 'length' characters of pat consistent with
+    themselves, which is safe whenever at least 'length' trailing characters have matched.
+        Time:   O(m * length)
+    '''
+    m = len(pat)
+    for shift in range(1, m):
+        if all(i - shift < 0 or pat[i - shift] == pat[i] for i in range(m - length, m)):
+            return shift
+    return m
+
+
+def get_specialized_source(pat):
+    '''
+    Returns (source, constants) of a find_all(text, start=0, end=None) function specialized for
+    pat. The last UNROLL characters are compared inline against constants, each mismatch shifting
+    by a constant dict lookup, and the remaining prefix is compared with a single slice comparison.
+        pat:    Non-empty string of characters
+        Time:   O(m * (UNROLL + |alphabet of pat|))
+        Space:  O(UNROLL * |alphabet of pat| + m)
+            where:
+                m = length of 'pat'
+    '''
+    compiled = CompiledPattern(pat)
+    m = len(pat)
+    unrolled = min(m, UNROLL)
+    constants = {'PREFIX': pat[:m - unrolled]}
+    lines = [
+        'def find_all(text, start=0, end=None):',
+        '    start, end, _ = slice(start, end).indices(len(text))',
+        '    occ = []',
+        '    append = occ.append',
+        f'    last = end - {m}',
+        '    j = start',
+        '    while j <= last:',
+    ]
+    for k in range(m - 1, m - 1 - unrolled, -1):
+        constants[f'SHIFT_{k}'] = {c: get_mismatch_shift(compiled, k, c) for c in set(pat)}
+        lines += [
+            f'        c = text[j + {k}]' if k else '        c = text[j]',
+            f'        if c != {pat[k]!r}:',
+            f'            j += SHIFT_{k}.get(c, {get_mismatch_shift(compiled, k, None)})',
+            '            continue',
+        ]
+    match_shift = m - compiled.matched_prefix[1]
+    if unrolled < m:
+        lines += [
+            f'        if text[j:j + {m - unrolled}] == PREFIX:',
+            '            append(j)',
+            f'            j += {match_shift}',
+            '        else:',
+            f'            j += {get_weak_suffix_shift(pat, unrolled)}',
+        ]
+    else:
+        lines += [
+            '        append(j)',
+            f'        j += {match_shift}',
+        ]
+    lines.append('    return occ')
+    return '\n'.join(lines) + '\n', constants
+
+
+@lru_cache(maxsize=SPECIALIZED_CACHE_SIZE)
+def get_specialized(pat):
+    '''
+    Returns the find_all(text, start, end) function generated by get_specialized_source for pat, compiled once
+    and cached.
+    '''
+    source, namespace = get_specialized_source(pat)
+    exec(compile(source, f'<boyermoore specialized for {pat[:32]!r}>', 'exec'), namespace)
+    return namespace['find_all']
+
+
+class SpecializedPattern:
+    '''
+    Compiled pattern whose find_all is Python code generated for that one pattern, see
+    get_specialized_source. It has a lower constant factor than CompiledPattern for long-running
+    searches with the same pattern, but does not use Galil's rule, so periodic texts and patterns
+    can take O(nm) time.
+        pat:    Non-empty string of characters representing pattern to search for.
+    '''
+    def __init__(self, pat):
+        self.pat = pat
+        self.find_all = get_specialized(pat)
+
+    @property
+    def nbytes(self):
+        '''
+        Returns a dict with the size in bytes of the constants looked up by the generated find_all.
+        '''
+        namespace = self.find_all.__globals__
+        seen = set()
+        return {'constants': sum(deep_sizeof(value, seen) for name, value in namespace.items()
+                                 if name.isupper())}
+
+
+def compile_pattern(pat, fold=None, specialize=False):
+    '''
+    Returns a CompiledPattern holding the Boyer Moore tables for pat. If fold is given, the tables
+    are built over the folded pattern and text characters are folded as they are scanned (see
+    folding.FoldedPattern). If specialize is True, a SpecializedPattern is returned instead.
+        pat:        String of characters representing pattern to search for.
+        fold:       None, name of a predefined folding (e.g. 'case') or a dict mapping characters
+                    to characters.
+        specialize: Whether to generate a matcher dedicated to pat.
+    '''
+    factory = SpecializedPattern if specialize and len(pat) > 0 else CompiledPattern
+    if fold is not None:
+        return FoldedPattern(factory, pat, fold)
+    return factory(pat)
+
+
+def boyermoore(pat, text, fold=None, start=0, end=None):
+    '''
+    Finds the starting index of all occurrances of pat in text using Boyer Moore's algorithm.
+        pat:    String of characters representing pattern to search for.
+        text:   String of characters representing text to search in.
+        fold:   Optional character folding, see compile_pattern.
+        start:  Start of the searched window of text, offsets stay relative to text.
+        end:    End of the searched window of text (exclusive).
+        Time:   O(n + m) worst case
+        Space:  O(n + m)
+            where:
+            n = length of 'text'
+            m = length of 'pat'
+    '''
+    return compile_pattern(pat, fold).find_all(text, start, end)
+
+
+if __name__ == '__main__':
+    # text_file, pat_file = sys.argv[1:]
+    text_file, pat_file = './29352258/q1/txt1.txt', './29352258/q1/pat1.txt'
+
+    with open(text_file) as f:
+        text = f.read()
+    
+    with open(pat_file) as f:
+        pat = f.read()
+
+    print('Text:', text)
+    print('Pat: ', pat)
+
+    # BM to find all occurrances of pat in text
+    print(boyermoore(pat, text))
@@ -0,0 +1,157 @@
+'''
+Searches with a work or time budget. A budgeted search returns the offsets found so far and a resume
+token once the budget runs out, so that adversarial inputs cannot stall the caller.
+'''
+from collections import namedtuple
+import time
+
+from .rabinkarp import find_all_multi
+
+
+CHUNK = 1 << 12  # number of alignments scanned between budget checks
+MIN_CHUNK_OVERLAPS = 4  # chunks span at least this many overlaps, bounding rescans to 1/4
+
+# window of text left to scan, pass as resume= to continue a budgeted search
+ResumeToken = namedtuple('ResumeToken', ['start', 'end'])
+
+
+class Budget:
+    '''
+    Limit on the work of one or more budgeted searches. Work is counted in text characters handed
+    to the engine, including the overlap between chunks.
+        max_chars:  Number of characters that may be examined, or None
+        timeout:    Seconds from now after which the budget is exhausted, or None
+        deadline:   time.monotonic() value after which the budget is exhausted, or None
+    '''
+    def __init__(self, max_chars=None, timeout=None, deadline=None):
+        if timeout is not None:
+            timeout_deadline = time.monotonic() + timeout
+            deadline = timeout_deadline if deadline is None else min(deadline, timeout_deadline)
+        self.max_chars = max_chars
+        self.deadline = deadline
+        self.chars = 0
+
+    def charge(self, chars):
+        self.chars += chars
+
+    def remaining(self):
+        '''
+        Returns the number of characters left to examine, or None without a character limit.
+        '''
+        return None if self.max_chars is None else max(self.max_chars - self.chars, 0)
+
+    def exhausted(self):
+        if self.max_chars is not None and self.chars >= self.max_chars:
+            return True
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+
+def get_max_length(pattern):
+    '''
+    Returns the longest span of text an occurrence of a compiled pattern can cover.
+    '''
+    max_length = getattr(pattern, 'max_length', None)
+    return len(pattern.pat) if max_length is None else max_length
+
+
+def find_all_budgeted(pattern, text, budget, start=0, end=None, resume=None, chunk=CHUNK):
+    '''
+    Finds the starting index of all occurrences of a compiled pattern in text[start:end] within a
+    budget. The window is scanned in chunks of alignments through the engine's start/end bounds,
+    each extended by the longest occurrence length minus one (the overlap) so that no occurrence is
+    missed. Chunks are widened to at least MIN_CHUNK_OVERLAPS overlaps, so rescanning the overlap
+    costs at most a quarter of the characters of a long pattern.
+    The budget is charged with every character handed to the engine, overlap included, and is
+    checked between chunks:
+        max_chars   Each chunk is shrunk to fit the characters remaining, so the limit is never
+                    exceeded, except that the first chunk of a call always scans one alignment
+                    (m characters) to guarantee progress.
+        deadline    The bound is per chunk: a call returns at the first chunk border after the
+                    deadline, so it can overrun by the time of one engine call over at most
+                    chunk + overlap characters.
+    Returns (occ, token) where occ lists the occurrences found in ascending order and token is None
+    if the window was scanned completely, otherwise a ResumeToken to pass as resume= to continue
+    exactly where the scan stopped. Occurrences are offsets, or tuples starting with the offset for
+    patterns reporting more, e.g. strand.CompiledPattern or kmismatch.CompiledPattern.
+        pattern:    Compiled pattern whose find_all accepts start and end, e.g. from
+                    engines.get_compiler
+        text:       String of characters representing text to search in
+        budget:     Budget charged with the characters scanned
+        start:      Start of the searched window of text
+        end:        End of the searched window of text (exclusive)
+        resume:     ResumeToken returned by a previous call, overrides start and end
+        chunk:      Number of alignments per chunk
+        Time:       O(c) chunks of the engine's time complexity over c + m characters, per call
+        Space:      O(occ)
+            where:
+                c = chunk
+                m = longest occurrence length
+    '''
+    if chunk < 1:
+        raise ValueError('chunk must be positive')
+    if resume is not None:
+        start, end = resume
+    start, end, _ = slice(start, end).indices(len(text))
+    overlap = get_max_length(pattern) - 1
+    if overlap < 0:  # empty pattern, no scan needed
+        return pattern.find_all(text, start, end), None
+    chunk = max(chunk, MIN_CHUNK_OVERLAPS * overlap)
+
+    occ = []
+    pos = start
+    while pos < end:
+        size = chunk
+        remaining = budget.remaining()
+        if remaining is not None:
+            size = min(size, remaining - overlap)
+        if pos > start and (size < 1 or budget.exhausted()):
+            return occ, ResumeToken(pos, end)
+        size = max(size, 1)
+        stop = min(pos + size + overlap, end)
+        found = pattern.find_all(text, pos, stop)
+        budget.charge(stop - pos)
+        if stop == end:  # last chunk, every remaining alignment has been checked
+            occ.extend(sorted(found))
+            break
+        occ.extend(sorted(item for item in found
+                          if (item if isinstance(item, int) else item[0]) < pos + size))
+        pos += size
+    return occ, None
+
+
+class MultiPattern:
+    '''
+    Adapts rabinkarp.find_all_multi to the compiled pattern interface, reporting (offset, pat) pairs.
+    Empty patterns are not searched.
+    '''
+    def __init__(self, pats, use_numpy=None):
+        self.pats = [pat for pat in dict.fromkeys(pats) if len(pat) > 0]
+        self.use_numpy = use_numpy
+        self.max_length = max(map(len, self.pats), default=0)
+
+    def find_all(self, text, start=0, end=None):
+        occ = find_all_multi(self.pats, text, self.use_numpy, start, end)
+        return sorted((offset, pat) for pat, offsets in occ.items() for offset in offsets)
+
+
+def find_all_multi_budgeted(pats, text, budget, start=0, end=None, resume=None, chunk=CHUNK,
+                            use_numpy=None):
+    '''
+    Finds all occurrences of every pattern in pats in text[start:end] within a budget, see
+    find_all_budgeted and rabinkarp.find_all_multi. Returns (occ, token) where occ maps each pattern
+    to the sorted list of offsets found so far. Empty patterns occur once, at the start of the
+    window, and are reported by the first call only.
+    '''
+    pats = list(dict.fromkeys(pats))
+    pattern = MultiPattern(pats, use_numpy)
+    occ = {pat: [] for pat in pats}
+    if resume is None:
+        for pat in pats:
+            if len(pat) == 0:
+                occ[pat].append(slice(start, end).indices(len(text))[0])
+    if not pattern.pats:
+        return occ, None
+    found, token = find_all_budgeted(pattern, text, budget, start, end, resume, chunk)
+    for offset, pat in found:
+        occ[pat].append(offset)
+    return occ, token
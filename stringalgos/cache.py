@@ -0,0 +1,207 @@
+from array import array
+from collections import OrderedDict
+import hashlib
+import os
+
+
+DIGEST_CHUNK = 1 << 20  # number of characters hashed at a time, bounds the encoding copy
+ENTRY_OVERHEAD = 64  # approximate bytes of bookkeeping per cached entry
+
+
+def digest_text(text):
+    '''
+    Returns a hex digest of the given text. str is hashed as UTF-8 in bounded chunks so that the text
+    is never copied in full.
+        text:   str or bytes-like object
+        Time:   O(n)
+        Space:  O(1)
+            where:
+                n = |text|
+    '''
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(text, str):
+        for start in range(0, len(text), DIGEST_CHUNK):
+            h.update(text[start:start + DIGEST_CHUNK].encode('utf-8', 'surrogatepass'))
+    else:
+        h.update(text)
+    return h.hexdigest()
+
+
+def digest_file(path):
+    '''
+    Returns a hex digest of the contents of the file at path, read in bounded blocks.
+    '''
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(DIGEST_CHUNK), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def get_engine_name(engine):
+    '''
+    Returns a stable name for an engine function, used as part of cache keys.
+    '''
+    return f'{engine.__module__}.{engine.__qualname__}'
+
+
+class ResultCache:
+    '''
+    Memoizes search results keyed by (engine, pattern, text digest). Offsets are stored in typed
+    arrays and evicted least recently used first once max_bytes is exceeded. If directory is given,
+    results are also written there and reloaded on a memory miss.
+    Texts are not referenced by the cache. Their digests are remembered per caller-supplied text_id
+    (see search) and per file (by path, mtime and size) so unchanged inputs are hashed only once;
+    other texts are hashed on every search. Digests of mutable buffers are never remembered.
+        max_bytes:      Memory budget for cached offsets
+        directory:      Directory for the on-disk tier, or None
+        max_digests:    Number of text_id digests remembered
+    '''
+    def __init__(self, max_bytes=64 << 20, directory=None, max_digests=64):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_digests = max_digests
+        self.entries = OrderedDict()  # key -> array of offsets, least recently used first
+        self.nbytes = 0
+        self.text_digests = OrderedDict()  # text_id -> digest, least recently used first
+        self.file_digests = {}  # path -> (mtime_ns, size, digest)
+        self.hits = self.misses = self.evictions = self.disk_hits = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def get_text_digest(self, text, text_id=None):
+        '''
+        Returns the digest of text. If text_id is given and text is immutable (str or bytes), the
+        digest is computed only the first time text_id is seen.
+            text_id:    Hashable identity of the contents of text chosen by the caller, e.g. a
+                        (name, version) pair, which must change whenever the contents do
+        '''
+        if text_id is None or not isinstance(text, (str, bytes)):
+            return digest_text(text)
+        digest = self.text_digests.get(text_id)
+        if digest is not None:
+            self.text_digests.move_to_end(text_id)
+            return digest
+        digest = digest_text(text)
+        self.text_digests[text_id] = digest
+        if len(self.text_digests) > self.max_digests:
+            self.text_digests.popitem(last=False)
+        return digest
+
+    def get_file_digest(self, path):
+        '''
+        Returns the digest of the file at path, rehashing only if its mtime or size changed.
+        '''
+        stat = os.stat(path)
+        entry = self.file_digests.get(path)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+        digest = digest_file(path)
+        self.file_digests[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def get_path(self, key):
+        name = hashlib.blake2b(repr(key).encode('utf-8', 'surrogatepass'), digest_size=16)
+        return os.path.join(self.directory, name.hexdigest() + '.bin')
+
+    def get(self, key):
+        '''
+        Returns the cached offsets for key as a list, or None on a miss.
+        '''
+        offsets = self.entries.get(key)
+        if offsets is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return offsets.tolist()
+
+        if self.directory is not None:
+            try:
+                with open(self.get_path(key), 'rb') as f:
+                    data = f.read()
+            except FileNotFoundError:
+                pass
+            else:
+                offsets = array('q')
+                offsets.frombytes(data)
+                self.put(key, offsets, write=False)
+                self.disk_hits += 1
+                return offsets.tolist()
+
+        self.misses += 1
+        return None
+
+    def put(self, key, offsets, write=True):
+        '''
+        Stores offsets for key, evicting least recently used entries to stay within max_bytes.
+        '''
+        if not isinstance(offsets, array):
+            offsets = array('q', offsets)
+        if write and self.directory is not None:
+            path = self.get_path(key)
+            with open(path + '.tmp', 'wb') as f:
+                offsets.tofile(f)
+            os.replace(path + '.tmp', path)
+
+        size = len(offsets) * offsets.itemsize + ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.nbytes -= len(previous) * previous.itemsize + ENTRY_OVERHEAD
+        self.entries[key] = offsets
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.nbytes -= len(evicted) * evicted.itemsize + ENTRY_OVERHEAD
+            self.evictions += 1
+
+    def search(self, engine, pat, text, text_id=None):
+        '''
+        Returns engine(pat, text), served from the cache when the same engine, pattern and text
+        contents have been searched before.
+            engine:     Function engine(pat, text) returning a list of offsets
+            pat:        String of characters representing pattern to search for
+            text:       String of characters representing text to search in
+            text_id:    Optional identity of the contents of text, see get_text_digest
+        '''
+        key = (get_engine_name(engine), pat, self.get_text_digest(text, text_id))
+        occ = self.get(key)
+        if occ is None:
+            occ = engine(pat, text)
+            self.put(key, occ)
+        return occ
+
+    def search_file(self, engine, pat, path):
+        '''
+        Returns engine(pat, text) where text is the contents of the file at path. The file is only
+        read on a cache miss.
+        '''
+        key = (get_engine_name(engine), pat, self.get_file_digest(path))
+        occ = self.get(key)
+        if occ is None:
+            with open(path) as f:
+                text = f.read()
+            occ = engine(pat, text)
+            self.put(key, occ)
+        return occ
+
+    def stats(self):
+        '''
+        Returns a dict of cache metrics for sizing the cache.
+        '''
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'nbytes': self.nbytes,
+            'max_bytes': self.max_bytes,
+        }
+
+    def clear(self):
+        '''
+        Drops every in-memory entry. The on-disk tier is left untouched.
+        '''
+        self.entries.clear()
+        self.nbytes = 0
@@ -0,0 +1,94 @@
+'''
+Client for the resident search server (see stringalgos.server). One connection is reused for any
+number of requests, and search_many pipelines a batch of requests over it.
+'''
+import socket
+
+from .server import read_message, write_message
+
+
+class ServerError(Exception):
+    '''
+    Error reported by the server for a single request.
+    '''
+
+
+class SearchClient:
+    '''
+    Connection to a search server listening on the Unix domain socket at path.
+        path:       File system path of the server socket
+        timeout:    Socket timeout in seconds, None to block
+    '''
+    def __init__(self, path, timeout=None):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(path)
+        self.rfile = self.sock.makefile('rb')
+        self.wfile = self.sock.makefile('wb')
+        self.next_id = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        for f in (self.wfile, self.rfile):
+            f.close()
+        self.sock.close()
+
+    def request(self, request):
+        '''
+        Sends one request and returns its reply, raising ServerError if the server reports one.
+        '''
+        return self.request_many([request])[0]
+
+    def request_many(self, requests):
+        '''
+        Sends all requests before reading any reply and returns the replies in request order.
+        Raises ServerError for the first failed request once all replies have been read.
+        '''
+        ids = []
+        for request in requests:
+            request = {**request, 'id': self.next_id}
+            ids.append(self.next_id)
+            self.next_id += 1
+            write_message(self.wfile, request)
+        replies = []
+        for request_id in ids:
+            reply = read_message(self.rfile)
+            if reply is None:
+                raise ConnectionError('server closed the connection')
+            if reply.get('id') != request_id:
+                raise ConnectionError(f'reply {reply.get("id")} does not match request {request_id}')
+            replies.append(reply)
+        for reply in replies:
+            if 'error' in reply:
+                raise ServerError(reply['error'])
+        return replies
+
+    def search(self, pat, reference, engine='bm'):
+        '''
+        Returns the offsets of pat in the named reference text.
+        '''
+        return self.request({'op': 'search', 'reference': reference, 'pattern': pat,
+                             'engine': engine})['offsets']
+
+    def search_many(self, pats, reference, engine='bm'):
+        '''
+        Returns a list with the offsets of every pattern in the named reference text, sending all
+        patterns in one pipelined batch.
+        '''
+        requests = [{'op': 'search', 'reference': reference, 'pattern': pat, 'engine': engine}
+                    for pat in pats]
+        return [reply['offsets'] for reply in self.request_many(requests)]
+
+    def references(self):
+        '''
+        Returns a dict mapping each loaded reference name to its length in bytes.
+        '''
+        return self.request({'op': 'references'})['references']
+
+    def ping(self):
+        return self.request({'op': 'ping'})['pong']
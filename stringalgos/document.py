@@ -0,0 +1,122 @@
+from bisect import bisect_left
+
+from . import boyermoore
+
+
+CHUNK = 512  # maximum number of offsets per chunk of an OffsetSet
+
+
+class OffsetSet:
+    '''
+    Sorted set of text offsets stored as chunks of sorted lists, each with a lazy shift applied to
+    all of its values. Shifting every offset after an edit point only touches the chunk shifts, and
+    removals and insertions only rebuild the chunks around the edit. The C term is the shift update
+    of every chunk after the edit, one Python step per chunk (about 0.5 ms at 5 million offsets),
+    which outgrows the O(B) rebuild beyond about B * B offsets.
+        offsets:    Sorted iterable of initial offsets
+        Time:       O(B + C + log C) per splice
+        Space:      O(occ)
+            where:
+                B = CHUNK
+                C = number of chunks (occ / B)
+    '''
+    def __init__(self, offsets=()):
+        offsets = list(offsets)
+        self.chunks = [offsets[i:i + CHUNK] for i in range(0, len(offsets), CHUNK)]
+        self.shifts = [0] * len(self.chunks)
+
+    def __len__(self):
+        return sum(len(chunk) for chunk in self.chunks)
+
+    def __iter__(self):
+        for chunk, shift in zip(self.chunks, self.shifts):
+            for offset in chunk:
+                yield offset + shift
+
+    def tolist(self):
+        return list(self)
+
+    def splice(self, lo, hi, delta, new_offsets):
+        '''
+        Removes every offset in [lo, hi), adds delta to every offset >= hi and inserts new_offsets,
+        which must be sorted and lie between the offsets kept below lo and the shifted offsets.
+            lo:             First offset removed (inclusive)
+            hi:             End of the removed range (exclusive)
+            delta:          Shift applied to offsets >= hi
+            new_offsets:    Sorted list of offsets to insert
+        '''
+        chunks, shifts = self.chunks, self.shifts
+        # first chunk whose last offset is >= lo
+        first = bisect_left(range(len(chunks)), lo, key=lambda c: chunks[c][-1] + shifts[c])
+        last = first
+        while last < len(chunks) and chunks[last][0] + shifts[last] < hi:
+            last += 1
+        if last == first and first < len(chunks):
+            last += 1  # rebuild the chunk the new offsets are inserted next to
+
+        values = []
+        for c in range(first, last):
+            shift = shifts[c]
+            values.extend(offset + shift for offset in chunks[c])
+        start = bisect_left(values, lo)
+        end = bisect_left(values, hi, start)
+        merged = values[:start] + list(new_offsets) + [offset + delta for offset in values[end:]]
+
+        rebuilt = [merged[i:i + CHUNK] for i in range(0, len(merged), CHUNK)]
+        chunks[first:last] = rebuilt
+        shifts[first:last] = [0] * len(rebuilt)
+        if delta:  # O(C), see the class docstring
+            for c in range(first + len(rebuilt), len(chunks)):
+                shifts[c] += delta
+
+
+class DocumentMatcher:
+    '''
+    Keeps the set of occurrences of a pattern in an editable document up to date. After each edit
+    only the text around the edit is rescanned, offsets after the edit are shifted and matches
+    overlapping the edit are dropped. The document text itself is owned by the caller, who passes
+    the text after each edit so that the window around it can be rescanned.
+        pat:    String of characters representing pattern to search for
+        text:   Initial document text
+        Time:   O(n + m) initially, O(m + e + B + C) per edit
+        Space:  O(m + occ)
+            where:
+                n = |text|
+                m = |pat|
+                e = length of the inserted text
+                B, C = see OffsetSet
+    '''
+    def __init__(self, pat, text):
+        if len(pat) == 0:
+            raise ValueError('pattern must not be empty')
+        self.compiled = boyermoore.compile_pattern(pat)
+        self.length = len(text)
+        self.offsets = OffsetSet(self.compiled.find_all(text))
+
+    def occurrences(self):
+        '''
+        Returns the sorted list of current occurrence offsets.
+        '''
+        return self.offsets.tolist()
+
+    def edit(self, pos, deleted_len, inserted_text, text):
+        '''
+        Updates the occurrences after text[pos:pos + deleted_len] was replaced by inserted_text.
+            pos:            Index of the edit in the text before the edit
+            deleted_len:    Number of characters removed at pos
+            inserted_text:  String of characters inserted at pos
+            text:           Document text after the edit
+        '''
+        inserted_len = len(inserted_text)
+        if pos < 0 or deleted_len < 0 or pos + deleted_len > self.length:
+            raise ValueError('edit out of range')
+        delta = inserted_len - deleted_len
+        if len(text) != self.length + delta:
+            raise ValueError('text length does not match the edit')
+        self.length = len(text)
+
+        m = len(self.compiled.pat)
+        lo = max(0, pos - m + 1)
+        window = text[lo:pos + inserted_len + m - 1]
+        found = [lo + i for i in self.compiled.find_all(window)]
+        self.offsets.splice(lo, pos + deleted_len, delta, found)
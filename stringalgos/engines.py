@@ -0,0 +1,89 @@
+import importlib
+
+
+ENGINES = {
+    # name: (submodule, attribute, kind)
+    #   kind 'compile':  attribute compiles a pattern into an object with find_all(text)
+    #   kind 'search':   attribute is a function search(pat, text)
+    #   kind 'multi':    attribute is a function search(pats, text) returning {pat: offsets}
+    'bm': ('boyermoore', 'compile_pattern', 'compile'),
+    'kmp': ('kmp', 'compile_pattern', 'compile'),
+    'mirrored-bm': ('mirrored_boyermoore', 'compile_pattern', 'compile'),
+    'modified-kmp': ('modified_kmp', 'compile_pattern', 'compile'),
+    'wildcard': ('wildcard_matching', 'compile_pattern', 'compile'),
+    'twoway': ('twoway', 'compile_pattern', 'compile'),
+    'rare': ('prefilter', 'find_all_rare', 'search'),
+    'numpy': ('npsearch', 'find_all_numpy', 'search'),
+    'rabinkarp': ('rabinkarp', 'find_all_multi', 'multi'),
+}
+BINARY_ENGINES = {'numpy'}  # engines searching bytes instead of str
+
+
+class SearchPattern:
+    '''
+    Adapts a search(pat, text) function to the compiled pattern interface.
+    '''
+    def __init__(self, search, pat):
+        self.search = search
+        self.pat = pat
+
+    @property
+    def nbytes(self):
+        return {}  # search functions preprocess the pattern on every call
+
+    def find_all(self, text, start=0, end=None):
+        if start == 0 and end is None:
+            return self.search(self.pat, text)
+        start, end, _ = slice(start, end).indices(len(text))
+        return [start + offset for offset in self.search(self.pat, text[start:end])]
+
+
+def get_engine(name):
+    '''
+    Returns (function, kind) for the engine registered under name, importing only its submodule.
+        name:   Key of ENGINES
+    '''
+    try:
+        module_name, attribute, kind = ENGINES[name]
+    except KeyError:
+        raise ValueError(f'unknown engine {name!r}, expected one of {", ".join(ENGINES)}') from None
+    module = importlib.import_module(f'.{module_name}', __package__)
+    return getattr(module, attribute), kind
+
+
+def get_compiler(name):
+    '''
+    Returns a function compiling a pattern into an object with a find_all(text) method for the
+    engine registered under name. Not available for 'multi' engines.
+    '''
+    function, kind = get_engine(name)
+    if kind == 'compile':
+        return function
+    if kind == 'search':
+        return lambda pat: SearchPattern(function, pat)
+    raise ValueError(f'engine {name!r} searches many patterns at once and cannot compile one')
+
+
+def find_all_regions(pattern, text, regions):
+    '''
+    Searches every (start, end) region of text with one compiled pattern and returns a list with
+    the offsets found in each region. The 'compile' engines scan each region in place, 'search'
+    engines are given a slice. Offsets are relative to text and only occurrences lying entirely
+    inside a region are reported for it.
+        pattern:    Compiled pattern whose find_all accepts start and end, e.g. from get_compiler
+        text:       String of characters representing text to search in
+        regions:    Sequence of (start, end) pairs sorted by start, e.g. gene annotations
+        Time:       O(sum(engine time over each region))
+        Space:      O(occ)
+            where:
+                occ = total number of offsets returned
+    '''
+    result = []
+    previous = None
+    find_all = pattern.find_all
+    for start, end in regions:
+        if previous is not None and start < previous:
+            raise ValueError('regions must be sorted by start')
+        previous = start
+        result.append(find_all(text, start, end))
+    return result
@@ -0,0 +1,90 @@
+from .memory import deep_sizeof
+
+
+CASE_FOLD = {chr(i): chr(i).lower() for i in range(256)}  # ASCII and Latin-1 case insensitivity
+DNA_SOFT_MASK_FOLD = {c: c.upper() for c in 'acgtn'}  # soft-masked (lowercase) bases as uppercase
+FOLDS = {
+    'case': CASE_FOLD,
+    'dna': DNA_SOFT_MASK_FOLD,
+}
+
+
+def get_fold_map(fold):
+    '''
+    Returns a 256-entry list mapping each character code below 256 to its folded character.
+        fold:   Name of a predefined folding in FOLDS, or a dict mapping characters to characters
+        Time:   O(|fold|)
+        Space:  O(1)
+    '''
+    if isinstance(fold, str):
+        try:
+            fold = FOLDS[fold]
+        except KeyError:
+            raise ValueError(f'unknown folding {fold!r}') from None
+    fold_map = [chr(i) for i in range(256)]
+    for char, folded in fold.items():
+        if len(char) != 1 or ord(char) >= 256:
+            raise ValueError(f'cannot fold {char!r}, only characters below U+0100 are supported')
+        fold_map[ord(char)] = folded
+    return fold_map
+
+
+def fold_string(string, fold_map):
+    '''
+    Returns string with every character folded through fold_map. Intended for patterns, texts
+    should be wrapped in a FoldedText instead.
+    '''
+    return ''.join(fold_map[ord(c)] if ord(c) < 256 else c for c in string)
+
+
+class FoldedText:
+    '''
+    Read-only view of a text which folds each character through a fold map as it is indexed. The
+    underlying text is never copied; slicing copies (and folds) only the requested slice.
+        text:       String of characters
+        fold_map:   256-entry list as returned by get_fold_map
+    '''
+    def __init__(self, text, fold_map):
+        self.text = text
+        self.fold_map = fold_map
+
+    def __len__(self):
+        return len(self.text)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return fold_string(self.text[index], self.fold_map)
+        c = self.text[index]
+        o = ord(c)
+        return self.fold_map[o] if o < 256 else c
+
+    def __iter__(self):
+        fold_map = self.fold_map
+        for c in self.text:
+            o = ord(c)
+            yield fold_map[o] if o < 256 else c
+
+
+class FoldedPattern:
+    '''
+    Wraps a compiled pattern of any engine so that matching is performed over folded symbols. The
+    engine's tables are built over the folded pattern and texts are wrapped in a FoldedText.
+        compile:    Function compiling a pattern into an object with a find_all(text) method
+        pat:        String of characters representing pattern to search for
+        fold:       Name of a predefined folding in FOLDS, or a dict mapping characters to characters
+    '''
+    def __init__(self, compile, pat, fold):
+        self.fold_map = get_fold_map(fold)
+        self.pat = pat
+        self.compiled = compile(fold_string(pat, self.fold_map))
+
+    @property
+    def nbytes(self):
+        '''
+        Returns the wrapped pattern's tables (see its nbytes) and the fold map, mapped to their
+        sizes in bytes.
+        '''
+        return {**getattr(self.compiled, 'nbytes', {}), 'fold_map': deep_sizeof(self.fold_map)}
+
+    def find_all(self, text, start=0, end=None):
+        return self.compiled.find_all(FoldedText(text, self.fold_map), start, end)
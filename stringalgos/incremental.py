@@ -0,0 +1,80 @@
+from . import boyermoore, kmp
+
+
+class IncrementalKMP:
+    '''
+    Searches an append-only text (e.g. a growing log file) with the KMP automaton. The matcher state
+    (number of pattern characters matched so far) is kept between calls to feed, so each appended
+    chunk is scanned exactly once and only new matches are reported.
+        pat:    String of characters representing pattern to search for
+        Time:   O(m) preprocessing, O(c) amortised per chunk
+        Space:  O(m)
+            where:
+                m = |pat|
+                c = length of the appended chunk
+    '''
+    def __init__(self, pat):
+        if len(pat) == 0:
+            raise ValueError('pattern must not be empty')
+        self.pat = pat
+        self.sp = kmp.get_sp(pat)
+        self.position = 0  # number of text characters consumed so far
+        self.state = 0  # number of pattern characters matched at position
+
+    def feed(self, chunk):
+        '''
+        Consumes the next chunk of text and returns the offsets (relative to the start of the whole
+        text) of matches ending inside chunk.
+            chunk:  String of characters appended to the text
+        '''
+        pat = self.pat
+        sp = self.sp
+        m = len(pat)
+        q = self.state
+        base = self.position - m + 1
+        occ = []
+        for index, char in enumerate(chunk):
+            while q > 0 and pat[q] != char:
+                q = sp[q - 1]
+            if pat[q] == char:
+                q += 1
+                if q == m:
+                    occ.append(base + index)
+                    q = sp[m - 1]
+        self.state = q
+        self.position += len(chunk)
+        return occ
+
+
+class IncrementalBoyerMoore:
+    '''
+    Searches an append-only text with Boyer Moore. The last m - 1 characters seen are kept so that
+    matches spanning chunk borders are found; each call to feed scans only those characters and the
+    appended chunk, and reports only new matches.
+        pat:    String of characters representing pattern to search for
+        Time:   O(m) preprocessing, O(c + m) per chunk
+        Space:  O(m)
+            where:
+                m = |pat|
+                c = length of the appended chunk
+    '''
+    def __init__(self, pat):
+        if len(pat) == 0:
+            raise ValueError('pattern must not be empty')
+        self.compiled = boyermoore.compile_pattern(pat)
+        self.position = 0  # number of text characters consumed so far
+        self.tail = ''  # last m - 1 characters consumed
+
+    def feed(self, chunk):
+        '''
+        Consumes the next chunk of text and returns the offsets (relative to the start of the whole
+        text) of matches ending inside chunk.
+            chunk:  String of characters appended to the text
+        '''
+        window = self.tail + chunk
+        base = self.position - len(self.tail)
+        occ = [base + i for i in self.compiled.find_all(window)]
+        keep = len(self.compiled.pat) - 1
+        self.tail = window[-keep:] if keep > 0 else ''
+        self.position += len(chunk)
+        return occ
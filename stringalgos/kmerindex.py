@@ -0,0 +1,204 @@
+'''
+k-mer (q-gram) index over a fixed reference text for wildcard queries.
+'''
+from array import array
+from itertools import accumulate, chain
+from operator import sub
+import json
+import os
+import struct
+
+from .cache import digest_text
+from .wildcard_matching import find_all as scan_wildcard, get_sections, is_extended
+
+
+K = 8  # default k-mer length
+VERIFY_RATIO = 8  # stop intersecting once the next posting list is this many times the candidates
+MAGIC = b'SAKMER1\n'  # file signature, followed by a 4 byte big-endian header length
+HEADER = struct.Struct('>I')
+
+
+def encode_postings(positions):
+    '''
+    Returns the ascending positions delta-encoded in the narrowest unsigned typed array able to hold
+    the largest gap ('H', 'I' or 'Q').
+        positions:  Ascending sequence of positions
+        Time:       O(p)
+        Space:      O(p)
+            where:
+                p = len(positions)
+    '''
+    deltas = list(map(sub, positions, chain((0,), positions)))
+    largest = max(deltas, default=0)
+    typecode = 'H' if largest < 1 << 16 else 'I' if largest < 1 << 32 else 'Q'
+    return array(typecode, deltas)
+
+
+def decode_postings(deltas):
+    '''
+    Returns the list of positions encoded by encode_postings.
+    '''
+    return list(accumulate(deltas))
+
+
+def get_solid_sections(pat):
+    '''
+    Returns a list of (offset, section) pairs for the non-empty runs of non-wildcard characters of a
+    plain '?' pattern, offset being the index of the section within pat.
+        pat:    String of characters, '?' denoting a wildcard
+        Time:   O(m)
+        Space:  O(m)
+            where:
+                m = |pat|
+    '''
+    solid = []
+    offset = 0
+    for wildcards, section in get_sections(pat):
+        if section:
+            solid.append((offset, ''.join(section)))
+        offset += len(section) + wildcards
+    return solid
+
+
+class KmerIndex:
+    '''
+    Index of every k-mer of text mapped to the delta-encoded list of its starting positions. Wildcard
+    queries with a solid section of at least k characters are answered by intersecting the posting
+    lists of their k-mers, rarest first, and verifying the surviving candidates against the text.
+    Other queries fall back to a scan with wildcard_matching.find_all.
+        text:   String of characters representing the reference text
+        k:      Length of the indexed k-mers
+        Time:   O(n)
+        Space:  O(n) (about n * typecode size bytes of postings)
+            where:
+                n = |text|
+    '''
+    def __init__(self, text, k=K, postings=None):
+        if k < 1:
+            raise ValueError('k must be positive')
+        self.text = text
+        self.k = k
+        self.postings = self.build(text, k) if postings is None else postings
+
+    @staticmethod
+    def build(text, k):
+        '''
+        Returns a dict mapping every k-mer of text to its encoded posting list.
+        '''
+        positions = {}
+        typecode = 'I' if len(text) < 1 << 32 else 'Q'
+        for i in range(len(text) - k + 1):
+            kmer = text[i:i + k]
+            found = positions.get(kmer)
+            if found is None:
+                positions[kmer] = found = array(typecode)
+            found.append(i)
+        return {kmer: encode_postings(found) for kmer, found in positions.items()}
+
+    def count(self, kmer):
+        '''
+        Returns the number of occurrences of kmer (a string of length k) in the text.
+        '''
+        deltas = self.postings.get(kmer)
+        return 0 if deltas is None else len(deltas)
+
+    def get_positions(self, kmer):
+        '''
+        Returns the ascending list of starting positions of kmer in the text.
+        '''
+        return decode_postings(self.postings.get(kmer, ()))
+
+    def get_candidates(self, solid):
+        '''
+        Returns the set of pattern start positions consistent with the posting lists of the k-mers
+        of every solid section at least k long, or None if no section is long enough. Lists are
+        intersected from the rarest; intersection stops once decoding the next list would cost more
+        than verifying the candidates left.
+            solid:  List of (offset, section) pairs from get_solid_sections
+        '''
+        k = self.k
+        kmers = [(self.count(section[i:i + k]), offset + i, section[i:i + k])
+                 for offset, section in solid if len(section) >= k
+                 for i in range(len(section) - k + 1)]
+        if not kmers:
+            return None
+        kmers.sort()
+        candidates = None
+        for count, offset, kmer in kmers:
+            if candidates is not None and count > VERIFY_RATIO * len(candidates):
+                break
+            starts = {position - offset for position in self.get_positions(kmer)}
+            candidates = starts if candidates is None else candidates & starts
+            if not candidates:
+                break
+        return candidates
+
+    def find_all(self, pat):
+        '''
+        Returns a list of starting indices of all occurrences of pat in the text, with the same
+        semantics as wildcard_matching.find_all(pat, text).
+            pat:    String of characters representing pattern to search for
+            Time:   O(p + c * m) if pat has a solid section of at least k characters, otherwise
+                    the time of wildcard_matching.find_all
+            Space:  O(p)
+                where:
+                    p = total length of the posting lists decoded
+                    c = number of candidates verified
+                    m = |pat|
+        '''
+        text = self.text
+        if len(pat) == 0 or is_extended(pat):
+            return scan_wildcard(pat, text)
+        solid = get_solid_sections(pat)
+        candidates = self.get_candidates(solid)
+        if candidates is None:
+            return scan_wildcard(pat, text)
+
+        last = len(text) - len(pat)
+        startswith = text.startswith
+        return [j for j in sorted(candidates)
+                if 0 <= j <= last and all(startswith(section, j + offset)
+                                          for offset, section in solid)]
+
+    def save(self, path):
+        '''
+        Writes the index to path: a signature, a length-prefixed JSON header with k, the text length
+        and digest and the layout of every posting list, then the raw posting arrays.
+        '''
+        layout = [[kmer, deltas.typecode, len(deltas)] for kmer, deltas in self.postings.items()]
+        header = json.dumps({'k': self.k, 'n': len(self.text), 'digest': digest_text(self.text),
+                             'postings': layout}).encode()
+        with open(path + '.tmp', 'wb') as f:
+            f.write(MAGIC + HEADER.pack(len(header)) + header)
+            for deltas in self.postings.values():
+                deltas.tofile(f)
+        os.replace(path + '.tmp', path)
+
+    @classmethod
+    def load(cls, path, text):
+        '''
+        Reads an index written by save. Raises ValueError if the file is not an index or if it was
+        built from a different text.
+            path:   Index file path
+            text:   The reference text the index was built from
+        '''
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f'{path} is not a k-mer index')
+            length, = HEADER.unpack(f.read(HEADER.size))
+            header = json.loads(f.read(length))
+            if header['n'] != len(text) or header['digest'] != digest_text(text):
+                raise ValueError(f'{path} was built from a different text')
+            postings = {}
+            for kmer, typecode, count in header['postings']:
+                deltas = array(typecode)
+                deltas.fromfile(f, count)
+                postings[kmer] = deltas
+        return cls(text, header['k'], postings)
+
+
+def build_index(text, k=K):
+    '''
+    Returns a KmerIndex over text.
+    '''
+    return KmerIndex(text, k)
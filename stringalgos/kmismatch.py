@@ -0,0 +1,157 @@
+import sys
+
+from .lce import get_pair_lce
+from .zalgo import z_algo
+
+
+WINDOW = 1 << 16  # number of alignments handled per windowed concatenation
+PROBE = 8  # characters compared directly before a 'z-hash' jump falls back to an LCE query
+
+
+def get_first_mismatch(pat, text, start, end):
+    '''
+    Returns the Z values of pat against every alignment in text[start:end] by running the Z-algorithm
+    on the windowed concatenation pat $ text[start:end + m - 1]. The value at index i is the length of
+    the longest common extension of pat and text[start + i:].
+        pat:    String of characters representing the pattern
+        text:   String of characters representing the text
+        start:  First alignment of the window (inclusive)
+        end:    Last alignment of the window (exclusive)
+        Time:   O(w + m)
+        Space:  O(w + m)
+            where:
+                w = end - start
+                m = |pat|
+    '''
+    m = len(pat)
+    window = list(pat)
+    window.append(None)  # separator, never equal to a character
+    window.extend(text[start:end + m - 1])
+    return z_algo(window)[m + 1:m + 1 + end - start]
+
+
+BACKENDS = ('z-hash', 'z', 'sa', 'hash')
+
+
+def find_all_k_mismatches(pat, text, k, backend='z-hash', start=0, end=None):
+    '''
+    Returns a list of (index, mismatches) pairs for every alignment of pat in text with at most k
+    mismatching characters (Hamming distance). Each alignment is checked with 'kangaroo' jumps: a
+    longest common extension query skips the matching run, the mismatch is counted and the search
+    continues until k + 1 mismatches are found or pat is exhausted.
+    The 'z-hash' backend (default) answers the first jump of every alignment with Z-algorithm runs
+    over windowed concatenations of pat and text, and every later jump by comparing up to PROBE
+    characters directly and then in O(log m) with prefix hashes over pat $ text (lce.HashLCE),
+    built only when k > 0. The 'z' backend extends the later
+    jumps by direct comparison instead: it avoids building the hashes but is O(nm) in the worst
+    case, e.g. pat = 'b' + 'a' * (m - 1) in text = 'a' * n. The 'sa' backend answers every jump in
+    O(1) using a suffix array over pat $ text, whose construction is slow in pure Python. The
+    'hash' backend answers every jump, the first included, with prefix hashes.
+        pat:        String of characters representing pattern to search for
+        text:       String of characters representing text to search in
+        k:          Maximum number of mismatches allowed
+        backend:    One of BACKENDS
+        start:      Start of the searched window of text, indices stay relative to text
+        end:        End of the searched window of text (exclusive)
+        Time:       O(nk) with the 'sa' backend, O(nk log m) with the 'z-hash' and 'hash'
+                    backends, O(n + occ * m) with the 'z' backend, i.e. O(nm) in the worst case
+        Space:      O(w + m) with the 'z' backend, O(n + m) with the 'z-hash' and 'hash'
+                    backends, O((n + m) log (n + m)) with the 'sa' backend
+            where:
+                n = |text|
+                m = |pat|
+                w = window size
+                occ = number of alignments reaching their second jump
+    '''
+    if k < 0:
+        raise ValueError('k must be non-negative')
+    if backend not in BACKENDS:
+        raise ValueError(f'unknown backend {backend!r}')
+    if start != 0 or end is not None:  # the LCE structures are built over the window only
+        start, end, _ = slice(start, end).indices(len(text))
+        return [(start + j, mismatches)
+                for j, mismatches in find_all_k_mismatches(pat, text[start:end], k, backend)]
+
+    m = len(pat)
+    n = len(text)
+    if m == 0:
+        return [(0, 0)]
+    if m > n:
+        return []
+
+    occ = []
+    if backend in ('sa', 'hash'):
+        lce = get_pair_lce(pat, text, backend)
+        for j in range(n - m + 1):
+            p = lce(0, j)
+            mismatches = 0
+            while p < m:
+                mismatches += 1
+                if mismatches > k:
+                    break
+                p += 1
+                if p < m:
+                    p += lce(p, j + p)
+            else:
+                occ.append((j, mismatches))
+        return occ
+
+    lce = get_pair_lce(pat, text, 'hash') if backend == 'z-hash' and k > 0 else None
+    for start in range(0, n - m + 1, WINDOW):
+        end = min(start + WINDOW, n - m + 1)
+        first = get_first_mismatch(pat, text, start, end)
+        for offset, p in enumerate(first):
+            j = start + offset
+            mismatches = 0
+            while p < m:
+                mismatches += 1
+                if mismatches > k:
+                    break
+                p += 1
+                if lce is not None:  # short runs are cheaper to compare than to query
+                    stop = min(p + PROBE, m)
+                    while p < stop and pat[p] == text[j + p]:
+                        p += 1
+                    if p == stop and p < m:
+                        p += lce(p, j + p)
+                    continue
+                while p < m and pat[p] == text[j + p]:  # extend explicitly to the next mismatch
+                    p += 1
+            else:
+                occ.append((j, mismatches))
+    return occ
+
+
+class CompiledPattern:
+    '''
+    Pattern searched with at most k mismatches, with the compiled pattern interface used by
+    engines.find_all_regions and budget.find_all_budgeted. find_all returns (index, mismatches)
+    pairs, see find_all_k_mismatches.
+        pat:        String of characters representing pattern to search for
+        k:          Maximum number of mismatches allowed
+        backend:    One of BACKENDS
+    '''
+    def __init__(self, pat, k, backend='z-hash'):
+        self.pat = pat
+        self.k = k
+        self.backend = backend
+
+    def find_all(self, text, start=0, end=None):
+        return find_all_k_mismatches(self.pat, text, self.k, self.backend, start, end)
+
+
+def compile_pattern(pat, k, backend='z-hash'):
+    return CompiledPattern(pat, k, backend)
+
+
+if __name__ == '__main__':
+    text_file, pat_file, k = sys.argv[1:]
+
+    with open(text_file) as f:
+        text = f.read()
+
+    with open(pat_file) as f:
+        pat = f.read()
+
+    for index, mismatches in find_all_k_mismatches(pat, text, int(k)):
+        print(index, mismatches)
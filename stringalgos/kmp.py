@@ -0,0 +1,115 @@
+from .folding import FoldedPattern
+from .memory import get_table_nbytes
+from .zalgo import z_algo
+
+
+ALPHABET = [chr(i) for i in range(128)]  # all ascii characters
+
+
+def get_sp(pat):
+    '''
+    Returns the sp lookup table to be used in the KMP algorithm, derived from the Z-array of pat.
+    sp[i] is the length of the longest proper suffix of pat[:i + 1] which is also a prefix of pat.
+        pat:    String of characters to generate lookup table for.
+        Time:   O(m)
+        Space:  O(m)
+            where:
+            m = length of 'pat'
+    '''
+    m = len(pat)
+    sp = [0 for _ in range(m + 1)]
+    sp[-1] = -1
+    z_array = z_algo(pat)
+    for j in range(m - 1, 0, -1):
+        i = j + z_array[j] - 1
+        sp[i] = z_array[j]
+    return sp
+
+
+class CompiledPattern:
+    '''
+    Preprocessed KMP table for a single pattern. Compiling once and calling find_all on many texts
+    avoids rebuilding the table for every search.
+        pat:    String of characters representing pattern to search for.
+    '''
+    TABLES = ('sp',)
+
+    def __init__(self, pat):
+        self.pat = pat
+        self.sp = get_sp(pat)
+
+    @property
+    def nbytes(self):
+        '''
+        Returns a dict mapping each preprocessing table built so far to its size in bytes.
+        '''
+        return get_table_nbytes(self, self.TABLES)
+
+    def find_all(self, text, start=0, end=None):
+        '''
+        Finds the starting index of all occurrences of the pattern in text[start:end], without
+        copying the window. Offsets are relative to text.
+            text:   String of characters representing text to search in.
+            start:  Start of the window, interpreted like a slice index.
+            end:    End of the window (exclusive), interpreted like a slice index.
+        '''
+        start, end, _ = slice(start, end).indices(len(text))
+        pat = self.pat
+        if len(pat) == 0:
+            return [start]
+
+        n = end
+        m = len(pat)
+        sp = self.sp
+
+        i = start  # denotes start of pattern
+        j = start + m  # denotes end of pattern
+        k = 0
+        occ = []
+        while j <= n:  # compare chars left to right
+            if k >= m:  # full match found
+                occ.append(i)
+                shift = k - sp[-2]
+                k -= shift + 1
+            elif pat[k] != text[i + k]:
+                shift = k - sp[k - 1]
+                if k > 0:
+                    k -= shift
+            else:
+                k += 1
+                continue
+            i += shift
+            j += shift
+
+        return occ
+
+
+def compile_pattern(pat, fold=None):
+    '''
+    Returns a CompiledPattern holding the KMP table for pat. If fold is given, the table is built
+    over the folded pattern and text characters are folded as they are scanned.
+    '''
+    if fold is not None:
+        return FoldedPattern(CompiledPattern, pat, fold)
+    return CompiledPattern(pat)
+
+
+def kmp(pat, text, fold=None, start=0, end=None):
+    return compile_pattern(pat, fold).find_all(text, start, end)
+
+
+if __name__ == '__main__':
+    # text_file, pat_file = sys.argv[1:]
+    text_file, pat_file = './29352258/q3/txt1.txt', './29352258/q3/pat1.txt'
+
+    with open(text_file) as f:
+        text = f.read()
+    
+    with open(pat_file) as f:
+        pat = f.read()
+
+    print('Text:', text)
+    print('Pat: ', pat)
+
+    # BM to find all occurrances of pat in text
+    print(kmp(pat, text))
@@ -0,0 +1,225 @@
+import random
+from array import array
+
+
+MOD = (1 << 61) - 1  # Mersenne prime modulus for polynomial hashing
+
+
+def get_codes(string):
+    '''
+    Returns the given string as a typed array of integer codes. Codes are shifted up by one so that 0
+    can be used as a separator which compares smaller than every character.
+        string: String of characters, or iterable of non-negative integers
+        Time:   O(n)
+        Space:  O(n)
+            where:
+                n = |string|
+    '''
+    if isinstance(string, str):
+        return array('l', [ord(c) + 1 for c in string])
+    return array('l', [c + 1 for c in string])
+
+
+def get_pair_codes(pat, text):
+    '''
+    Returns the codes of pat $ text, where $ is a separator which does not occur in either string.
+    Pattern index p maps to p and text index t maps to len(pat) + 1 + t.
+        pat:    String of characters representing the pattern
+        text:   String of characters representing the text
+        Time:   O(n + m)
+        Space:  O(n + m)
+            where:
+                n = |text|
+                m = |pat|
+    '''
+    codes = get_codes(pat)
+    codes.append(0)
+    codes.extend(get_codes(text))
+    return codes
+
+
+def get_suffix_array(codes):
+    '''
+    Returns the suffix array of the given codes using prefix doubling.
+        codes:  Typed array of non-negative integer codes
+        Time:   O(n log^2 n)
+        Space:  O(n)
+            where:
+                n = |codes|
+    '''
+    n = len(codes)
+    sa = array('l', range(n))
+    if n == 0:
+        return sa
+    rank = array('l', codes)
+    step = 1
+    while True:
+        width = max(rank) + 2
+        key = [rank[i] * width + (rank[i + step] + 1 if i + step < n else 0) for i in range(n)]
+        sa = array('l', sorted(sa, key=key.__getitem__))
+        new_rank = array('l', bytes(n * rank.itemsize))
+        for index in range(1, n):
+            new_rank[sa[index]] = new_rank[sa[index - 1]] + (key[sa[index]] != key[sa[index - 1]])
+        rank = new_rank
+        if rank[sa[-1]] == n - 1:
+            return sa
+        step *= 2
+
+
+def get_lcp(codes, sa):
+    '''
+    Returns (rank, lcp) for the given suffix array using Kasai's algorithm, where lcp[r] is the
+    length of the longest common prefix of the suffixes at sa[r - 1] and sa[r].
+        codes:  Typed array the suffix array was built over
+        sa:     Suffix array of codes
+        Time:   O(n)
+        Space:  O(n)
+            where:
+                n = |codes|
+    '''
+    n = len(codes)
+    rank = array('l', bytes(n * sa.itemsize))
+    for index, suffix in enumerate(sa):
+        rank[suffix] = index
+    lcp = array('l', bytes(n * sa.itemsize))
+    h = 0
+    for i in range(n):
+        if rank[i] > 0:
+            j = sa[rank[i] - 1]
+            while i + h < n and j + h < n and codes[i + h] == codes[j + h]:
+                h += 1
+            lcp[rank[i]] = h
+            if h > 0:
+                h -= 1
+        else:
+            h = 0
+    return rank, lcp
+
+
+def get_sparse_table(values):
+    '''
+    Returns a sparse table over values for range minimum queries. Row r holds the minimum of every
+    window of length 2^r.
+        values: Typed array of integers
+        Time:   O(n log n)
+        Space:  O(n log n)
+            where:
+                n = |values|
+    '''
+    table = [values]
+    length = 1
+    while 2 * length <= len(values):
+        prev = table[-1]
+        table.append(array(values.typecode, map(min, prev[:-length], prev[length:])))
+        length *= 2
+    return table
+
+
+class SuffixArrayLCE:
+    '''
+    Longest common extension structure answering lce(i, j) in O(1) from a suffix array, LCP array
+    and sparse table stored in typed arrays.
+        Time:   O(n log^2 n) construction, O(1) per query
+        Space:  O(n log n)
+            where:
+                n = |string|
+    '''
+    def __init__(self, string):
+        self.codes = string if isinstance(string, array) else get_codes(string)
+        self.sa = get_suffix_array(self.codes)
+        self.rank, self.lcp = get_lcp(self.codes, self.sa)
+        self.table = get_sparse_table(self.lcp)
+
+    def lce(self, i, j):
+        '''
+        Returns the length of the longest common prefix of string[i:] and string[j:].
+        '''
+        n = len(self.codes)
+        if i == j:
+            return n - i
+        if i >= n or j >= n:
+            return 0
+        lo, hi = self.rank[i], self.rank[j]
+        if lo > hi:
+            lo, hi = hi, lo
+        row = (hi - lo).bit_length() - 1
+        values = self.table[row]
+        a, b = values[lo + 1], values[hi - (1 << row) + 1]
+        return a if a < b else b
+
+
+class HashLCE:
+    '''
+    Longest common extension structure answering lce(i, j) by binary searching over prefix hashes
+    of a polynomial rolling hash. Uses far less memory than SuffixArrayLCE at the cost of O(log n)
+    queries, and answers are correct with high probability.
+        Time:   O(n) construction, O(log n) per query
+        Space:  O(n)
+            where:
+                n = |string|
+    '''
+    def __init__(self, string, base=None):
+        self.codes = string if isinstance(string, array) else get_codes(string)
+        self.base = base if base is not None else random.randrange(256, MOD - 1)
+        n = len(self.codes)
+        prefix = array('Q', bytes((n + 1) * 8))
+        power = array('Q', bytes((n + 1) * 8))
+        power[0] = 1
+        h = 0
+        p = 1
+        for index, code in enumerate(self.codes):
+            h = (h * self.base + code) % MOD
+            p = p * self.base % MOD
+            prefix[index + 1] = h
+            power[index + 1] = p
+        self.prefix = prefix
+        self.power = power
+
+    def get_hash(self, i, length):
+        '''
+        Returns the hash of string[i:i + length].
+        '''
+        return (self.prefix[i + length] - self.prefix[i] * self.power[length]) % MOD
+
+    def lce(self, i, j):
+        '''
+        Returns the length of the longest common prefix of string[i:] and string[j:].
+        '''
+        n = len(self.codes)
+        hi = n - max(i, j)
+        if i == j:
+            return n - i
+        if hi <= 0 or self.codes[i] != self.codes[j]:
+            return 0
+        lo = 1  # string[i:i + lo] == string[j:j + lo] holds throughout
+        prefix, power = self.prefix, self.power
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if (prefix[i + mid] - prefix[i] * power[mid]) % MOD == \
+                    (prefix[j + mid] - prefix[j] * power[mid]) % MOD:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+
+def get_pair_lce(pat, text, backend='sa'):
+    '''
+    Returns a function lce(p, t) answering the longest common extension of pat[p:] and text[t:]
+    using an LCE structure built over pat $ text.
+        pat:        String of characters representing the pattern
+        text:       String of characters representing the text
+        backend:    'sa' for SuffixArrayLCE or 'hash' for HashLCE
+    '''
+    if backend == 'sa':
+        structure = SuffixArrayLCE(get_pair_codes(pat, text))
+    elif backend == 'hash':
+        structure = HashLCE(get_pair_codes(pat, text))
+    else:
+        raise ValueError(f'unknown backend {backend!r}')
+    offset = len(pat) + 1
+    lce = structure.lce
+
+    def pair_lce(p, t):
+        return lce(p, offset + t)
+    return pair_lce
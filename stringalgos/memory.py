@@ -0,0 +1,89 @@
+'''
+Memory accounting for compiled patterns and tracemalloc-based profiling of search phases.
+'''
+from array import array
+import sys
+import tracemalloc
+
+
+PHASES = ('preprocessing', 'scan', 'results')
+
+
+def deep_sizeof(obj, seen=None):
+    '''
+    Returns the number of bytes used by obj and every list, tuple, dict, set, array, string and
+    number reachable from it. Objects shared within obj (e.g. cached small integers or repeated rows)
+    are counted once.
+        obj:    Object to measure
+        seen:   Set of ids already counted, shared across calls to measure several objects together
+    '''
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(key, seen) + deep_sizeof(value, seen)
+                    for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif not isinstance(obj, (str, bytes, bytearray, array, int, float, type(None))):
+        size += sum(deep_sizeof(value, seen) for value in getattr(obj, '__dict__', {}).values())
+    return size
+
+
+def get_table_nbytes(pattern, tables):
+    '''
+    Returns a dict mapping each preprocessing table of a compiled pattern to its size in bytes, see
+    deep_sizeof. Tables that are lazily built and not built yet, or not used by this pattern
+    (None), are left out, so the result reflects what the pattern actually holds.
+        pattern:    Compiled pattern
+        tables:     Names of the table attributes
+    '''
+    attributes = vars(pattern)
+    return {name: deep_sizeof(attributes[name]) for name in tables
+            if attributes.get(name) is not None}
+
+
+def profile_memory(compile, pat, text):
+    '''
+    Returns a dict with the peak number of bytes allocated in each phase of a search, measured with
+    tracemalloc, and the size of the compiled tables:
+        preprocessing   compile(pat)
+        scan            find_all(text), including scan state such as z_algo_special's z_final
+                        and search_string, and the list of offsets
+        results         rendering the offsets as one line of text, as the command line does
+        tables          sum of the compiled pattern's nbytes, if it reports them
+    Tracing is started and stopped around the measurement unless it is already running.
+        compile:    Function compiling pat into an object with a find_all(text) method
+        pat:        Pattern to search for
+        text:       Text to search in
+    '''
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        peaks = {}
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        pattern = compile(pat)
+        current, peak = tracemalloc.get_traced_memory()
+        peaks['preprocessing'] = peak - base
+
+        tracemalloc.reset_peak()
+        base = current
+        occ = pattern.find_all(text)
+        current, peak = tracemalloc.get_traced_memory()
+        peaks['scan'] = peak - base
+
+        tracemalloc.reset_peak()
+        base = current
+        line = ' '.join(map(str, occ))
+        peaks['results'] = tracemalloc.get_traced_memory()[1] - base
+        del line
+    finally:
+        if started:
+            tracemalloc.stop()
+    peaks['tables'] = sum(getattr(pattern, 'nbytes', {}).values())
+    return peaks
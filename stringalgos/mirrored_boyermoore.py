@@ -0,0 +1,225 @@
+# Ho Yi Ping
+# This file contains the code for question 1 (Mirrored Boyermoore). Run the
+# module from command line via: python -m stringalgos.mirrored_boyermoore <text_file> <pattern_file> This
+# program will write its output to a file named 'output_mirrored_boyermoore.txt' in the current
+# working directory.
+
+
+import sys
+
+from .folding import FoldedPattern
+from .memory import get_table_nbytes
+from .zalgo import z_algo
+
+
+ALPHABET = [chr(i) for i in range(128)]  # all ascii characters
+
+
+def get_bad_char_lookup(pat):
+    '''
+    Returns 2D lookup table to be used in the 'bad character' rule of the mirrored Boyer Moore
+    algorithm. Looking up a pattern shift will never return a value less than 1 given the lookup
+    character is not the same as the character in the pattern at that position (in which case there
+    should not be shifting anyway).
+        pat:        String of letters representing the pattern to be used in lookup table 
+                    generation.
+        Time: O(m)
+        Space: O(m)
+            where:
+            m = length of 'pat'
+    '''
+    size = max([len(ALPHABET)] + [ord(char) + 1 for char in pat])  # rows for non-ascii pattern chars
+    lookup_table = [None for _ in range(size)]
+    for index, char in enumerate(reversed(pat)):
+        for i in range(len(lookup_table)):
+            row = lookup_table[i]
+            if i == ord(char):
+                if row is None:
+                    lookup_table[i] = [len(pat) for _ in range(len(pat))]
+                lookup_table[i][- index - 1] = len(pat) - index - 1
+            elif row is not None:
+                lookup_table[i][- index - 1] = row[- index]
+    return lookup_table
+
+
+def get_good_prefix_lookup(pat):
+    '''
+    Returns the lookup table to be used in the 'good prefix' rule of the mirrored Boyer Moore
+    algorithm. Each value (v) in the lookup table is such that len(pat) - v = rightwards shift of
+    pattern possible such that the already matched characters in pat align with those in the text.
+        pat:    String of characters to generate lookup table for.
+        Time:   O(m)
+        Space:  O(m)
+            where:
+            m = length of 'pat'
+    '''
+    z_suffix = z_algo(pat)
+    m = len(pat)
+    good_prefix = [0 for _ in range(m + 1)]
+    for p in range(m - 1, 0, -1):
+        good_prefix[z_suffix[p]] = m - p
+    
+    return good_prefix
+
+
+def get_matched_suffix(pat):
+    '''
+    Returns the 'matched suffix' lookup table to be used in the mirrored Boyer Moore algorithm.
+    Each value (v) in the lookup table represents the length of the longest prefix that matches the
+    suffix of pat.
+        pat:    String of characters to generate lookup table for.
+        Time:   O(m)
+        Space:  O(m)
+            where:
+            m = length of 'pat'
+    '''
+    m = len(pat)
+    z_array = z_algo(reversed(pat))
+    matched_suffix = [0 for _ in range(m + 1)]
+    for i in range(m):
+        matched_suffix[i + 1] = z_array[
+            m - i - 1
+        ] if z_array[m - i - 1] - i == 1 else matched_suffix[i]
+
+        # limit max value of mp such that m - mp will always be at least 1
+        if matched_suffix[i + 1] > m - 1:
+            matched_suffix[i + 1] = m - 1
+    
+    return matched_suffix
+
+
+class CompiledPattern:
+    '''
+    Preprocessed mirrored Boyer Moore tables for a single pattern, so that find_all can be called on
+    many texts without rebuilding the tables.
+        pat:    String of characters representing pattern to search for.
+    '''
+    TABLES = ('bad_char', 'good_prefix', 'matched_suffix')
+
+    def __init__(self, pat):
+        self.pat = pat
+        self.bad_char = get_bad_char_lookup(pat)
+        self.good_prefix = get_good_prefix_lookup(pat)
+        self.matched_suffix = get_matched_suffix(pat)
+
+    @property
+    def nbytes(self):
+        '''
+        Returns a dict mapping each preprocessing table built so far to its size in bytes.
+        '''
+        return get_table_nbytes(self, self.TABLES)
+
+    def find_all(self, text, start=0, end=None):
+        '''
+        Finds the starting index of all occurrences of the pattern in text[start:end], see
+        mirrored_boyermoore. The window is scanned in place and offsets are relative to text.
+            text:   String of characters representing text to search in.
+            start:  Start of the window, interpreted like a slice index.
+            end:    End of the window (exclusive), interpreted like a slice index.
+        '''
+        start, end, _ = slice(start, end).indices(len(text))
+        pat = self.pat
+        if len(pat) == 0:
+            return [start]
+
+        bad_char = self.bad_char
+        good_prefix = self.good_prefix
+        matched_suffix = self.matched_suffix
+
+        occ = []
+        j = end - 1  # denotes (right) start of pat relative to text (inclusive)
+        m = len(pat)  # denotes length of pat
+        i = j - m  # denotes (left) end of pat relative to text (non inclusive)
+        k = 0  # denotes current index relative to pat
+        galil_br = -1  # denotes breakpoint for Galil's optimization relative to text
+        galil_rs = -1  # denotes resume point for Galil's optimization relative to text
+        bc_row = None  # cache storage of row of previous bad char lookup
+        previous_char = None
+        while i >= start - 1:
+            if k >= m:  # full match found
+                occ.append(j - m + 1)
+                shift = m - matched_suffix[-2]
+                galil_br = i + 1  # the overlap with this match is known to match the next alignment
+                j -= shift
+                i -= shift
+                galil_rs = j + 1  # resuming past the end of pat completes the match
+                k = 0
+                continue
+
+            global_index = i + k + 1
+            if global_index == galil_br:  # galil's optimization
+                galil_br = -1  # prevents endless resuming at galil_rs
+                k = galil_rs - i - 1
+                continue
+
+            current_char = text[global_index]
+            if current_char == pat[k]:
+                k += 1
+            else:
+                try:
+                    if current_char != previous_char:
+                        bc_row = bad_char[ord(current_char)]
+                        previous_char = current_char
+                    bc = bc_row[k] - k
+                except (TypeError, IndexError):
+                    bc = m - k  # bad char does not exist in pat, therefore shift entire pat length
+                gp = good_prefix[k]
+                gp = m - matched_suffix[k - 1] if gp == 0 else m - gp
+
+                # shift by bc or gp depending on which provides a larger shift
+                if bc > gp:
+                    shift = bc
+                    galil_br = global_index
+                    galil_rs = global_index
+                else:
+                    shift = gp
+                    galil_br = i + 1
+                    galil_rs = global_index
+
+                j -= shift
+                i -= shift
+                k = 0
+        return occ
+
+
+def compile_pattern(pat, fold=None):
+    '''
+    Returns a CompiledPattern holding the mirrored Boyer Moore tables for pat. If fold is given, the
+    tables are built over the folded pattern and text characters are folded as they are scanned
+    (see folding.FoldedPattern).
+    '''
+    if fold is not None:
+        return FoldedPattern(CompiledPattern, pat, fold)
+    return CompiledPattern(pat)
+
+
+def mirrored_boyermoore(pat, text, fold=None, start=0, end=None):
+    '''
+    Finds the starting index of all occurrances of pat in text using mirrored Boyer Moore's
+    algorithm.
+        pat:    String of characters representing pattern to search for.
+        text:   String of characters representing text to search in.
+        fold:   Optional character folding, see compile_pattern.
+        start:  Start of the searched window of text, offsets stay relative to text.
+        end:    End of the searched window of text (exclusive).
+        Time:   O(n + m) worst case
+        Space:  O(n + m)
+            where:
+            n = length of 'text'
+            m = length of 'pat'
+    '''
+    return compile_pattern(pat, fold).find_all(text, start, end)
+
+
+if __name__ == '__main__':
+    text_file, pat_file = sys.argv[1:]
+
+    with open(text_file) as f:
+        text = f.read()
+    
+    with open(pat_file) as f:
+        pat = f.read()
+
+    results = mirrored_boyermoore(pat, text)
+    with open('output_mirrored_boyermoore.txt', 'w') as f:
+        f.writelines(map(lambda res: f'{res + 1}\n', reversed(results)))
@@ -0,0 +1,155 @@
+# Ho Yi Ping
+# This file contains the code for question 3 (Modified KMP). Run the
+# module from command line via: python -m stringalgos.modified_kmp <text_file> <pattern_file> This program will
+# write its output to a file named 'output_kmp.txt' in the current working directory.
+
+
+import sys
+
+from .folding import FoldedPattern
+from .memory import get_table_nbytes
+from .zalgo import z_algo
+
+
+ALPHABET = [chr(i) for i in range(128)]  # all ascii characters
+
+
+def get_spx(pat):
+    '''
+    Returns a 2D spix lookup table to be used in the KMP algorithm. Lookup table is computed
+    running z algorithm on the given string and placing the z values into a 2D lookup table such
+    that they can be looked up by the mismatched character.
+        pat:    String of characters representing pattern to be processed
+    '''
+    m = len(pat)
+    spx = [None for _ in range(max([len(ALPHABET)] + [ord(char) + 1 for char in pat]))]
+    z_array = z_algo(pat)
+    for j in range(m - 1, 0, -1):
+        if z_array[j] > 0:
+            i = j + z_array[j] - 1
+            char_idx = ord(pat[z_array[j]])
+            if spx[char_idx] is None:  # only allocate array of necessary letters
+                spx[char_idx] = [-1 for _ in range(len(pat) + 1)]
+            spx[char_idx][i] = z_array[j]
+    return spx
+
+
+class CompiledPattern:
+    '''
+    Preprocessed spix table for a single pattern, so that find_all can be called on many texts
+    without rebuilding the table.
+        pat:    String of characters representing pattern to search for.
+    '''
+    TABLES = ('spx',)
+
+    def __init__(self, pat):
+        self.pat = pat
+        self.spx = get_spx(pat)
+
+    @property
+    def nbytes(self):
+        '''
+        Returns a dict mapping each preprocessing table built so far to its size in bytes.
+        '''
+        return get_table_nbytes(self, self.TABLES)
+
+    def find_all(self, text, start=0, end=None):
+        '''
+        Finds the starting index of all occurrences of the pattern in text[start:end], see kmp. The
+        window is scanned in place and offsets are relative to text.
+            text:   String of characters representing text to search in.
+            start:  Start of the window, interpreted like a slice index.
+            end:    End of the window (exclusive), interpreted like a slice index.
+        '''
+        start, end, _ = slice(start, end).indices(len(text))
+        pat = self.pat
+        if len(pat) == 0:
+            return [start]
+
+        spx = self.spx
+
+        n = end  # denotes end of the searched window of text
+        m = len(pat)
+        i = start  # denotes start of pattern
+        j = start + m  # denotes end of pattern
+        k = 0
+        occ = []
+        while j <= n:  # compare chars left to right
+            global_index = i + k
+            if k >= m:  # full match found
+                occ.append(i)
+                if global_index < n:  # not at end of text
+                    global_char = text[global_index]
+                    try:  # lookup shift value from spix table
+                        spi = spx[ord(global_char)][-2]
+                    except (TypeError, IndexError):  # char not in pat
+                        spi = -1
+                    if spi == -1 and global_char == pat[0]:  # special case
+                        spi = 0
+                    shift = k - spi
+                    k = k - shift + 1  # border and the next character are known to match
+                    i += shift
+                    j += shift
+                    continue
+                else:
+                    break
+
+            if pat[k] != text[global_index]:
+                global_char = text[global_index]
+                try:  # lookup shift value from spix table
+                    spi = spx[ord(global_char)][k - 1]
+                except (TypeError, IndexError):  # char not in pat
+                    spi = -1
+                if spi == -1 and global_char == pat[0]:  # special case
+                    spi = 0
+                shift = k - spi
+                k = k - shift + 1
+                i += shift
+                j += shift
+                continue
+            k += 1
+        return occ
+
+
+def compile_pattern(pat, fold=None):
+    '''
+    Returns a CompiledPattern holding the spix table for pat. If fold is given, the table is built
+    over the folded pattern and text characters are folded as they are scanned (see
+    folding.FoldedPattern). As without folding, the folded text must be ASCII.
+    '''
+    if fold is not None:
+        return FoldedPattern(CompiledPattern, pat, fold)
+    return CompiledPattern(pat)
+
+
+def kmp(pat, text, fold=None, start=0, end=None):
+    '''
+    Returns a list of starting indices of all occurrences of pat in text. Search is performed using
+    the KMP algorithm with spix lookup table.
+        pat:    String of characters representing pattern to search for
+        text:   String of characters representing text to search in
+        fold:   Optional character folding, see compile_pattern
+        start:  Start of the searched window of text, offsets stay relative to text
+        end:    End of the searched window of text (exclusive)
+        Time:   O(n + m)
+        Space:  O(n + m)
+            where:
+                n = |text|
+                m = |pat|
+    '''
+    return compile_pattern(pat, fold).find_all(text, start, end)
+
+
+if __name__ == '__main__':
+    text_file, pat_file = sys.argv[1:]
+    # text_file, pat_file = './29352258/q3/txt1.txt', './29352258/q3/pat1.txt'
+
+    with open(text_file) as f:
+        text = f.read()
+    
+    with open(pat_file) as f:
+        pat = f.read()
+
+    results = kmp(pat, text)
+    with open('output_kmp.txt', 'w') as f:
+        f.writelines(map(lambda res: f'{res + 1}\n', results))
@@ -0,0 +1,78 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, find_all_numpy falls back without it
+    np = None
+
+from .prefilter import find_all_rare
+
+
+BLOCK = 1 << 20  # number of alignments filtered per block, bounds temporary memory
+CHECKS = 4  # number of pattern positions compared in the vectorised filter
+
+
+def get_check_positions(m, checks=CHECKS):
+    '''
+    Returns up to 'checks' distinct pattern positions used by the vectorised filter: the last and
+    first positions, then positions spread evenly in between.
+        m:      Length of the pattern
+        checks: Maximum number of positions
+    '''
+    if m <= checks:
+        return list(range(m - 1, -1, -1))
+    positions = [m - 1, 0]
+    for index in range(1, checks - 1):
+        positions.append(index * (m - 1) // (checks - 1))
+    return list(dict.fromkeys(positions))
+
+
+def find_all_numpy(pat, text, block=BLOCK, fallback=find_all_rare):
+    '''
+    Finds the starting index of all occurrences of pat in text, where both are bytes-like. For each
+    block of alignments, the text is viewed as a NumPy uint8 array without copying, a candidate
+    mask is built by comparing a few pattern positions against shifted views of the block, and
+    the surviving candidates are verified with bytes.startswith. Falls back to 'fallback' when
+    NumPy is not installed or text is a str.
+        pat:        bytes representing pattern to search for
+        text:       bytes-like object representing text to search in
+        block:      Number of alignments per block
+        fallback:   Function fallback(pat, text) used when NumPy cannot be used
+        Time:       O(n * c) vectorised + O(k * m) verification
+        Space:      O(block + occ)
+            where:
+                n = |text|
+                m = |pat|
+                c = number of checked positions (CHECKS)
+                k = number of candidates passing the filter
+    '''
+    if np is None or isinstance(text, str):
+        if not isinstance(text, (str, bytes, bytearray)):  # the fallback needs find and startswith
+            text = bytes(text)
+        return fallback(pat, text)
+
+    m = len(pat)
+    n = len(text)
+    if m == 0:
+        return [0]
+
+    pat = bytes(pat)
+    positions = get_check_positions(m)
+    verify = m > len(positions)
+    if verify:
+        if isinstance(text, (bytes, bytearray)):
+            startswith = text.startswith
+        else:  # memoryview and mmap have no startswith, compare a slice instead of copying text
+            def startswith(pat, j):
+                return text[j:j + m] == pat
+    occ = []
+    for start in range(0, n - m + 1, block):
+        windows = min(block, n - m + 1 - start)
+        view = np.frombuffer(text, dtype=np.uint8, count=windows + m - 1, offset=start)
+        mask = view[m - 1:m - 1 + windows] == pat[m - 1]
+        for pos in positions[1:]:
+            mask &= view[pos:pos + windows] == pat[pos]
+        candidates = np.flatnonzero(mask)
+        if verify:
+            occ.extend(j for j in (start + int(c) for c in candidates) if startswith(pat, j))
+        else:
+            occ.extend((candidates + start).tolist())
+    return occ
@@ -0,0 +1,89 @@
+from collections import Counter
+
+from . import boyermoore
+
+
+SAMPLE_BLOCKS = 32  # number of evenly spaced blocks sampled for character frequencies
+SAMPLE_BLOCK_LEN = 1024  # length of each sampled block
+MAX_DENSITY = 0.4  # candidate density (candidates per text character) above which BM is used
+
+
+def sample_frequencies(text, blocks=SAMPLE_BLOCKS, block_len=SAMPLE_BLOCK_LEN):
+    '''
+    Returns (counts, sampled) where counts is a Counter of characters over 'blocks' evenly spaced
+    blocks of text and sampled is the number of characters counted. Texts shorter than the sample
+    are counted in full.
+        text:       String (or bytes) to sample
+        blocks:     Number of blocks sampled
+        block_len:  Length of each block
+        Time:       O(blocks * block_len)
+        Space:      O(|alphabet|)
+    '''
+    n = len(text)
+    if n <= blocks * block_len:
+        return Counter(text), n
+    counts = Counter()
+    step = (n - block_len) // (blocks - 1) if blocks > 1 else 0
+    for block in range(blocks):
+        start = block * step
+        counts.update(text[start:start + block_len])
+    return counts, blocks * block_len
+
+
+def get_rare_index(pat, counts):
+    '''
+    Returns the index of the character of pat which is least frequent according to counts. Ties
+    are broken in favour of the rightmost such character.
+    '''
+    best = len(pat) - 1
+    for index in range(len(pat) - 2, -1, -1):
+        if counts[pat[index]] < counts[pat[best]]:
+            best = index
+    return best
+
+
+def find_all_rare(pat, text, max_density=MAX_DENSITY, fallback=None):
+    '''
+    Finds the starting index of all occurrences of pat in text by jumping between occurrences of
+    the rarest pattern character with the C-implemented str.find/bytes.find, and verifying each
+    candidate with startswith. The rarest character is chosen from a sampled frequency table; if
+    its estimated density in text exceeds max_density the search falls back to 'fallback', since
+    the per-candidate overhead would then outweigh the interpreter loop it avoids.
+    Works with str and bytes as long as pat and text have the same type.
+        pat:            String of characters representing pattern to search for
+        text:           String of characters representing text to search in
+        max_density:    Highest estimated candidates per text character to use the prefilter for
+        fallback:       Function fallback(pat, text) used for dense candidates, defaults to
+                        boyermoore for str; bytes are never handed to the default since
+                        boyermoore only reads str
+        Time:           O(n) in C + O(c * m) in C + O(c) interpreted, or the fallback's time
+        Space:          O(occ)
+            where:
+                n = |text|
+                m = |pat|
+                c = number of occurrences of the rarest pattern character in text
+    '''
+    m = len(pat)
+    if m == 0:
+        return [0]
+
+    counts, sampled = sample_frequencies(text)
+    r = get_rare_index(pat, counts)
+    rare = pat[r:r + 1]  # slice keeps bytes patterns as bytes
+    if sampled and counts[pat[r]] / sampled > max_density:
+        if fallback is not None:
+            return fallback(pat, text)
+        if isinstance(text, str):
+            return boyermoore.boyermoore(pat, text)
+
+    find = text.find
+    startswith = text.startswith
+    last = len(text) - m + r  # last index at which the rare character can start a match
+    occ = []
+    pos = find(rare, r)
+    while pos != -1 and pos <= last:
+        j = pos - r
+        if startswith(pat, j):
+            occ.append(j)
+        pos = find(rare, pos + 1)
+    return occ
@@ -0,0 +1,169 @@
+from itertools import islice
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the pure Python rolling hash is used without it
+    np = None
+
+
+BASE = 0x100000001b3  # odd multiplier of the polynomial hash
+MASK = (1 << 64) - 1  # hashes are taken modulo 2^64, matching NumPy uint64 wraparound
+BLOCK = 1 << 16  # number of windows hashed per NumPy block, bounds temporary memory
+NUMPY_MAX_LENGTH = 128  # longest pattern hashed with NumPy by default, scan_numpy is O(n * L)
+
+
+def get_hash(string):
+    '''
+    Returns the polynomial hash sum(code[t] * BASE^(L - 1 - t)) mod 2^64 of string.
+        string: String of characters (or bytes)
+        Time:   O(L)
+            where:
+                L = |string|
+    '''
+    h = 0
+    for c in string:
+        h = (h * BASE + (c if isinstance(c, int) else ord(c))) & MASK
+    return h
+
+
+def group_patterns(pats):
+    '''
+    Returns a dict mapping each distinct pattern length to the set of hashes of the patterns of that
+    length.
+        pats:   Iterable of non-empty patterns
+        Time:   O(total pattern length)
+    '''
+    groups = {}
+    for pat in pats:
+        groups.setdefault(len(pat), set()).add(get_hash(pat))
+    return groups
+
+
+def scan_python(text, length, hashes):
+    '''
+    Yields every index of text at which the rolling hash of the window of the given length is in
+    hashes. Character codes are read lazily by two iterators, one entering and one leaving the
+    window, so no code array is built for the text.
+        Time:   O(n)
+        Space:  O(1)
+            where:
+                n = |text|
+    '''
+    if len(text) < length:
+        return
+    if isinstance(text, (bytes, bytearray)):
+        entering, leaving = iter(text), iter(text)
+    else:
+        entering, leaving = map(ord, text), map(ord, text)
+    top = pow(BASE, length - 1, 1 << 64)
+    h = 0
+    for code in islice(entering, length):
+        h = (h * BASE + code) & MASK
+    if h in hashes:
+        yield 0
+    for index, (old, new) in enumerate(zip(leaving, entering), 1):
+        h = ((h - old * top) * BASE + new) & MASK
+        if h in hashes:
+            yield index
+
+
+def get_codes_numpy(text, start, stop):
+    '''
+    Returns text[start:stop] as a NumPy uint64 array of character codes. bytes are viewed without
+    copying the text, str slices are encoded as UTF-32.
+    '''
+    if isinstance(text, (bytes, bytearray, memoryview)):
+        return np.frombuffer(text, dtype=np.uint8, count=stop - start, offset=start).astype(np.uint64)
+    return np.frombuffer(text[start:stop].encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+
+
+def scan_numpy(text, length, hashes):
+    '''
+    Yields every index of text at which the hash of the window of the given length is in hashes.
+    Window hashes are computed with vectorised Horner steps over blocks of BLOCK windows. Every
+    window is hashed from scratch rather than rolled, so this is O(n * L) rather than the O(n) of
+    scan_python, with each of the L Horner steps a single vectorised operation over the block.
+        Time:   O(n * L) vectorised
+        Space:  O(BLOCK + L)
+            where:
+                n = |text|
+                L = length
+    '''
+    n = len(text)
+    targets = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+    base = np.uint64(BASE)
+    for start in range(0, n - length + 1, BLOCK):
+        stop = min(start + BLOCK, n - length + 1)
+        windows = stop - start
+        codes = get_codes_numpy(text, start, stop + length - 1)
+        acc = np.zeros(windows, dtype=np.uint64)
+        for t in range(length):
+            acc *= base
+            acc += codes[t:t + windows]
+        for index in np.flatnonzero(np.isin(acc, targets)):
+            yield start + int(index)
+
+
+def get_scan(length, use_numpy=None):
+    '''
+    Returns the scan function used for patterns of the given length. By default NumPy is used when
+    it is installed and length is at most NUMPY_MAX_LENGTH: scan_numpy hashes every window from
+    scratch, so beyond that the O(n) rolling scan_python is faster.
+        use_numpy:  True or False to force the backend, None to choose as above
+    '''
+    if use_numpy is None:
+        use_numpy = np is not None and length <= NUMPY_MAX_LENGTH
+    return scan_numpy if use_numpy else scan_python
+
+
+def find_all_multi(pats, text, use_numpy=None, start=0, end=None):
+    '''
+    Finds all occurrences of every pattern in pats in text with the Rabin-Karp algorithm. Patterns
+    are grouped by length and a single rolling hash per distinct length is slid over text; windows
+    whose hash matches a pattern hash are verified exactly. Returns a dict mapping each pattern to
+    the sorted list of its starting indices.
+        pats:       Iterable of patterns (all str, or all bytes like text)
+        text:       String of characters representing text to search in
+        use_numpy:  Whether to hash windows with NumPy, by default per pattern length, see
+                    get_scan
+        start:      Start of the searched window of text, offsets stay relative to text
+        end:        End of the searched window of text (exclusive)
+        Time:       O(n * d + P + occ)
+        Space:      O(P + occ)
+            where:
+                n = |text|
+                d = number of distinct pattern lengths
+                P = total pattern length
+    '''
+    if use_numpy and np is None:
+        raise ImportError('NumPy is not installed')
+    if start != 0 or end is not None:
+        start, end, _ = slice(start, end).indices(len(text))
+        occ = find_all_multi(pats, text[start:end], use_numpy)
+        return {pat: [start + offset for offset in offsets] for pat, offsets in occ.items()}
+
+    occ = {}
+    for pat in pats:
+        occ[pat] = [0] if len(pat) == 0 else []
+    groups = group_patterns(pat for pat in occ if len(pat) > 0)
+    for length, hashes in groups.items():
+        for index in get_scan(length, use_numpy)(text, length, hashes):
+            window = text[index:index + length]
+            found = occ.get(window)
+            if found is not None:  # exact verification, rejects hash collisions
+                found.append(index)
+    return occ
+
+
+if __name__ == '__main__':
+    text_file, pat_file = sys.argv[1:]
+
+    with open(text_file) as f:
+        text = f.read()
+
+    with open(pat_file) as f:
+        pats = [line.strip() for line in f if line.strip()]
+
+    for pat, found in find_all_multi(pats, text).items():
+        print(pat, *found)
@@ -0,0 +1,309 @@
+'''
+Resident search server answering queries against preloaded reference texts over a Unix domain
+socket, so that reference I/O and pattern preprocessing are paid once instead of per job.
+
+    python -m stringalgos.server SOCKET_PATH REFERENCE_FILE... [-w WORKERS] [-x thread|process]
+
+Protocol: every message is a 4 byte big-endian length followed by that many bytes of UTF-8 JSON.
+A connection may send any number of requests without waiting for replies (pipelining); replies
+are written in request order.
+    {"op": "search", "reference": NAME, "pattern": PAT, "engine": "bm", "id": ANY}
+        -> {"id": ANY, "offsets": [...]}
+    {"op": "references"}    -> {"id": null, "references": {NAME: length in bytes, ...}}
+    {"op": "ping"}          -> {"id": null, "pong": true}
+Any failure is answered with {"id": ANY, "error": MESSAGE} and the connection stays usable.
+'''
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cached_property, lru_cache
+import argparse
+import json
+import mmap
+import os
+import queue
+import socketserver
+import struct
+import threading
+
+from .engines import BINARY_ENGINES, get_compiler, get_engine
+
+
+HEADER = struct.Struct('>I')  # length prefix of every message
+MAX_MESSAGE = 1 << 30  # largest accepted message, guards against garbage length prefixes
+PATTERN_CACHE_SIZE = 1024  # compiled patterns kept per process
+
+
+class FramingError(ValueError):
+    '''
+    Raised when a message cannot be delimited, after which the stream cannot be read further.
+    '''
+
+
+def read_message(rfile):
+    '''
+    Reads one length-prefixed JSON message from a binary file object. Returns None on a clean end
+    of stream and raises FramingError on a truncated or oversized message. A complete message whose
+    payload is not valid JSON raises json.JSONDecodeError (a ValueError) after the whole payload
+    has been consumed, so the next message can still be read.
+    '''
+    header = rfile.read(HEADER.size)
+    if not header:
+        return None
+    if len(header) < HEADER.size:
+        raise FramingError('truncated message header')
+    length, = HEADER.unpack(header)
+    if length > MAX_MESSAGE:
+        raise FramingError(f'message of {length} bytes exceeds {MAX_MESSAGE}')
+    payload = rfile.read(length)
+    if len(payload) < length:
+        raise FramingError('truncated message')
+    return json.loads(payload)
+
+
+def write_message(wfile, message):
+    '''
+    Writes one length-prefixed JSON message to a binary file object and flushes it.
+    '''
+    payload = json.dumps(message, separators=(',', ':')).encode()
+    wfile.write(HEADER.pack(len(payload)) + payload)
+    wfile.flush()
+
+
+class Reference:
+    '''
+    Reference text memory-mapped read-only. Binary engines search the mapping directly; the decoded
+    str used by the other engines is built on first use and kept.
+    '''
+    def __init__(self, path, encoding='utf-8'):
+        self.path = path
+        self.encoding = encoding
+        with open(path, 'rb') as f:
+            # empty files cannot be mapped
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) \
+                if os.fstat(f.fileno()).st_size else b''
+
+    def __len__(self):
+        return len(self.data)
+
+    @cached_property
+    def text(self):
+        return str(self.data[:], self.encoding)
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+
+def load_references(paths):
+    '''
+    Maps every reference file to a Reference named after its base name.
+        paths:  Iterable of file paths, or a dict mapping names to file paths
+    '''
+    if not isinstance(paths, dict):
+        paths = {os.path.basename(path): path for path in paths}
+    return {name: Reference(path) for name, path in paths.items()}
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def get_pattern(engine, pat):
+    '''
+    Returns the compiled pattern for pat, cached across requests. Multi-pattern engines are wrapped
+    to search a single pattern.
+    '''
+    function, kind = get_engine(engine)
+    if kind == 'multi':
+        return MultiPattern(function, pat)
+    return get_compiler(engine)(pat)
+
+
+class MultiPattern:
+    '''
+    Adapts a multi-pattern search(pats, text) function to the compiled pattern interface.
+    '''
+    def __init__(self, search, pat):
+        self.search = search
+        self.pat = pat
+
+    def find_all(self, text):
+        return self.search([self.pat], text)[self.pat]
+
+
+def search(references, engine, name, pat):
+    '''
+    Searches pat in the reference called name with the given engine and returns the offsets.
+    '''
+    try:
+        reference = references[name]
+    except KeyError:
+        raise ValueError(f'unknown reference {name!r}') from None
+    if engine in BINARY_ENGINES:
+        return get_pattern(engine, pat.encode()).find_all(reference.data)
+    return get_pattern(engine, pat).find_all(reference.text)
+
+
+_worker_references = None  # references mapped by each worker process in _init_worker
+
+
+def _init_worker(paths):
+    '''
+    Pool initializer mapping the reference files in the worker process. The mapped bytes searched
+    by binary engines are shared with the server and the other workers through the OS page cache,
+    but every worker decodes its own private str copy of a reference the first time a str engine
+    searches it.
+    '''
+    global _worker_references
+    _worker_references = load_references(paths)
+
+
+def _search_in_worker(engine, name, pat):
+    return search(_worker_references, engine, name, pat)
+
+
+class SearchHandler(socketserver.StreamRequestHandler):
+    '''
+    Serves one connection. This thread reads requests and submits them to the server's pool, a
+    writer thread sends the replies in request order as they complete.
+    '''
+    def handle(self):
+        pending = queue.Queue()
+        writer = threading.Thread(target=self.write_replies, args=(pending,), daemon=True)
+        writer.start()
+        try:
+            while True:
+                try:
+                    request = read_message(self.rfile)
+                except FramingError as e:  # framing is lost, report and drop the connection
+                    pending.put((None, {'error': str(e)}))
+                    break
+                except ValueError as e:  # payload is not JSON, the next message is intact
+                    pending.put((None, {'error': f'invalid JSON: {e}'}))
+                    continue
+                if request is None:
+                    break
+                try:
+                    pending.put(self.server.submit(request))
+                except Exception as e:  # the request is answered, the connection stays usable
+                    request_id = request.get('id') if isinstance(request, dict) else None
+                    pending.put((request_id, {'error': f'{type(e).__name__}: {e}'}))
+        except OSError:
+            pass
+        finally:
+            pending.put(None)
+            writer.join()
+
+    def write_replies(self, pending):
+        broken = False
+        while (item := pending.get()) is not None:
+            request_id, reply = item
+            if broken:
+                continue  # drain remaining futures after the client went away
+            if not isinstance(reply, dict):
+                try:
+                    reply = {'offsets': reply.result()}
+                except Exception as e:
+                    reply = {'error': f'{type(e).__name__}: {e}'}
+            try:
+                write_message(self.wfile, {'id': request_id, **reply})
+            except OSError:
+                broken = True
+
+
+class SearchServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    '''
+    Unix domain socket server answering search requests against preloaded references. Each
+    connection is served by its own thread, searches run on a shared worker pool:
+        'thread'    a ThreadPoolExecutor sharing the server's references and pattern cache
+        'process'   a ProcessPoolExecutor whose workers map the references themselves, for CPU
+                    parallelism; every worker keeps its own pattern cache and its own decoded
+                    copy of each reference searched with a str engine
+        path:       File system path of the socket, replaced if it exists
+        references: Iterable of reference file paths, or a dict mapping names to file paths
+        executor:   'thread' or 'process'
+        workers:    Number of pool workers, defaults to os.cpu_count()
+    '''
+    daemon_threads = True
+
+    def __init__(self, path, references, executor='thread', workers=None):
+        if executor not in ('thread', 'process'):
+            raise ValueError(f'unknown executor {executor!r}')
+        if not isinstance(references, dict):
+            references = list(references)
+        self.references = load_references(references)
+        workers = workers or os.cpu_count() or 1
+        if executor == 'process':
+            self.pool = ProcessPoolExecutor(workers, initializer=_init_worker,
+                                            initargs=(references,))
+            self.search = _search_in_worker
+        else:
+            self.pool = ThreadPoolExecutor(workers)
+            self.search = lambda engine, name, pat: search(self.references, engine, name, pat)
+        if os.path.exists(path):
+            os.unlink(path)
+        super().__init__(path, SearchHandler)
+
+    def submit(self, request):
+        '''
+        Returns (request id, reply) where reply is either a dict answered inline or a future whose
+        result is the list of offsets.
+        '''
+        if not isinstance(request, dict):
+            return None, {'error': 'request must be a JSON object'}
+        request_id = request.get('id')
+        op = request.get('op', 'search')
+        if not isinstance(op, str):
+            return request_id, {'error': 'op must be a string'}
+        if op == 'ping':
+            return request_id, {'pong': True}
+        if op == 'references':
+            return request_id, {'references': {name: len(reference)
+                                               for name, reference in self.references.items()}}
+        if op != 'search':
+            return request_id, {'error': f'unknown op {op!r}'}
+        engine = request.get('engine', 'bm')
+        name = request.get('reference')
+        pat = request.get('pattern')
+        if not isinstance(pat, str):
+            return request_id, {'error': 'pattern must be a string'}
+        if not isinstance(engine, str):
+            return request_id, {'error': 'engine must be a string'}
+        if not isinstance(name, str):
+            return request_id, {'error': 'reference must be a string'}
+        try:
+            get_engine(engine)  # reject unknown engines before queueing
+        except ValueError as e:
+            return request_id, {'error': str(e)}
+        if name not in self.references:
+            return request_id, {'error': f'unknown reference {name!r}'}
+        return request_id, self.pool.submit(self.search, engine, name, pat)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(cancel_futures=True)
+        for reference in self.references.values():
+            reference.close()
+        try:
+            os.unlink(self.server_address)
+        except OSError:
+            pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m stringalgos.server', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('socket', help='path of the Unix domain socket to listen on')
+    parser.add_argument('references', nargs='+', metavar='REFERENCE_FILE',
+                        help='reference files, addressed by their base name')
+    parser.add_argument('-x', '--executor', default='thread', choices=['thread', 'process'],
+                        help='worker pool type (default: thread)')
+    parser.add_argument('-w', '--workers', type=int, help='number of workers (default: CPU count)')
+    args = parser.parse_args(argv)
+
+    with SearchServer(args.socket, args.references, args.executor, args.workers) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,203 @@
+'''
+Per-file k-mer index shards over a corpus of reference files, built in parallel and queried
+together through a manifest.
+'''
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import json
+import os
+
+from .cache import digest_file
+from .kmerindex import K, KmerIndex
+
+
+MANIFEST = 'manifest.json'  # name of the manifest inside a shard directory
+
+
+def get_shard_name(digest, k):
+    '''
+    Returns the file name of the shard for a file with the given content digest. Shards are content
+    addressed, so renamed or duplicated files share one shard.
+    '''
+    return f'{digest}.k{k}.kmer'
+
+
+def read_text(path):
+    with open(path) as f:
+        return f.read()
+
+
+def _build_shard(path, digest, directory, k):
+    '''
+    Builds and saves the shard of one file, returning (path, digest, text length).
+    '''
+    text = read_text(path)
+    KmerIndex(text, k).save(os.path.join(directory, get_shard_name(digest, k)))
+    return path, digest, len(text)
+
+
+def load_manifest(directory):
+    '''
+    Returns the manifest of a shard directory, or None if it has none. The manifest is a dict
+        {'k': k, 'files': [{'path': ..., 'digest': ..., 'shard': ..., 'length': ...}, ...]}
+    listing the files in query order.
+    '''
+    try:
+        with open(os.path.join(directory, MANIFEST)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def build_shards(paths, directory, k=K, executor='process', workers=None):
+    '''
+    Builds one KmerIndex shard per reference file in directory and writes the manifest. Files whose
+    content digest already has a shard from an earlier build are skipped, and shards of this k no
+    longer listed are removed, so rebuilding after a change only indexes the changed files. Shards
+    of other k are kept and reused when the directory is rebuilt with their k.
+    Returns (manifest, built) where built is the list of paths indexed by this call.
+    'executor' selects how shards are built:
+        None        inline in the calling thread
+        'thread'    on a new ThreadPoolExecutor
+        'process'   on a new ProcessPoolExecutor, one shard per task
+        Executor    on the given executor
+        paths:      Iterable of reference file paths
+        directory:  Directory for the shards and the manifest, created if missing
+        k:          k-mer length of the shards
+        workers:    Number of workers for 'thread' and 'process', defaults to os.cpu_count()
+    '''
+    os.makedirs(directory, exist_ok=True)
+    paths = list(dict.fromkeys(paths))
+    digests = {path: digest_file(path) for path in paths}
+
+    previous = load_manifest(directory)
+    lengths = {}
+    if previous is not None:  # text lengths do not depend on k
+        lengths = {entry['digest']: entry['length'] for entry in previous['files']}
+    todo = {}  # digest -> first path with that content lacking a shard
+    for path, digest in digests.items():
+        shard = os.path.join(directory, get_shard_name(digest, k))
+        if digest not in lengths or not os.path.exists(shard):
+            todo.setdefault(digest, path)
+
+    jobs = [(path, digest, directory, k) for digest, path in todo.items()]
+    if executor is None:
+        results = [_build_shard(*job) for job in jobs]
+    elif executor in ('thread', 'process'):
+        pool_type = ProcessPoolExecutor if executor == 'process' else ThreadPoolExecutor
+        with pool_type(workers or os.cpu_count() or 1) as pool:
+            results = list(pool.map(_build_shard, *zip(*jobs))) if jobs else []
+    elif isinstance(executor, Executor):
+        results = [future.result() for future in [executor.submit(_build_shard, *job)
+                                                   for job in jobs]]
+    else:
+        raise ValueError(f'unknown executor {executor!r}')
+    for _, digest, length in results:
+        lengths[digest] = length
+
+    manifest = {'k': k, 'files': [{'path': os.path.abspath(path), 'digest': digest,
+                                   'shard': get_shard_name(digest, k), 'length': lengths[digest]}
+                                  for path, digest in digests.items()]}
+    with open(os.path.join(directory, MANIFEST + '.tmp'), 'w') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(os.path.join(directory, MANIFEST + '.tmp'), os.path.join(directory, MANIFEST))
+
+    used = {entry['shard'] for entry in manifest['files']}
+    for name in os.listdir(directory):
+        if name.endswith(f'.k{k}.kmer') and name not in used:
+            os.remove(os.path.join(directory, name))
+    return manifest, list(todo.values())
+
+
+_worker_index = None  # ShardedIndex opened by each worker process in _init_worker
+
+
+def _init_worker(directory):
+    global _worker_index
+    _worker_index = ShardedIndex(directory)
+
+
+def _search_shard_in_worker(number, pat):
+    return _worker_index.search_shard(number, pat)
+
+
+class ShardedIndex:
+    '''
+    Query side of a shard directory written by build_shards. Shards and their texts are loaded on
+    first use and kept. Worker pools are started on the first query using them and kept until
+    close(), so that process workers load each shard once rather than once per query; use the index
+    as a context manager to close them.
+        directory:  Shard directory containing a manifest
+        workers:    Number of workers of the 'thread' and 'process' pools, defaults to
+                    os.cpu_count()
+    '''
+    def __init__(self, directory, workers=None):
+        self.directory = directory
+        self.workers = workers or os.cpu_count() or 1
+        self.pools = {}  # 'thread' or 'process' -> Executor
+        self.manifest = load_manifest(directory)
+        if self.manifest is None:
+            raise ValueError(f'{directory} has no {MANIFEST}')
+        self.files = self.manifest['files']
+        self.shards = {}  # file number -> KmerIndex
+
+    def get_shard(self, number):
+        shard = self.shards.get(number)
+        if shard is None:
+            entry = self.files[number]
+            shard = KmerIndex.load(os.path.join(self.directory, entry['shard']),
+                                   read_text(entry['path']))
+            self.shards[number] = shard
+        return shard
+
+    def search_shard(self, number, pat):
+        return self.get_shard(number).find_all(pat)
+
+    def get_pool(self, executor):
+        pool = self.pools.get(executor)
+        if pool is None:
+            if executor == 'process':
+                pool = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                           initargs=(self.directory,))
+            else:
+                pool = ThreadPoolExecutor(self.workers)
+            self.pools[executor] = pool
+        return pool
+
+    def close(self):
+        for pool in self.pools.values():
+            pool.shutdown()
+        self.pools.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def find_all(self, pat, executor=None):
+        '''
+        Returns a list of (path, offset) pairs for every occurrence of the wildcard pattern pat in
+        every indexed file, in manifest order and ascending offsets within a file.
+        'executor' selects how shards are queried:
+            None        inline, shards stay loaded in this index
+            'thread'    on the index's ThreadPoolExecutor sharing the loaded shards
+            'process'   on the index's ProcessPoolExecutor, every worker loads the shards it
+                        queries once and keeps them for later queries
+            Executor    on the given executor, sharing the loaded shards (thread pools only)
+            pat:        String of characters representing pattern to search for
+        '''
+        numbers = range(len(self.files))
+        if executor is None:
+            found = [self.search_shard(number, pat) for number in numbers]
+        elif executor == 'process':
+            found = list(self.get_pool(executor).map(_search_shard_in_worker, numbers,
+                                                     [pat] * len(numbers)))
+        elif executor == 'thread':
+            found = list(self.get_pool(executor).map(self.search_shard, numbers,
+                                                     [pat] * len(numbers)))
+        elif isinstance(executor, Executor):
+            found = list(executor.map(self.search_shard, numbers, [pat] * len(numbers)))
+        else:
+            raise ValueError(f'unknown executor {executor!r}')
+        return [(entry['path'], offset) for entry, offsets in zip(self.files, found)
+                for offset in offsets]
@@ -0,0 +1,128 @@
+'''
+Strand-aware DNA search: a probe and its reverse complement are searched together in one pass.
+'''
+import sys
+
+from .memory import get_table_nbytes
+
+
+FORWARD = '+'
+REVERSE = '-'
+
+# Watson-Crick complements including the IUPAC ambiguity codes, in both cases
+_BASES = 'ACGTRYKMSWBDHVN'
+_COMPLEMENTS = 'TGCAYRMKSWVHDBN'
+COMPLEMENT = str.maketrans(_BASES + _BASES.lower(), _COMPLEMENTS + _COMPLEMENTS.lower())
+COMPLEMENT_BYTES = bytes.maketrans((_BASES + _BASES.lower()).encode(),
+                                   (_COMPLEMENTS + _COMPLEMENTS.lower()).encode())
+
+
+def reverse_complement(pat):
+    '''
+    Returns the reverse complement of a DNA string or bytes. Characters without a complement are
+    kept as they are.
+    '''
+    table = COMPLEMENT_BYTES if isinstance(pat, (bytes, bytearray)) else COMPLEMENT
+    return pat.translate(table)[::-1]
+
+
+def get_shared_shift(pats):
+    '''
+    Returns a dict mapping characters to the Horspool shift that is safe for every pattern in pats,
+    i.e. the minimum over the patterns of the distance from the character's rightmost occurrence in
+    pat[:-1] to the end of the pattern. Characters absent from the dict shift by the full length.
+        pats:   Patterns of equal length m
+        Time:   O(k * m)
+        Space:  O(|alphabet|)
+            where:
+            k = number of patterns
+    '''
+    shift = {}
+    for pat in pats:
+        m = len(pat)
+        for i, c in enumerate(pat[:-1]):
+            if m - 1 - i < shift.get(c, m):
+                shift[c] = m - 1 - i
+    return shift
+
+
+class CompiledPattern:
+    '''
+    Forward and reverse complement orientations of a probe compiled together. Both have length m,
+    so one window slides over the text, shifted by the smaller of the two bad character shifts.
+    A palindromic probe (equal to its reverse complement) is searched once, forward only.
+        pat:    DNA string or bytes representing the probe
+        Time:   O(m)
+        Space:  O(m + |alphabet|)
+            where:
+            m = length of 'pat'
+    '''
+    TABLES = ('reverse', 'shift')
+
+    def __init__(self, pat):
+        self.pat = pat
+        self.reverse = reverse_complement(pat)
+        self.palindrome = self.reverse == pat
+        self.shift = get_shared_shift([pat] if self.palindrome else [pat, self.reverse])
+
+    @property
+    def nbytes(self):
+        '''
+        Returns a dict mapping each preprocessing table built so far to its size in bytes.
+        '''
+        return get_table_nbytes(self, self.TABLES)
+
+    def find_all(self, text, start=0, end=None):
+        '''
+        Finds all occurrences of the probe on either strand of text[start:end], returning
+        (offset, strand) tuples sorted by offset, where strand is '+' (forward) or '-' (reverse
+        complement). offset is always the leftmost index of the occurrence in text.
+            text:   DNA string or bytes representing text to search in
+            start:  Start of the window, interpreted like a slice index
+            end:    End of the window (exclusive), interpreted like a slice index
+            Time:   O(n * m) worst case, O(n / m) best case
+            Space:  O(occ)
+                where:
+                n = |text|
+                m = |pat|
+                occ = number of occurrences
+        '''
+        start, end, _ = slice(start, end).indices(len(text))
+        pat, reverse = self.pat, self.reverse
+        m = len(pat)
+        n = end
+        if m == 0:
+            return [(start, FORWARD)]
+        occ = []
+        shift = self.shift
+        last = pat[-1]
+        last_reverse = None if self.palindrome else reverse[-1]
+        startswith = text.startswith
+        j = start
+        while j <= n - m:
+            c = text[j + m - 1]
+            if c == last and startswith(pat, j):
+                occ.append((j, FORWARD))
+            if c == last_reverse and startswith(reverse, j):
+                occ.append((j, REVERSE))
+            j += shift.get(c, m)
+        return occ
+
+
+def compile_pattern(pat):
+    return CompiledPattern(pat)
+
+
+def find_all_strands(pat, text, start=0, end=None):
+    '''
+    Finds all occurrences of pat and of its reverse complement in text[start:end] in a single pass,
+    returning (offset, strand) tuples. See CompiledPattern.find_all.
+    '''
+    return CompiledPattern(pat).find_all(text, start, end)
+
+
+if __name__ == '__main__':
+    with open(sys.argv[1]) as f:
+        text = f.read()
+    for offset, strand in find_all_strands(sys.argv[2], text):
+        print(offset, strand)
@@ -0,0 +1,187 @@
+import sys
+
+from .folding import FoldedPattern
+from .memory import get_table_nbytes
+
+
+def get_maximal_suffix(pat, reverse=False):
+    '''
+    Returns (start, period) of the maximal suffix of pat, where start is the index just before the
+    suffix (-1 for the whole pattern) and period is the period of the suffix. If reverse is True
+    the maximal suffix for the reversed alphabet ordering is computed instead.
+        pat:        String of characters
+        reverse:    Whether to reverse the alphabet ordering
+        Time:   O(m)
+        Space:  O(1)
+            where:
+            m = length of 'pat'
+    '''
+    m = len(pat)
+    start = -1  # index before the current maximal suffix
+    j = 0  # start of the candidate suffix compared against the maximal suffix, minus 1
+    k = 1  # offset of the current comparison within the period
+    period = 1
+    while j + k < m:
+        a = pat[j + k]
+        b = pat[start + k]
+        if (a > b) if reverse else (a < b):  # candidate is smaller, suffix so far is a period
+            j += k
+            k = 1
+            period = j - start
+        elif a == b:  # extend the current period
+            if k != period:
+                k += 1
+            else:
+                j += period
+                k = 1
+        else:  # candidate is larger, it becomes the new maximal suffix
+            start = j
+            j = start + 1
+            k = period = 1
+    return start, period
+
+
+def get_critical_factorization(pat):
+    '''
+    Returns (critical, period) where pat[:critical + 1], pat[critical + 1:] is a critical
+    factorization of pat and period is the period of the right factor, computed as the longer of
+    the maximal suffixes for both alphabet orderings.
+        pat:    String of characters
+        Time:   O(m)
+        Space:  O(1)
+            where:
+            m = length of 'pat'
+    '''
+    start, period = get_maximal_suffix(pat)
+    start_rev, period_rev = get_maximal_suffix(pat, reverse=True)
+    if start > start_rev:
+        return start, period
+    return start_rev, period_rev
+
+
+class CompiledPattern:
+    '''
+    Two-Way (Crochemore-Perrin) preprocessing of a single pattern. Apart from the pattern itself,
+    only the critical factorization and the period are stored.
+        pat:    String of characters representing pattern to search for.
+        Time:   O(m)
+        Space:  O(1) extra
+            where:
+            m = length of 'pat'
+    '''
+    TABLES = ()  # only the critical factorization and the period are stored
+
+    def __init__(self, pat):
+        self.pat = pat
+        self.critical, self.period = get_critical_factorization(pat)
+        critical = self.critical
+        # the pattern is periodic if its left factor also repeats at the period
+        self.periodic = pat[:critical + 1] == pat[self.period:self.period + critical + 1]
+        if not self.periodic:
+            self.period = max(critical + 1, len(pat) - critical - 1) + 1
+
+    @property
+    def nbytes(self):
+        '''
+        Returns a dict mapping each preprocessing table built so far to its size in bytes.
+        '''
+        return get_table_nbytes(self, self.TABLES)
+
+    def find_all(self, text, start=0, end=None):
+        '''
+        Finds the starting index of all occurrences of the pattern in text[start:end], scanning the
+        window in place with offsets relative to text. The right factor is
+        compared left to right first, then the left factor right to left. For periodic patterns the
+        prefix already known to match after a period shift is remembered and not compared again.
+            text:   String of characters representing text to search in.
+            start:  Start of the window, interpreted like a slice index.
+            end:    End of the window (exclusive), interpreted like a slice index.
+            Time:   O(n) worst case
+            Space:  O(1) extra
+                where:
+                n = length of the window
+        '''
+        start, end, _ = slice(start, end).indices(len(text))
+        pat = self.pat
+        m = len(pat)
+        if m == 0:
+            return [start]
+
+        n = end
+        critical = self.critical
+        period = self.period
+        occ = []
+        j = start  # start of pat relative to text
+        if self.periodic:
+            memory = -1  # pat[:memory + 1] is known to match at j
+            while j <= n - m:
+                i = (critical if critical > memory else memory) + 1
+                while i < m and pat[i] == text[i + j]:  # right factor, left to right
+                    i += 1
+                if i >= m:
+                    i = critical
+                    while i > memory and pat[i] == text[i + j]:  # left factor, right to left
+                        i -= 1
+                    if i <= memory:
+                        occ.append(j)
+                    j += period
+                    memory = m - period - 1
+                else:
+                    j += i - critical
+                    memory = -1
+        else:
+            while j <= n - m:
+                i = critical + 1
+                while i < m and pat[i] == text[i + j]:  # right factor, left to right
+                    i += 1
+                if i >= m:
+                    i = critical
+                    while i >= 0 and pat[i] == text[i + j]:  # left factor, right to left
+                        i -= 1
+                    if i < 0:
+                        occ.append(j)
+                    j += period
+                else:
+                    j += i - critical
+        return occ
+
+
+def compile_pattern(pat, fold=None):
+    '''
+    Returns a CompiledPattern holding the Two-Way factorization of pat. If fold is given, the
+    factorization is computed over the folded pattern and text characters are folded as they are
+    scanned.
+    '''
+    if fold is not None:
+        return FoldedPattern(CompiledPattern, pat, fold)
+    return CompiledPattern(pat)
+
+
+def twoway(pat, text, fold=None, start=0, end=None):
+    '''
+    Finds the starting index of all occurrences of pat in text using the Two-Way algorithm.
+        pat:    String of characters representing pattern to search for.
+        text:   String of characters representing text to search in.
+        fold:   Name of a predefined folding in folding.FOLDS, or a dict mapping characters to
+                characters, or None to match characters exactly.
+        start:  Start of the searched window of text, offsets stay relative to text.
+        end:    End of the searched window of text (exclusive).
+        Time:   O(n + m) worst case
+        Space:  O(1) extra
+            where:
+            n = length of 'text'
+            m = length of 'pat'
+    '''
+    return compile_pattern(pat, fold).find_all(text, start, end)
+
+
+if __name__ == '__main__':
+    text_file, pat_file = sys.argv[1:]
+
+    with open(text_file) as f:
+        text = f.read()
+
+    with open(pat_file) as f:
+        pat = f.read()
+
+    print(twoway(pat, text))
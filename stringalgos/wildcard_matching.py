@@ -0,0 +1,459 @@
+# Ho Yi Ping
+# This file contains the code for question 2 (Wildcard Matching). Run the
+# module from command line via: python -m stringalgos.wildcard_matching <text_file> <pattern_file> This
+# program will write its output to a file named 'output_wildcard_matching.txt' in the current
+# working directory.
+
+
+from itertools import islice
+import sys
+
+from .memory import get_table_nbytes
+
+
+def z_algo_special(sections, text, max_section_len, total_len, start=0):
+    '''
+    Returns a z array of a pattern $ text where the pattern is comprised of the strings and the
+    wildcard lengths in the 'sections' parameter.
+        sections:           Iterable of (wildcard_length, section) pairs that make up the pattern
+        text:               Text to search in
+        max_section_len:    Length of the longest section
+        total_len:          Length of the longest section + length of text + 1
+        start:              Index of text at which the searched window begins
+        Time:   O(nm/2)
+        Space:  O(n + m)
+            where:
+                n = |text|
+                m = |pattern|
+                x = |sections| <= m/2 e.g. a?a?a?a
+    '''
+    # initialize arrays and variables
+    z_final = [0] * total_len
+    max_section_sep_len = max_section_len + 1
+    search_string = ['$'] * (max_section_sep_len)
+    search_string.extend(islice(text, start, start + total_len - max_section_sep_len))
+
+    # run z algo on every <section> + <text>
+    for wildcard_len, section in sections:
+        # swap current section into search string
+        section_len = len(section)
+        search_string[:max_section_len] = section + ['$'] * (max_section_len - section_len)
+        
+        # reset z array
+        z = [0] * total_len
+
+        # reset 0:max_section_length of z_final so that z values for section are computed
+        z_final[:max_section_sep_len] = [0] * (max_section_sep_len)
+
+        # calculate z values of all required indices
+        l, r = 0, 0
+        for idx, val in enumerate(z_final):
+            i = val + idx  # index of z value needed
+            if i == 0:  # don't need to calculate z value at index 0
+                continue
+            if i >= total_len:  # or if out of range
+                break
+            if i > r:  # case 1: not in zbox
+                j = i
+                while j < total_len and search_string[j] == search_string[j - i]:
+                    z[i] += 1
+                    j += 1
+                if z[i] > 0:  # form new zbox if number of matches > 0
+                    l, r = i, j - 1
+            else:
+                k = i - l
+                remaining = r - i + 1
+                if z[k] < remaining:  # case 2a
+                    z[i] = z[k]
+                elif z[k] > remaining:  # case 2b
+                    z[i] = remaining
+                else:  # case 2c
+                    z[i] = z[k]
+                    matches = 0
+                    j = r + 1
+                    k = z[i]
+                    while j < total_len and search_string[j] == search_string[k]:
+                        z[i] += 1
+                        j += 1
+                        k += 1
+                        matches += 1
+                    if matches > 0:  # form new zbox if number of matches > 0
+                        l, r = i, j - 1
+            # z value for index i has been computed, add it to z_final with wildcard_len
+            z_final[idx] = val + z[i] + wildcard_len
+    return z_final
+
+
+def get_sections(pat):
+    '''
+    Processes the given pattern and splits it into sections based on wildcards. Also pairs each
+    section with the number of wildcards after it.
+        pat:    String of characters
+        Time:   O(m) (with list.append as O(1) amortized time complexity)
+        Space:  O(m)
+        where:
+            m = |pat|
+    '''
+    sections = []
+    current_len = 0
+    current_str = []
+    prev_char = None
+    for c in pat:
+        if c != '?':  # split pattern
+            if prev_char == '?':
+                sections.append((current_len, current_str))
+                current_len = 0
+                current_str = []
+            current_str.append(c)
+        elif c == '?':  # count stretch of wildcards
+            current_len += 1
+        prev_char = c
+    sections.append((current_len, current_str))
+    return sections
+
+
+def get_max_section_len(sections):
+    '''
+    Returns the length of the longest section among the given sections.
+        sections: Iterable of (wildcard_length, section) pairs
+        Time:   O(m)
+        Space:  O(1)
+            where:
+                m = |pattern|
+    '''
+    max_section_len = 0
+    for _, section in sections:
+        len_ = len(section)
+        if len_ > max_section_len:
+            max_section_len = len_
+    return max_section_len
+
+
+IUPAC_CODES = {
+    'N': None,
+    'R': 'AG',
+    'Y': 'CT',
+    'S': 'CG',
+    'W': 'AT',
+    'K': 'GT',
+    'M': 'AC',
+    'B': 'CGT',
+    'D': 'AGT',
+    'H': 'ACT',
+    'V': 'ACG',
+}  # IUPAC nucleotide codes, None denotes any character
+EXTENDED_SYNTAX = '[{'  # characters which route a pattern to the extended matcher
+
+
+def is_extended(pat, iupac=False):
+    '''
+    Returns True if the given pattern uses syntax which is not supported by the plain '?' matcher,
+    i.e. character classes, bounded gaps or (if enabled) IUPAC codes.
+        pat:    String of characters
+        iupac:  Whether IUPAC nucleotide codes are treated as character classes
+        Time:   O(m)
+        Space:  O(1)
+            where:
+                m = |pat|
+    '''
+    for c in pat:
+        if c in EXTENDED_SYNTAX or (iupac and c in IUPAC_CODES):
+            return True
+    return False
+
+
+def get_elements(pat, iupac=False):
+    '''
+    Parses an extended pattern into a list of (chars, negated, min_count, max_count) elements. chars
+    is a string of the characters accepted by the element, or None if any character is accepted.
+    negated inverts chars. The supported syntax is:
+        ?           any character
+        [AG]        any of the listed characters, [^AG] any character except those listed
+        x{i,j}      gap of i to j characters of any kind
+        e{i,j}      element e repeated i to j times, e{i} repeated exactly i times
+        N, R, ...   IUPAC nucleotide codes (only if iupac is True)
+    any other character matches itself.
+        pat:    String of characters
+        iupac:  Whether IUPAC nucleotide codes are treated as character classes
+        Time:   O(m + sum(max_count))
+        Space:  O(m)
+            where:
+                m = |pat|
+    '''
+    elements = []
+    m = len(pat)
+    i = 0
+    while i < m:
+        c = pat[i]
+        if c == '[':  # character class
+            end = pat.find(']', i + 1)
+            if end == -1:
+                raise ValueError(f'unterminated character class at index {i}')
+            chars = pat[i + 1:end]
+            negated = chars.startswith('^')
+            if negated:
+                chars = chars[1:]
+            if len(chars) == 0:
+                raise ValueError(f'empty character class at index {i}')
+            elements.append([chars, negated, 1, 1])
+            i = end + 1
+        elif c == '{':  # bounded repetition of the previous element
+            end = pat.find('}', i + 1)
+            if end == -1:
+                raise ValueError(f'unterminated repetition at index {i}')
+            if len(elements) == 0:
+                raise ValueError(f'repetition at index {i} has nothing to repeat')
+            bounds = pat[i + 1:end].split(',')
+            try:
+                lo = int(bounds[0])
+                hi = int(bounds[1]) if len(bounds) > 1 else lo
+            except ValueError:
+                raise ValueError(f'invalid repetition bounds at index {i}') from None
+            if len(bounds) > 2 or lo < 0 or hi < lo:
+                raise ValueError(f'invalid repetition bounds at index {i}')
+            elements[-1][2], elements[-1][3] = lo, hi
+            i = end + 1
+        elif c == 'x' and i + 1 < m and pat[i + 1] == '{':  # PROSITE style gap
+            elements.append([None, False, 1, 1])
+            i += 1
+        elif c == '?':
+            elements.append([None, False, 1, 1])
+            i += 1
+        elif iupac and c in IUPAC_CODES:
+            elements.append([IUPAC_CODES[c], False, 1, 1])
+            i += 1
+        else:
+            elements.append([c, False, 1, 1])
+            i += 1
+    return [tuple(element) for element in elements]
+
+
+def get_shift_and_masks(elements):
+    '''
+    Returns the bit masks used by the extended Shift-And matcher. Elements are expanded into one bit
+    per position: min_count mandatory positions followed by (max_count - min_count) optional ones.
+    Returns (char_masks, default_mask, lead, block_start, block_end, optional, final) where
+    char_masks maps each character mentioned by the pattern to the positions it may occupy,
+    default_mask holds the positions open to any other character, lead holds optional positions at
+    the start of the pattern and block_start/block_end/optional describe the remaining optional
+    blocks for epsilon closure.
+        elements:   List of (chars, negated, min_count, max_count) as returned by get_elements
+        Time:   O(L * k)
+        Space:  O(L + k)
+            where:
+                L = total number of expanded positions
+                k = number of distinct characters mentioned in the pattern
+    '''
+    positions = []  # (chars, negated, is_optional)
+    for chars, negated, lo, hi in elements:
+        positions.extend((chars, negated, False) for _ in range(lo))
+        positions.extend((chars, negated, True) for _ in range(hi - lo))
+    if all(is_optional for _, _, is_optional in positions):
+        raise ValueError('pattern can match the empty string')
+
+    mentioned = set()
+    for chars, _, _ in positions:
+        if chars is not None:
+            mentioned.update(chars)
+
+    default_mask = 0
+    char_masks = {c: 0 for c in mentioned}
+    lead = block_start = block_end = optional = 0
+    in_lead = True
+    for index, (chars, negated, is_optional) in enumerate(positions):
+        bit = 1 << index
+        if chars is None or negated:
+            default_mask |= bit
+        for c in mentioned:
+            if chars is None or (c in chars) != negated:
+                char_masks[c] |= bit
+
+        if not is_optional:
+            in_lead = False
+        elif in_lead:
+            lead |= bit
+        else:
+            optional |= bit
+            if not positions[index - 1][2]:  # first position of a block
+                block_start |= bit >> 1
+            if index + 1 == len(positions) or not positions[index + 1][2]:  # last of a block
+                block_end |= bit
+    final = 1 << (len(positions) - 1)
+    return char_masks, default_mask, lead, block_start, block_end, optional, final
+
+
+def find_all_extended(pat, text, iupac=False):
+    '''
+    Returns a list of starting indices of all occurrences of pat in text, where pat may use the
+    extended syntax described in get_elements. Search is performed right to left with the extended
+    Shift-And algorithm over the reversed pattern so that every reported state corresponds to a
+    starting index. Optional positions of bounded gaps are resolved with an epsilon closure in a
+    constant number of bitwise operations per character.
+        pat:    String of characters representing pattern to search for
+        text:   String of characters representing text to search in
+        iupac:  Whether IUPAC nucleotide codes are treated as character classes
+        Time:   O(n * ceil(L/w))
+        Space:  O(L + k)
+            where:
+                n = |text|
+                L = total number of expanded pattern positions
+                w = machine word size
+                k = number of distinct characters mentioned in the pattern
+    '''
+    elements = list(reversed(get_elements(pat, iupac)))
+    return shift_and_scan(get_shift_and_masks(elements), text)
+
+
+def shift_and_scan(masks, text, start=0, end=None):
+    '''
+    Runs the extended Shift-And scan of find_all_extended right to left over text[start:end] using
+    masks returned by get_shift_and_masks for the reversed pattern. Offsets are relative to text.
+        masks:  Tuple returned by get_shift_and_masks
+        text:   String of characters representing text to search in
+        start:  Start of the searched window of text
+        end:    End of the searched window of text (exclusive), defaults to len(text)
+        Time:   O(n * ceil(L/w))
+        Space:  O(occ)
+            where:
+                n = |text|
+                L = total number of expanded pattern positions
+                w = machine word size
+    '''
+    char_masks, default_mask, lead, block_start, block_end, optional, final = masks
+
+    occ = []
+    state = 0
+    for i in range(len(text) - 1 if end is None else end - 1, start - 1, -1):
+        state = (((state | lead) << 1) | 1) & char_masks.get(text[i], default_mask)
+        if optional:  # epsilon closure over optional blocks
+            filled = state | block_end
+            state |= optional & (~(filled - block_start) ^ filled)
+        if state & final:
+            occ.append(i)
+    occ.reverse()
+    return occ
+
+
+def find_sections(sections, max_section_len, pat_len, text, start=0, end=None):
+    '''
+    Returns a list of starting indices at which the given sections (see get_sections) match
+    text[start:end]. Offsets are relative to text.
+        sections:           Iterable of (wildcard_length, section) pairs that make up the pattern
+        max_section_len:    Length of the longest section
+        pat_len:            Length of the pattern
+        text:               String of characters representing text to search in
+        start:              Start of the searched window of text
+        end:                End of the searched window of text (exclusive), defaults to len(text)
+        Time:   O(nm/2)
+        Space:  O(n + m)
+            where:
+                n = |text|
+                m = |pattern|
+    '''
+    if end is None:
+        end = len(text)
+    n = max_section_len + 1 + end - start
+
+    # run z algorithm on every <section> + <text> and combine z values to find occurrences
+    z_arr = z_algo_special(sections, text, max_section_len, n, start)
+
+    # identify indices at which matches occur
+    offset = start - max_section_len - 1
+    occ = [i + offset for i in range(n) if z_arr[i] == pat_len and i + z_arr[i] <= n]
+    return occ
+
+
+class CompiledPattern:
+    '''
+    Preprocessed wildcard pattern. Plain '?' patterns are split into sections once, extended
+    patterns are compiled into Shift-And masks once, so that find_all can be called on many texts
+    without repeating the preprocessing.
+        pat:    String of characters representing pattern to search for
+        iupac:  Whether IUPAC nucleotide codes are treated as character classes
+    '''
+    TABLES = ('sections', 'masks')
+
+    def __init__(self, pat, iupac=False):
+        self.pat = pat
+        self.iupac = iupac
+        self.extended = is_extended(pat, iupac)
+        self.sections = self.max_section_len = self.masks = None
+        self.max_length = len(pat)  # longest text span an occurrence can cover
+        if len(pat) == 0:
+            pass
+        elif self.extended:
+            elements = get_elements(pat, iupac)
+            self.masks = get_shift_and_masks(list(reversed(elements)))
+            self.max_length = sum(max_count for _, _, _, max_count in elements)
+        else:
+            self.sections = get_sections(pat)
+            self.max_section_len = get_max_section_len(self.sections)
+
+    @property
+    def nbytes(self):
+        '''
+        Returns a dict mapping each preprocessing table built so far to its size in bytes.
+        '''
+        return get_table_nbytes(self, self.TABLES)
+
+    def find_all(self, text, start=0, end=None):
+        '''
+        Returns a list of starting indices of all occurrences of the pattern in text[start:end].
+        Offsets are relative to text.
+            text:   String of characters representing text to search in
+            start:  Start of the window, interpreted like a slice index
+            end:    End of the window (exclusive), interpreted like a slice index
+        '''
+        start, end, _ = slice(start, end).indices(len(text))
+        if len(self.pat) == 0:
+            return [start]
+
+        if end <= start:
+            return []
+
+        if self.extended:
+            return shift_and_scan(self.masks, text, start, end)
+        return find_sections(self.sections, self.max_section_len, len(self.pat), text, start, end)
+
+
+def compile_pattern(pat, iupac=False):
+    '''
+    Returns a CompiledPattern for pat.
+        pat:    String of characters representing pattern to search for
+        iupac:  Whether IUPAC nucleotide codes are treated as character classes
+    '''
+    return CompiledPattern(pat, iupac)
+
+
+def find_all(pat, text, iupac=False, start=0, end=None):
+    '''
+    Returns a list of starting indices of all occurrences of pat in text. '?' can be used to denote
+    a wildcard character. A wildcard character will match any character. Search is performed using
+    Z algorithm. Patterns using character classes or bounded gaps (see get_elements) are routed to
+    find_all_extended.
+        pat:    String of characters representing pattern to search for
+        text:   String of characters representing text to search in
+        iupac:  Whether IUPAC nucleotide codes are treated as character classes
+        start:  Start of the searched window of text, offsets stay relative to text
+        end:    End of the searched window of text (exclusive)
+        Time:   O(nm/2)
+        Space:  O(n + m)
+            where:
+                n = |text|
+                m = |pat|
+    '''
+    return compile_pattern(pat, iupac).find_all(text, start, end)
+
+
+if __name__ == '__main__':
+    text_file, pat_file = sys.argv[1:]
+
+    with open(text_file) as f:
+        text = f.read()
+    
+    with open(pat_file) as f:
+        pat = f.read()
+
+    results = find_all(pat, text)
+    with open('output_wildcard_matching.txt', 'w') as f:
+        f.writelines(map(lambda res: f'{res + 1}\n', results))
@@ -1,6 +1,3 @@
-ALPHABET = [chr(i) for i in range(128)]  # all ascii characters
-
-
 def z_algo(string):
     '''
     Performs Gusfield's Z-algorithm on the given string and returns the resulting Z-array.
@@ -53,57 +50,3 @@ def z_algo(string):
                 if matches > 0:  # form new zbox if number of matches > 0
                     l, r = i, j - 1
     return z
-
-
-
-def kmp(pat, text):
-    if len(pat) == 0:
-        return [0]
-    
-    n = len(text)
-    m = len(pat)
-
-    sp = [0 for _ in range(m + 1)]
-    sp[-1] = -1
-    z_array = z_algo(pat)
-    for j in range(m - 1, 0, -1):
-        i = j + z_array[j] - 1
-        sp[i] = z_array[j]
-
-    i = 0  # denotes start of pattern
-    j = m  # denotes end of pattern
-    k = 0
-    occ = []
-    while j <= n:  # compare chars left to right
-        if k >= m:  # full match found
-            occ.append(i)
-            shift = k - sp[-2]
-            k -= shift + 1
-        elif pat[k] != text[i + k]:
-            shift = k - sp[k - 1]
-            if k > 0:
-                k -= shift
-        else:
-            k += 1
-            continue
-        i += shift
-        j += shift
-
-    return occ
-
-
-if __name__ == '__main__':
-    # text_file, pat_file = sys.argv[1:]
-    text_file, pat_file = './29352258/q3/txt1.txt', './29352258/q3/pat1.txt'
-
-    with open(text_file) as f:
-        text = f.read()
-    
-    with open(pat_file) as f:
-        pat = f.read()
-
-    print('Text:', text)
-    print('Pat: ', pat)
-
-    # BM to find all occurrances of pat in text
-    print(kmp(pat, text))
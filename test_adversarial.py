@@ -0,0 +1,51 @@
+import unittest
+import re
+
+from stringalgos.adversarial import CASES, COMPLEXITY, benchmark, fibonacci_word, fit_exponent, \
+    get_cases
+from stringalgos.engines import get_compiler
+
+
+class TestAdversarial(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def test_generators(self):
+        print('\nTest Generators')
+        self.subcase(1, fibonacci_word(13), 'abaababaabaab')
+        self.subcase(2, [len(CASES[case][0](10)) for case in CASES], [10] * len(CASES))
+        self.subcase(3, [len(CASES[case][1](7)) for case in CASES], [7] * len(CASES))
+        self.subcase(4, 'wildcard-dense' in get_cases('bm'), False)
+
+    def test_fit(self):
+        print('\nTest Fit')
+        sizes = [10, 20, 40, 80]
+        self.subcase(1, round(fit_exponent(sizes, [3 * n for n in sizes]), 6), 1)
+        self.subcase(2, round(fit_exponent(sizes, [n * n for n in sizes]), 6), 2)
+        self.subcase(3, round(fit_exponent(sizes, [5] * 4), 6), 0)
+
+    def test_correct(self):
+        print('\nTest Correct')
+        for engine in COMPLEXITY:
+            for case in get_cases(engine):
+                make_text, make_pat = CASES[case]
+                text = make_text(300)
+                for m in [1, 2, 5, 17]:
+                    pat = make_pat(m)
+                    expected = [match.start() for match in
+                                re.finditer(f'(?={pat.replace("?", ".")})', text)]
+                    actual = sorted(get_compiler(engine)(pat).find_all(text))
+                    self.assertEqual(actual, expected, (engine, case, m))
+
+    def test_benchmark(self):
+        print('\nTest Benchmark')
+        results = benchmark(['kmp'], ['unary'], repeat=1, n_sizes=(1000, 2000), m_sizes=(4, 8),
+                            fixed_n=1000, fixed_m=4, tolerance=float('inf'))
+        self.subcase(1, [(engine, case, flagged) for engine, case, _, _, flagged, _ in results],
+                     [('kmp', 'unary', False)])
+        self.subcase(2, sorted(results[0][5]), ['preprocessing', 'results', 'scan', 'tables'])
+
+
+if __name__ == '__main__':
+    unittest.main()
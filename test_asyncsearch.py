@@ -0,0 +1,86 @@
+import unittest
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from stringalgos.asyncsearch import asearch, asearch_timeout
+from stringalgos.boyermoore import boyermoore
+from stringalgos.kmp import compile_pattern as compile_kmp
+
+
+def load_test_files():
+    with open('./reference.txt') as f:
+        text = f.read()
+
+    with open('./pattern1.txt') as f:
+        pat1 = f.readlines()
+    return text, pat1
+
+
+class TestAsyncSearch(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def test_empty(self):
+        print('\nTest Empty')
+        self.subcase(1, asyncio.run(asearch('', '')), ([0], 0))
+        self.subcase(2, asyncio.run(asearch('abc', '')), ([], 0))
+
+    def test_chunk_borders(self):
+        print('\nTest Chunk Borders')
+        self.subcase(1, asyncio.run(asearch('aa', 'aaaaa', chunk=1)), ([0, 1, 2, 3], 5))
+        self.subcase(2, asyncio.run(asearch('bac', 'cbacdbac', chunk=2)), ([1, 5], 8))
+        self.subcase(3, asyncio.run(asearch('bac', 'cbacdbac', engine='kmp', chunk=3)), ([1, 5], 8))
+        self.subcase(4, asyncio.run(asearch('bac', 'cbacdbac', engine=compile_kmp, chunk=3)),
+                     ([1, 5], 8))
+        # an occurrence can be longer than the pattern string
+        self.subcase(5, asyncio.run(asearch('bx{0,10}a', 'b' * 20 + 'a', engine='wildcard', chunk=4)),
+                     (list(range(9, 20)), 21))
+
+    def test_executor(self):
+        print('\nTest Executor')
+        with ThreadPoolExecutor(2) as executor:
+            actual = asyncio.run(asearch('aa', 'aaaaa', chunk=2, executor=executor))
+        self.subcase(1, actual, ([0, 1, 2, 3], 5))
+
+    def test_deadline(self):
+        print('\nTest Deadline')
+        text, pat1 = load_test_files()
+        pat = pat1[0].strip()
+        occ, end = asyncio.run(asearch_timeout(pat, text, 0, chunk=100))
+        self.subcase(1, (occ, end), ([], 0))
+        occ, end = asyncio.run(asearch_timeout(pat, text, 60))
+        self.subcase(2, (occ, end), (boyermoore(pat, text), len(text)))
+
+    def test_cancel(self):
+        print('\nTest Cancel')
+        text, pat1 = load_test_files()
+        pat = pat1[0].strip()
+        results = []
+
+        async def run():
+            task = asyncio.create_task(asearch(pat, text, chunk=1000, results=results))
+            for _ in range(5):
+                await asyncio.sleep(0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        expected = boyermoore(pat, text)
+        self.assertLess(len(results), len(expected))
+        self.subcase(1, results, expected[:len(results)])
+
+    def test_pat1(self):
+        print('\nTest Pat 1')
+        text, pat1 = load_test_files()
+        text = text[:100_000]
+        for pat in pat1[:10]:
+            pat = pat.strip()
+            occ, end = asyncio.run(asearch(pat, text, chunk=4096))
+            self.assertEqual(occ, boyermoore(pat, text))
+            self.assertEqual(end, len(text))
+
+
+if __name__ == '__main__':
+    unittest.main()
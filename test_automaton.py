@@ -0,0 +1,77 @@
+import unittest
+import random
+import re
+
+from stringalgos.automaton import SuffixAutomaton
+
+
+def load_test_files():
+    with open('./reference.txt') as f:
+        text = f.read()
+
+    with open('./pattern1.txt') as f:
+        pat1 = f.readlines()
+    return text, pat1
+
+
+class TestSuffixAutomaton(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def test_empty(self):
+        print('\nTest Empty')
+        automaton = SuffixAutomaton('')
+        self.subcase(1, automaton.contains(''), True)
+        self.subcase(2, automaton.contains('a'), False)
+        self.subcase(3, (automaton.count(''), automaton.find_all('')), (1, [0]))
+        self.subcase(4, automaton.find_all('a'), [])
+
+    def test_match(self):
+        print('\nTest Match')
+        automaton = SuffixAutomaton('abcbcabcb')
+        self.subcase(1, automaton.size <= 2 * 9, True)
+        self.subcase(2, [automaton.contains(pat) for pat in ['bcab', 'cc', 'x', 'abcbcabcb']],
+                     [True, False, False, True])
+        self.subcase(3, [automaton.count(pat) for pat in ['b', 'bc', 'cb', 'abcb', 'ca']],
+                     [4, 3, 2, 2, 1])
+        self.subcase(4, automaton.find_all('bc'), [1, 3, 6])
+        self.subcase(5, automaton.find_all('b'), [1, 3, 6, 8])
+        self.subcase(6, SuffixAutomaton('aaaaa').find_all('aa'), [0, 1, 2, 3])
+
+    def test_sparse(self):
+        print('\nTest Sparse')
+        text = ''.join(map(chr, range(0x100, 0x100 + 500))) * 4  # large alphabet
+        automaton = SuffixAutomaton(text)
+        self.subcase(1, len(automaton.edge_codes) <= 3 * len(text) - 4, True)
+        self.subcase(2, automaton.link.itemsize, 4)
+        self.subcase(3, automaton.find_all(text[498:503]), [498, 998, 1498])
+        self.subcase(4, automaton.count(text[:501]), 3)
+
+    def test_random(self):
+        print('\nTest Random')
+        random.seed(0)
+        for _ in range(50):
+            text = ''.join(random.choice('ab') for _ in range(random.randint(1, 40)))
+            automaton = SuffixAutomaton(text)
+            for _ in range(20):
+                pat = ''.join(random.choice('abc') for _ in range(random.randint(1, 5)))
+                expected = [m.start() for m in re.finditer(f'(?={pat})', text)]
+                self.assertEqual(automaton.find_all(pat), expected)
+                self.assertEqual(automaton.count(pat), len(expected))
+                self.assertEqual(automaton.contains(pat), bool(expected))
+
+    def test_pat1(self):
+        print('\nTest Pat 1')
+        text, pat1 = load_test_files()
+        text = text[:100_000]
+        automaton = SuffixAutomaton(text)
+        for pat in pat1:
+            pat = pat.strip()
+            expected = [m.start() for m in re.finditer(f'(?={pat})', text)]
+            self.assertEqual(automaton.count(pat), len(expected))
+            self.assertEqual(automaton.find_all(pat), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
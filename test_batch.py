@@ -0,0 +1,53 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from stringalgos.batch import search_many
+from stringalgos.boyermoore import boyermoore
+from stringalgos import kmp
+
+
+def load_test_files():
+    with open('./reference.txt') as f:
+        text = f.read()
+
+    with open('./pattern1.txt') as f:
+        pat1 = f.readlines()
+    return text, pat1
+
+
+class TestSearchMany(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def test_empty(self):
+        print('\nTest Empty')
+        self.subcase(1, search_many('aa', []), [])
+        self.subcase(2, search_many('aa', ['', 'a']), [(0, []), (1, [])])
+        self.subcase(3, search_many('', ['', 'a']), [(0, [0]), (1, [0])])
+
+    def test_executors(self):
+        print('\nTest Executors')
+        texts = ['aaaaa', 'baab', 'cbacd', 'ab', 'aa']
+        expected = [(index, boyermoore('aa', text)) for index, text in enumerate(texts)]
+        self.subcase(1, search_many('aa', texts), expected)
+        self.subcase(2, search_many('aa', texts, 'thread', workers=2, batch_size=2), expected)
+        self.subcase(3, search_many('aa', texts, 'process', workers=2, batch_size=2), expected)
+        with ThreadPoolExecutor(2) as executor:
+            self.subcase(4, search_many('aa', texts, executor, batch_size=3), expected)
+        self.subcase(5, search_many('aa', iter(texts), compile=kmp.compile_pattern), expected)
+        with self.assertRaises(ValueError):
+            search_many('aa', texts, 'fibers')
+
+    def test_pat1(self):
+        print('\nTest Pat 1')
+        text, pat1 = load_test_files()
+        texts = [text[start:start + 1000] for start in range(0, 200_000, 1000)]
+        for pat in pat1[:5]:
+            pat = pat.strip()
+            expected = [(index, boyermoore(pat, doc)) for index, doc in enumerate(texts)]
+            self.assertEqual(search_many(pat, texts, 'process', workers=2), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
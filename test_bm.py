@@ -2,7 +2,8 @@ import unittest
 import re
 import random
 
-from boyermoore import boyermoore as find_all
+from stringalgos.boyermoore import boyermoore as find_all
+from stringalgos.boyermoore import compile_pattern, get_specialized, CompiledPattern
 #from kmp import kmp as find_all
 
 
@@ -106,8 +107,67 @@ class TestFindAll(unittest.TestCase):
         print(f'{len(pat2)}/{len(pat2)}')
 
 
+class TestSpecialized(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def test_match(self):
+        print('\nTest Specialized Match')
+        for pat, text in [('aa', 'aaaaa'), ('ab', 'abb'), ('bac', 'cbacd'), ('abaab', 'abaababaab'),
+                          ('a', ''), ('abcdefg', 'xabcdefgabcdefg'), ('aabaa', 'aabaabaaaabaa')]:
+            self.subcase(pat, compile_pattern(pat, specialize=True).find_all(text),
+                         find_all(pat, text))
+        self.subcase('fold', compile_pattern('Ab', 'case', True).find_all('aBab'), [0, 2])
+        self.subcase('empty', compile_pattern('', specialize=True).find_all('ab'), [0])
+
+    def test_cached(self):
+        print('\nTest Specialized Cached')
+        self.assertIs(compile_pattern('abc', specialize=True).find_all, get_specialized('abc'))
+
+    def test_pat1(self):
+        print('\nTest Specialized Pat 1')
+        text, pat1, _ = load_test_files()
+        for index, pat in enumerate(pat1):
+            expected = [m.start() for m in re.finditer(f'(?={pat.strip()})', text)]
+            try:
+                self.assertEqual(compile_pattern(pat.strip(), specialize=True).find_all(text),
+                                 expected)
+            except AssertionError as e:
+                print(index, pat)
+                raise e
+
+
+class TestLazyTables(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def test_not_built(self):
+        print('\nTest Lazy Not Built')
+        compiled = CompiledPattern('abc')
+        self.subcase(1, compiled.find_all('xxxxxxxx'), [])
+        self.subcase(2, 'good_suffix' in vars(compiled), False)
+        self.subcase(3, compiled.contains('xxabcxxabc'), True)
+        self.subcase(4, 'matched_prefix' in vars(compiled), False)
+
+    def test_built_once(self):
+        print('\nTest Lazy Built Once')
+        compiled = CompiledPattern('abc')
+        self.subcase(1, compiled.find_all('xabcxbc'), [1])
+        good_suffix = vars(compiled)['good_suffix']
+        self.subcase(2, compiled.find_all('xbcabc'), [3])
+        self.assertIs(compiled.good_suffix, good_suffix)
+
+    def test_contains(self):
+        print('\nTest Contains')
+        self.subcase(1, compile_pattern('aa').contains('baab'), True)
+        self.subcase(2, compile_pattern('aa').contains('abab'), False)
+        self.subcase(3, compile_pattern('').contains(''), True)
+
+
 if __name__ == '__main__':
-    op = input('1: unit test\n2: profile\n3: time\n4: scalability\n> ')
+    op = input('1: unit test\n2: profile\n3: time\n4: scalability\n5: adversarial\n> ')
     text, pat1, pat2 = load_test_files()
     
     if op == '1':
@@ -145,6 +205,10 @@ if __name__ == '__main__':
             for n, t in times:
                 print(n, t)
         
+    elif op == '5':
+        from stringalgos.adversarial import main
+        main(['-e', 'bm'])
+
     else:
         print('invalid op')
 
@@ -0,0 +1,146 @@
+import unittest
+import re
+
+from stringalgos.budget import Budget, ResumeToken, find_all_budgeted, find_all_multi_budgeted
+from stringalgos.engines import ENGINES, get_compiler
+from stringalgos import kmismatch, strand, wildcard_matching
+from stringalgos.rabinkarp import find_all_multi
+
+
+def load_test_files():
+    with open('./reference.txt') as f:
+        text = f.read()
+
+    with open('./pattern1.txt') as f:
+        pat1 = f.readlines()
+    return text, pat1
+
+
+def resume_until_done(pattern, text, max_chars, chunk, **kwargs):
+    occ, token = find_all_budgeted(pattern, text, Budget(max_chars), chunk=chunk, **kwargs)
+    calls = 1
+    while token is not None:
+        found, token = find_all_budgeted(pattern, text, Budget(max_chars), resume=token,
+                                         chunk=chunk)
+        occ += found
+        calls += 1
+    return occ, calls
+
+
+class TestBudget(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def test_budget(self):
+        print('\nTest Budget')
+        budget = Budget(max_chars=10)
+        self.subcase(1, budget.exhausted(), False)
+        budget.charge(10)
+        self.subcase(2, budget.exhausted(), True)
+        self.subcase(3, Budget(timeout=0).exhausted(), True)
+        self.subcase(4, Budget().exhausted(), False)
+
+    def test_partial(self):
+        print('\nTest Partial')
+        pattern = get_compiler('bm')('aa')
+        text = 'a' * 20
+        self.subcase(1, find_all_budgeted(pattern, text, Budget(max_chars=6), chunk=5),
+                     ([0, 1, 2, 3, 4], ResumeToken(5, 20)))
+        self.subcase(2, find_all_budgeted(pattern, text, Budget(max_chars=6), chunk=5,
+                                          resume=ResumeToken(15, 20)), ([15, 16, 17, 18], None))
+        self.subcase(3, find_all_budgeted(pattern, text, Budget(), start=3, end=9, chunk=2),
+                     ([3, 4, 5, 6, 7], None))
+        self.subcase(4, find_all_budgeted(get_compiler('kmp')(''), text, Budget(0)), ([0], None))
+        self.subcase(5, resume_until_done(pattern, text, 6, 5), (list(range(19)), 4))
+        self.subcase(6, find_all_budgeted(pattern, text, Budget(max_chars=1), chunk=5),
+                     ([0], ResumeToken(1, 20)))  # one alignment per call guarantees progress
+        with self.assertRaises(ValueError):
+            find_all_budgeted(pattern, text, Budget(), chunk=0)
+
+    def test_timeout(self):
+        print('\nTest Timeout')
+        pattern = wildcard_matching.compile_pattern('a?' * 200 + 'b')  # O(nm) for z_algo_special
+        text = 'a' * 200_000
+        occ, token = find_all_budgeted(pattern, text, Budget(timeout=0.05), chunk=1000)
+        self.subcase(1, occ, [])
+        self.assertIsNotNone(token)
+        self.assertLess(token.start, len(text))
+
+    def test_engines(self):
+        print('\nTest Engines')
+        text = 'abaababaabaab' * 5
+        for engine in ENGINES:
+            if ENGINES[engine][2] == 'multi':
+                continue
+            pat = b'aab' if engine == 'numpy' else 'aab'
+            subject = text.encode() if engine == 'numpy' else text
+            expected = sorted(get_compiler(engine)(pat).find_all(subject))
+            self.assertEqual(resume_until_done(get_compiler(engine)(pat), subject, 1, 7)[0],
+                             expected, engine)
+        pattern = wildcard_matching.compile_pattern('ab{1,4}a')
+        self.subcase(1, pattern.max_length, 6)
+        self.subcase(2, resume_until_done(pattern, 'abbbbaxaba', 1, 1)[0], [0, 7])
+
+    def test_charge(self):
+        print('\nTest Charge')
+        text = 'ab' * 5000
+        budget = Budget()
+        find_all_budgeted(get_compiler('kmp')('ab' * 1000), text, budget, chunk=100)
+        # chunks are widened so that the charged overlap stays below a quarter of the text
+        self.subcase(1, len(text) < budget.chars <= len(text) * 5 // 4, True)
+        budget = Budget()
+        find_all_budgeted(get_compiler('kmp')('ab'), text, budget, start=10, end=255, chunk=100)
+        self.subcase(2, budget.chars, 101 + 101 + 45)  # overlap included
+
+    def test_cap(self):
+        print('\nTest Cap')
+        pat = 'a' * 90 + 'b'  # pattern length close to the chunk size
+        text = 'a' * 3000 + 'b' + 'a' * 2000
+        pattern = get_compiler('kmp')(pat)
+        occ, token, calls = [], None, 0
+        while calls == 0 or token is not None:
+            budget = Budget(max_chars=1000)
+            found, token = find_all_budgeted(pattern, text, budget, resume=token, chunk=100)
+            self.assertLessEqual(budget.chars, 1000)
+            occ += found
+            calls += 1
+        self.subcase(1, occ, [2910])
+        self.subcase(2, calls > 1, True)
+
+    def test_other_engines(self):
+        print('\nTest Other Engines')
+        text = 'ACGTTACGTACCGTAACGT' * 3
+        pattern = strand.compile_pattern('ACG')
+        self.subcase(1, resume_until_done(pattern, text, 1, 4)[0], pattern.find_all(text))
+        pattern = kmismatch.compile_pattern('ACGT', 1)
+        self.subcase(2, resume_until_done(pattern, text, 1, 4)[0],
+                     kmismatch.find_all_k_mismatches('ACGT', text, 1))
+        pats = ['ACG', 'CGTA', 'T', '']
+        expected = find_all_multi(pats, text, False)
+        occ, token = find_all_multi_budgeted(pats, text, Budget(1), chunk=4, use_numpy=False)
+        self.subcase(3, token, ResumeToken(1, len(text)))
+        while token is not None:
+            found, token = find_all_multi_budgeted(pats, text, Budget(1), resume=token, chunk=4,
+                                                   use_numpy=False)
+            for pat in pats:
+                occ[pat] += found[pat]
+        self.subcase(4, occ, expected)
+        self.subcase(5, find_all_multi(pats, text, False, 5, 20),
+                     {pat: [j for j in offsets if 5 <= j and j + len(pat) <= 20]
+                      for pat, offsets in find_all_multi(pats, text, False).items() if pat}
+                     | {'': [5]})
+
+    def test_pat1(self):
+        print('\nTest Pat 1')
+        text, pat1 = load_test_files()
+        text = text[:100_000]
+        for pat in pat1[:10]:
+            pat = pat.strip()
+            expected = [m.start() for m in re.finditer(f'(?={pat})', text)]
+            occ, _ = resume_until_done(get_compiler('bm')(pat), text, 5000, 1000)
+            self.assertEqual(occ, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
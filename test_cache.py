@@ -0,0 +1,78 @@
+import unittest
+import os
+import tempfile
+
+from stringalgos.boyermoore import boyermoore
+from stringalgos.kmp import kmp
+from stringalgos.cache import ResultCache, digest_text, ENTRY_OVERHEAD
+
+
+class TestResultCache(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def test_digest(self):
+        print('\nTest Digest')
+        self.subcase(1, digest_text('abc'), digest_text(b'abc'))
+        self.assertNotEqual(digest_text('abc'), digest_text('abd'))
+
+    def test_hit_miss(self):
+        print('\nTest Hit Miss')
+        cache = ResultCache()
+        text = 'aaaaa'
+        self.subcase(1, cache.search(boyermoore, 'aa', text), [0, 1, 2, 3])
+        self.subcase(2, cache.search(boyermoore, 'aa', text), [0, 1, 2, 3])
+        self.subcase(3, cache.search(boyermoore, 'aa', ''.join(['aaa', 'aa'])), [0, 1, 2, 3])
+        self.subcase(4, cache.search(kmp, 'aa', text), [0, 1, 2, 3])
+        self.subcase(5, cache.search(boyermoore, 'ab', text), [])
+        stats = cache.stats()
+        self.subcase(6, (stats['hits'], stats['misses'], stats['entries']), (2, 3, 3))
+
+    def test_text_id(self):
+        print('\nTest Text Id')
+        cache = ResultCache(max_digests=1)
+        self.subcase(1, cache.search(boyermoore, 'aa', 'aaa', text_id=('doc', 1)), [0, 1])
+        self.subcase(2, cache.search(boyermoore, 'aa', 'aaa', text_id=('doc', 1)), [0, 1])
+        self.subcase(3, list(cache.text_digests), [('doc', 1)])  # digests only, no texts
+        buffer = bytearray(b'aaa')
+        self.subcase(4, cache.search(boyermoore, b'aa', buffer, text_id='buffer'), [0, 1])
+        buffer[1:2] = b'b'  # mutable buffers are rehashed on every search
+        self.subcase(5, cache.search(boyermoore, b'aa', buffer, text_id='buffer'), [])
+        self.subcase(6, list(cache.text_digests), [('doc', 1)])
+
+    def test_eviction(self):
+        print('\nTest Eviction')
+        cache = ResultCache(max_bytes=2 * (ENTRY_OVERHEAD + 8))
+        cache.search(boyermoore, 'a', 'ab')
+        cache.search(boyermoore, 'b', 'ab')
+        cache.search(boyermoore, 'a', 'ab')  # refresh 'a'
+        cache.search(boyermoore, 'c', 'abc')  # evicts 'b'
+        self.subcase(1, cache.stats()['evictions'], 1)
+        cache.search(boyermoore, 'a', 'ab')
+        self.subcase(2, cache.stats()['hits'], 2)
+        cache.search(boyermoore, 'b', 'ab')
+        self.subcase(3, cache.stats()['misses'], 4)
+        self.assertLessEqual(cache.stats()['nbytes'], cache.max_bytes)
+
+    def test_disk(self):
+        print('\nTest Disk')
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'text.txt')
+            with open(path, 'w') as f:
+                f.write('abcabc')
+            cache = ResultCache(directory=os.path.join(directory, 'cache'))
+            self.subcase(1, cache.search_file(boyermoore, 'bc', path), [1, 4])
+
+            cache = ResultCache(directory=os.path.join(directory, 'cache'))
+            self.subcase(2, cache.search_file(boyermoore, 'bc', path), [1, 4])
+            self.subcase(3, cache.stats()['disk_hits'], 1)
+
+            with open(path, 'w') as f:
+                f.write('bcbcbcbc')
+            os.utime(path, ns=(0, 0))
+            self.subcase(4, cache.search_file(boyermoore, 'bc', path), [0, 2, 4, 6])
+
+
+if __name__ == '__main__':
+    unittest.main()
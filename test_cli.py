@@ -0,0 +1,70 @@
+import unittest
+import contextlib
+import io
+import os
+import tempfile
+
+from stringalgos.__main__ import main, read_patterns
+from stringalgos.engines import ENGINES, get_compiler, get_engine
+
+
+class TestCli(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.text1 = self.write('text1.txt', 'ACGTACGT')
+        self.text2 = self.write('text2.txt', 'TTACGA')
+        self.pats = self.write('pats.txt', 'ACG\n\nCGT\nACG\n')
+
+    def write(self, name, content):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def run_main(self, *argv):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self.assertEqual(main(list(argv)), 0)
+        return out.getvalue().splitlines()
+
+    def test_read_patterns(self):
+        print('\nTest Read Patterns')
+        self.subcase(1, read_patterns([self.pats], ['GT']), ['GT', 'ACG', 'CGT'])
+        self.subcase(2, read_patterns([], []), [])
+
+    def test_engines(self):
+        print('\nTest Engines')
+        expected = [f'{self.text1}\tACG\t0 4', f'{self.text1}\tCGT\t1 5',
+                    f'{self.text2}\tACG\t2', f'{self.text2}\tCGT\t']
+        for n, engine in enumerate(ENGINES, 1):
+            self.subcase(n, self.run_main('-e', engine, '-p', self.pats, self.text1, self.text2),
+                         expected)
+
+    def test_options(self):
+        print('\nTest Options')
+        self.subcase(1, self.run_main('-s', 'A?G', '-e', 'wildcard', '--one-based', self.text2),
+                     [f'{self.text2}\tA?G\t3'])
+        output = os.path.join(self.tmp.name, 'out.tsv')
+        self.subcase(2, self.run_main('-s', 'T', '-o', output, self.text2), [])
+        with open(output) as f:
+            self.subcase(3, f.read(), f'{self.text2}\tT\t0 1\n')
+        with self.assertRaises(SystemExit), contextlib.redirect_stderr(io.StringIO()):
+            main([self.text1])
+
+    def test_registry(self):
+        print('\nTest Registry')
+        self.subcase(1, get_engine('rabinkarp')[1], 'multi')
+        self.subcase(2, get_compiler('rare')('ab').find_all('abab'), [0, 2])
+        with self.assertRaises(ValueError):
+            get_engine('grep')
+        with self.assertRaises(ValueError):
+            get_compiler('rabinkarp')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import random
+
+from stringalgos import document
+from stringalgos.boyermoore import boyermoore
+from stringalgos.document import DocumentMatcher, OffsetSet
+
+
+class TestDocumentMatcher(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def test_offset_set(self):
+        print('\nTest Offset Set')
+        offsets = OffsetSet([1, 5, 9, 13])
+        offsets.splice(5, 9, 10, [6])
+        self.subcase(1, offsets.tolist(), [1, 6, 19, 23])
+        offsets.splice(0, 100, 0, [])
+        self.subcase(2, offsets.tolist(), [])
+        offsets.splice(0, 0, 0, [3, 4])
+        self.subcase(3, offsets.tolist(), [3, 4])
+
+    def test_edits(self):
+        print('\nTest Edits')
+        text = 'abcabc'
+        matcher = DocumentMatcher('abc', text)
+        self.subcase(1, matcher.occurrences(), [0, 3])
+        text = 'abcXabc'
+        matcher.edit(3, 0, 'X', text)
+        self.subcase(2, matcher.occurrences(), [0, 4])
+        text = 'abXabc'
+        matcher.edit(2, 2, 'X', text)
+        self.subcase(3, matcher.occurrences(), [3])
+        text = 'abcabc'
+        matcher.edit(2, 1, 'c', text)
+        self.subcase(4, matcher.occurrences(), [0, 3])
+        with self.assertRaises(ValueError):
+            matcher.edit(0, 1, '', text)
+
+    def test_random(self):
+        print('\nTest Random')
+        random.seed(0)
+        chunk = document.CHUNK
+        document.CHUNK = 4
+        try:
+            for pat in ['a', 'ab', 'aba', 'abab']:
+                text = ''.join(random.choice('ab') for _ in range(200))
+                matcher = DocumentMatcher(pat, text)
+                for _ in range(300):
+                    pos = random.randint(0, len(text))
+                    deleted_len = random.randint(0, min(5, len(text) - pos))
+                    inserted = ''.join(random.choice('ab') for _ in range(random.randint(0, 5)))
+                    text = text[:pos] + inserted + text[pos + deleted_len:]
+                    matcher.edit(pos, deleted_len, inserted, text)
+                    self.assertEqual(matcher.occurrences(), boyermoore(pat, text))
+        finally:
+            document.CHUNK = chunk
+
+
+if __name__ == '__main__':
+    unittest.main()
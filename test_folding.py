@@ -0,0 +1,86 @@
+import unittest
+import re
+
+from stringalgos import boyermoore
+from stringalgos import kmp
+from stringalgos import mirrored_boyermoore
+from stringalgos import modified_kmp
+from stringalgos.folding import FoldedText, FoldedPattern, get_fold_map
+
+
+def load_test_files():
+    with open('./reference.txt') as f:
+        text = f.read()
+
+    with open('./pattern1.txt') as f:
+        pat1 = f.readlines()
+    return text, pat1
+
+
+class TestFolding(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def test_folded_text(self):
+        print('\nTest Folded Text')
+        text = FoldedText('AbCĀ', get_fold_map('case'))
+        self.subcase(1, len(text), 4)
+        self.subcase(2, text[0], 'a')
+        self.subcase(3, text[1:3], 'bc')
+        self.subcase(4, ''.join(text), 'abcĀ')
+
+    def test_invalid(self):
+        print('\nTest Invalid')
+        with self.assertRaises(ValueError):
+            get_fold_map('klingon')
+        with self.assertRaises(ValueError):
+            get_fold_map({'Ā': 'a'})
+
+    def test_case(self):
+        print('\nTest Case')
+        for module in [boyermoore, kmp, mirrored_boyermoore, modified_kmp]:
+            find_all = module.compile_pattern('aBa', fold='case').find_all
+            self.subcase(1, sorted(find_all('ABABAxaba')), [0, 2, 6])
+            self.subcase(2, find_all(''), [])
+        self.subcase(3, boyermoore.boyermoore('Ab', 'aBab', fold='case'), [0, 2])
+        self.subcase(4, kmp.kmp('Ab', 'aBab', fold='case'), [0, 2])
+        self.subcase(5, mirrored_boyermoore.mirrored_boyermoore('Ab', 'aBab', fold='case'), [2, 0])
+        self.subcase(6, modified_kmp.kmp('Ab', 'aBab', fold='case'), [0, 2])
+        self.subcase(7, modified_kmp.kmp('Ab', 'xaBab', fold='case', start=2), [3])
+
+    def test_latin1(self):
+        print('\nTest Latin-1')
+        for module in [boyermoore, kmp, mirrored_boyermoore, modified_kmp]:
+            find_all = module.compile_pattern('Éa', fold='case').find_all
+            self.subcase(1, sorted(find_all('éAÉaÿĀéa')), [0, 2, 6])  # Ā is outside the fold table
+            self.subcase(2, sorted(find_all('ÿÉÉAé')), [2])
+            self.subcase(3, find_all('abc'), [])
+            find_all = module.compile_pattern('ab', fold='case').find_all
+            self.subcase(4, sorted(find_all('ÀBÿabĀAb')), [3, 6])  # non-ascii text chars shift past
+    def test_custom(self):
+        print('\nTest Custom')
+        self.subcase(1, boyermoore.boyermoore('ACG', 'acgACGaCg', fold='dna'), [0, 3, 6])
+        self.subcase(2, boyermoore.boyermoore('acg', 'acgACG', fold='dna'), [0, 3])
+        self.subcase(3, kmp.kmp('AT', 'A-T', fold={'-': 'T'}), [0])
+        pattern = FoldedPattern(boyermoore.CompiledPattern, 'ab', {'B': 'b'})
+        self.subcase(4, pattern.find_all('aBAb'), [0])
+        self.subcase(5, mirrored_boyermoore.mirrored_boyermoore('ACG', 'acgACG', fold='dna'), [3, 0])
+        self.subcase(6, modified_kmp.kmp('AT', 'A-T', fold={'-': 'T'}), [0])
+
+    def test_pat1(self):
+        print('\nTest Pat 1')
+        text, pat1 = load_test_files()
+        text = ''.join(c.lower() if i % 3 == 0 else c for i, c in enumerate(text[:100_000]))
+        for pat in pat1[:10]:
+            pat = pat.strip()
+            expected = [m.start() for m in re.finditer(f'(?={pat})', text, re.IGNORECASE)]
+            self.assertEqual(boyermoore.boyermoore(pat, text, fold='dna'), expected)
+            self.assertEqual(kmp.kmp(pat.lower(), text, fold='case'), expected)
+            self.assertEqual(mirrored_boyermoore.mirrored_boyermoore(pat, text, fold='dna'),
+                             expected[::-1])
+            self.assertEqual(modified_kmp.kmp(pat.lower(), text, fold='case'), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import random
+
+from stringalgos.boyermoore import boyermoore
+from stringalgos.incremental import IncrementalKMP, IncrementalBoyerMoore
+
+
+def load_test_files():
+    with open('./reference.txt') as f:
+        text = f.read()
+
+    with open('./pattern1.txt') as f:
+        pat1 = f.readlines()
+    return text, pat1
+
+
+def feed_all(searcher, chunks):
+    occ = []
+    for chunk in chunks:
+        occ.extend(searcher.feed(chunk))
+    return occ
+
+
+class TestIncremental(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def test_empty_pat(self):
+        print('\nTest Empty Pat')
+        for searcher in [IncrementalKMP, IncrementalBoyerMoore]:
+            with self.assertRaises(ValueError):
+                searcher('')
+
+    def test_chunks(self):
+        print('\nTest Chunks')
+        for searcher in [IncrementalKMP, IncrementalBoyerMoore]:
+            self.subcase(1, feed_all(searcher('aa'), ['a', 'a', 'aaa']), [0, 1, 2, 3])
+            self.subcase(2, feed_all(searcher('bac'), ['cb', '', 'a', 'cd']), [1])
+            self.subcase(3, feed_all(searcher('abab'), ['ab', 'abab', 'b']), [0, 2])
+            self.subcase(4, feed_all(searcher('a'), ['', 'ba', 'a']), [1, 2])
+
+    def test_only_new(self):
+        print('\nTest Only New')
+        for searcher in [IncrementalKMP, IncrementalBoyerMoore]:
+            s = searcher('ab')
+            self.subcase(1, s.feed('abab'), [0, 2])
+            self.subcase(2, s.feed('x'), [])
+            self.subcase(3, s.feed('ab'), [5])
+
+    def test_pat1(self):
+        print('\nTest Pat 1')
+        random.seed(0)
+        text, pat1 = load_test_files()
+        text = text[:50_000]
+        cuts = sorted(random.sample(range(len(text)), 500))
+        chunks = [text[a:b] for a, b in zip([0] + cuts, cuts + [len(text)])]
+        for pat in pat1[:10]:
+            pat = pat.strip()
+            expected = boyermoore(pat, text)
+            for searcher in [IncrementalKMP, IncrementalBoyerMoore]:
+                self.assertEqual(feed_all(searcher(pat), chunks), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
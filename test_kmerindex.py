@@ -0,0 +1,78 @@
+import unittest
+import os
+import random
+import tempfile
+
+from stringalgos.kmerindex import KmerIndex, encode_postings, decode_postings, get_solid_sections
+from stringalgos.wildcard_matching import find_all
+
+
+def load_test_files():
+    with open('./reference.txt') as f:
+        text = f.read()
+    return text
+
+
+class TestKmerIndex(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def test_postings(self):
+        print('\nTest Postings')
+        self.subcase(1, encode_postings([3, 5, 70000]).tolist(), [3, 2, 69995])
+        self.subcase(2, encode_postings([3, 5]).typecode, 'H')
+        self.subcase(3, encode_postings([1 << 20]).typecode, 'I')
+        self.subcase(4, decode_postings(encode_postings([0, 1, 1 << 40])), [0, 1, 1 << 40])
+        self.subcase(5, decode_postings(encode_postings([])), [])
+
+    def test_solid_sections(self):
+        print('\nTest Solid Sections')
+        self.subcase(1, get_solid_sections('ab??cd?e'), [(0, 'ab'), (4, 'cd'), (7, 'e')])
+        self.subcase(2, get_solid_sections('??ab?'), [(2, 'ab')])
+        self.subcase(3, get_solid_sections('???'), [])
+
+    def test_match(self):
+        print('\nTest Match')
+        text = 'abcabcabxabcab'
+        index = KmerIndex(text, k=3)
+        self.subcase(1, index.count('abc'), 3)
+        self.subcase(2, index.get_positions('cab'), [2, 5, 11])
+        for n, pat in enumerate(['abc', 'abc?b', '?bca', 'a?c', '??', 'abcab?', 'x?cab', '',
+                                 'zzz', 'a[bx]c', 'abcabcabxabcab?', '?bcabcab?abcab'], 3):
+            self.subcase(n, index.find_all(pat), find_all(pat, text))
+        self.subcase(15, KmerIndex('', k=3).find_all('abc'), [])
+        with self.assertRaises(ValueError):
+            KmerIndex(text, k=0)
+
+    def test_persist(self):
+        print('\nTest Persist')
+        text = 'ACGTTGCAACGTACGA' * 4
+        index = KmerIndex(text, k=4)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'index.kmer')
+            index.save(path)
+            loaded = KmerIndex.load(path, text)
+            self.subcase(1, (loaded.k, loaded.postings), (index.k, index.postings))
+            self.subcase(2, loaded.find_all('ACG?ACGA'), find_all('ACG?ACGA', text))
+            with self.assertRaises(ValueError):
+                KmerIndex.load(path, text[::-1])
+            with open(path, 'wb') as f:
+                f.write(b'garbage')
+            with self.assertRaises(ValueError):
+                KmerIndex.load(path, text)
+
+    def test_reference(self):
+        print('\nTest Reference')
+        text = load_test_files()[:200_000]
+        index = KmerIndex(text)
+        random.seed(0)
+        for n in range(20):
+            length = random.randint(10, 40)
+            j = random.randrange(len(text) - length)
+            pat = ''.join('?' if random.random() < 0.1 else c for c in text[j:j + length])
+            self.assertEqual(index.find_all(pat), find_all(pat, text))
+
+
+if __name__ == '__main__':
+    unittest.main()
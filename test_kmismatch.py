@@ -0,0 +1,77 @@
+import unittest
+
+from stringalgos.kmismatch import BACKENDS, find_all_k_mismatches
+
+
+def load_test_files():
+    with open('./reference.txt') as f:
+        text = f.read()
+
+    with open('./pattern1.txt') as f:
+        pat1 = f.readlines()
+    return text, pat1
+
+
+def hamming_search(pat, text, k):
+    occ = []
+    for j in range(len(text) - len(pat) + 1):
+        mismatches = sum(a != b for a, b in zip(pat, text[j:j + len(pat)]))
+        if mismatches <= k:
+            occ.append((j, mismatches))
+    return occ
+
+
+class TestKMismatches(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def test_empty(self):
+        print('\nTest Empty')
+        for backend in BACKENDS:
+            self.subcase(1, find_all_k_mismatches('', '', 1, backend), [(0, 0)])
+            self.subcase(2, find_all_k_mismatches('abc', '', 1, backend), [])
+            self.subcase(3, find_all_k_mismatches('abc', 'ab', 1, backend), [])
+
+    def test_exact(self):
+        print('\nTest Exact')
+        for backend in BACKENDS:
+            self.subcase(1, find_all_k_mismatches('aa', 'aaaaa', 0, backend),
+                         [(0, 0), (1, 0), (2, 0), (3, 0)])
+            self.subcase(2, find_all_k_mismatches('bac', 'cbacd', 0, backend), [(1, 0)])
+
+    def test_mismatches(self):
+        print('\nTest Mismatches')
+        for backend in BACKENDS:
+            self.subcase(1, find_all_k_mismatches('abc', 'abdxbc', 1, backend), [(0, 1), (3, 1)])
+            self.subcase(2, find_all_k_mismatches('aaa', 'abab', 0, backend), [])
+            self.subcase(3, find_all_k_mismatches('aaa', 'abab', 1, backend), [(0, 1)])
+            self.subcase(4, find_all_k_mismatches('aaa', 'abab', 2, backend), [(0, 1), (1, 2)])
+            self.subcase(5, find_all_k_mismatches('ab', 'cd', 2, backend), [(0, 2)])
+
+    def test_invalid(self):
+        print('\nTest Invalid')
+        with self.assertRaises(ValueError):
+            find_all_k_mismatches('a', 'a', -1)
+        with self.assertRaises(ValueError):
+            find_all_k_mismatches('a', 'a', 0, 'suffix tree')
+
+    def test_pat1(self):
+        print('\nTest Pat 1')
+        text, pat1 = load_test_files()
+        text = text[:20_000]
+
+        for index, pat in enumerate(pat1[:10]):
+            pat = pat.strip()
+            for k in range(3):
+                expected = hamming_search(pat, text, k)
+                for backend in BACKENDS:
+                    try:
+                        self.assertEqual(find_all_k_mismatches(pat, text, k, backend), expected)
+                    except AssertionError as e:
+                        print(index, pat, k, backend)
+                        raise e
+
+
+if __name__ == '__main__':
+    unittest.main()
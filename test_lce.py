@@ -0,0 +1,65 @@
+import unittest
+import random
+
+from stringalgos.lce import SuffixArrayLCE, HashLCE, get_pair_lce, get_codes, get_suffix_array
+
+
+def naive_lce(string, i, j):
+    length = 0
+    while i + length < len(string) and j + length < len(string) and \
+            string[i + length] == string[j + length]:
+        length += 1
+    return length
+
+
+class TestLCE(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def test_suffix_array(self):
+        print('\nTest Suffix Array')
+        self.subcase(1, list(get_suffix_array(get_codes(''))), [])
+        self.subcase(2, list(get_suffix_array(get_codes('banana'))), [5, 3, 1, 0, 4, 2])
+        self.subcase(3, list(get_suffix_array(get_codes('aaaa'))), [3, 2, 1, 0])
+
+    def test_lce(self):
+        print('\nTest LCE')
+        for structure in [SuffixArrayLCE, HashLCE]:
+            lce = structure('abaabab')
+            self.subcase(1, lce.lce(0, 3), 3)
+            self.subcase(2, lce.lce(0, 5), 2)
+            self.subcase(3, lce.lce(1, 2), 0)
+            self.subcase(4, lce.lce(2, 2), 5)
+            self.subcase(5, lce.lce(6, 7), 0)
+
+    def test_pair_lce(self):
+        print('\nTest Pair LCE')
+        for backend in ['sa', 'hash']:
+            lce = get_pair_lce('aba', 'abab', backend)
+            self.subcase(1, lce(0, 0), 3)
+            self.subcase(2, lce(0, 2), 2)
+            self.subcase(3, lce(1, 1), 2)
+        with self.assertRaises(ValueError):
+            get_pair_lce('a', 'a', 'suffix tree')
+
+    def test_random(self):
+        print('\nTest Random')
+        random.seed(0)
+        for _ in range(200):
+            string = ''.join(random.choice('ab') for _ in range(random.randint(1, 50)))
+            structures = [SuffixArrayLCE(string), HashLCE(string)]
+            for _ in range(20):
+                i = random.randrange(len(string))
+                j = random.randrange(len(string))
+                expected = naive_lce(string, i, j)
+                for structure in structures:
+                    try:
+                        self.assertEqual(structure.lce(i, j), expected)
+                    except AssertionError as e:
+                        print(string, i, j, type(structure).__name__)
+                        raise e
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from array import array
+import sys
+import tracemalloc
+
+from stringalgos.boyermoore import compile_pattern as compile_bm
+from stringalgos.engines import get_compiler
+from stringalgos.memory import PHASES, deep_sizeof, get_table_nbytes, profile_memory
+from stringalgos.wildcard_matching import compile_pattern as compile_wildcard
+
+
+class TestMemory(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def test_deep_sizeof(self):
+        print('\nTest Deep Sizeof')
+        row = [1000, 2000]
+        self.subcase(1, deep_sizeof('abc'), sys.getsizeof('abc'))
+        self.subcase(2, deep_sizeof([row]),
+                     sys.getsizeof([row]) + sys.getsizeof(row) + 2 * sys.getsizeof(1000))
+        self.subcase(3, deep_sizeof([row, row]) - deep_sizeof([row]),
+                     sys.getsizeof([row, row]) - sys.getsizeof([row]))  # shared row counted once
+        self.subcase(4, deep_sizeof(array('I', range(10))), sys.getsizeof(array('I', range(10))))
+
+    def test_nbytes(self):
+        print('\nTest Nbytes')
+        pattern = compile_bm('abcab')
+        self.subcase(1, sorted(pattern.nbytes), ['bad_char'])  # lazy tables are not built
+        pattern.find_all('zzzababcab')  # a partial match and a full match
+        self.subcase(2, sorted(pattern.nbytes), ['bad_char', 'good_suffix', 'matched_prefix'])
+        self.subcase(3, get_table_nbytes(pattern, ['bad_char'])['bad_char'],
+                     deep_sizeof(pattern.bad_char))
+        self.subcase(4, sorted(compile_wildcard('ab?a').nbytes), ['sections'])
+        self.subcase(5, sorted(compile_wildcard('ab[ac]a').nbytes), ['masks'])
+        self.subcase(6, sorted(compile_bm('abcab', fold='case').nbytes), ['bad_char', 'fold_map'])
+        self.subcase(7, sorted(compile_bm('abcab', specialize=True).nbytes), ['constants'])
+        for engine in ('bm', 'kmp', 'mirrored-bm', 'modified-kmp', 'wildcard', 'twoway', 'rare'):
+            nbytes = get_compiler(engine)('abcab').nbytes
+            self.assertTrue(all(size > 0 for size in nbytes.values()), engine)
+
+    def test_profile(self):
+        print('\nTest Profile')
+        text = 'ab' * 5000
+        small = profile_memory(get_compiler('kmp'), 'abab', text)
+        self.subcase(1, sorted(small), sorted(PHASES + ('tables',)))
+        self.subcase(2, small['scan'] >= sys.getsizeof(list(range(4999))), True)
+        self.subcase(3, small['results'] >= len(' '.join(map(str, range(0, 9997, 2)))), True)
+        none = profile_memory(get_compiler('kmp'), 'abba', text)
+        self.subcase(4, none['scan'] < small['scan'], True)
+        self.subcase(5, tracemalloc.is_tracing(), False)
+        tracemalloc.start()
+        try:
+            profile_memory(get_compiler('bm'), 'abab', text)
+            self.subcase(6, tracemalloc.is_tracing(), True)  # left running if it already was
+        finally:
+            tracemalloc.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import re
+
+from stringalgos.npsearch import find_all_numpy, get_check_positions, np
+
+
+def load_test_files():
+    with open('./reference.txt') as f:
+        text = f.read()
+
+    with open('./pattern1.txt') as f:
+        pat1 = f.readlines()
+    return text, pat1
+
+
+class TestNumpySearch(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def test_check_positions(self):
+        print('\nTest Check Positions')
+        self.subcase(1, get_check_positions(3), [2, 1, 0])
+        self.subcase(2, get_check_positions(10), [9, 0, 3, 6])
+        self.subcase(3, get_check_positions(5, 3), [4, 0, 2])
+
+    def test_empty(self):
+        print('\nTest Empty')
+        self.subcase(1, find_all_numpy(b'', b''), [0])
+        self.subcase(2, find_all_numpy(b'abc', b''), [])
+
+    def test_match(self):
+        print('\nTest Match')
+        for block in [1, 2, 1 << 20]:
+            self.subcase(1, find_all_numpy(b'aa', b'aaaaa', block), [0, 1, 2, 3])
+            self.subcase(2, find_all_numpy(b'bac', b'cbacd', block), [1])
+            self.subcase(3, find_all_numpy(b'abcdeab', b'xabcdeabcdeabcdeab', block), [1, 6, 11])
+            self.subcase(4, find_all_numpy(b'abcdeab', bytearray(b'abcdxab'), block), [])
+            self.subcase(5, find_all_numpy(b'abcdeab', memoryview(b'abcdeab'), block), [0])
+
+    def test_fallback(self):
+        print('\nTest Fallback')
+        self.subcase(1, find_all_numpy('ab', 'abab'), [0, 2])
+
+    @unittest.skipUnless(np, 'NumPy is not installed')
+    def test_numpy_path(self):
+        print('\nTest NumPy Path')
+
+        def fallback(pat, text):
+            raise AssertionError('fallback used although NumPy is installed')
+
+        for block in [1, 3, 1 << 20]:
+            self.subcase(1, find_all_numpy(b'aa', b'aaaaa', block, fallback), [0, 1, 2, 3])
+            self.subcase(2, find_all_numpy(b'abcdeab', b'xabcdeabcdeabcdeab', block, fallback),
+                         [1, 6, 11])
+            self.subcase(3, find_all_numpy(b'abcdeab', memoryview(b'abcdxab'), block, fallback),
+                         [])
+
+    def test_pat1(self):
+        print('\nTest Pat 1')
+        text, pat1 = load_test_files()
+        data = text.encode()
+        for pat in pat1:
+            pat = pat.strip()
+            expected = [m.start() for m in re.finditer(f'(?={pat})', text)]
+            self.assertEqual(find_all_numpy(pat.encode(), data, 1 << 16), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import re
+
+from stringalgos.boyermoore import boyermoore
+from stringalgos.prefilter import find_all_rare, get_rare_index, sample_frequencies
+
+
+def load_test_files():
+    with open('./reference.txt') as f:
+        text = f.read()
+
+    with open('./pattern1.txt') as f:
+        pat1 = f.readlines()
+
+    with open('./pattern2.txt') as f:
+        pat2 = f.readlines()
+    return text, pat1, pat2
+
+
+class TestPrefilter(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def test_empty(self):
+        print('\nTest Empty')
+        self.subcase(1, find_all_rare('', ''), [0])
+        self.subcase(2, find_all_rare('abc', ''), [])
+        self.subcase(3, find_all_rare('', 'abc'), [0])
+
+    def test_match(self):
+        print('\nTest Match')
+        self.subcase(1, find_all_rare('aa', 'aaaaa', max_density=1), [0, 1, 2, 3])
+        self.subcase(2, find_all_rare('bac', 'cbacd', max_density=1), [1])
+        self.subcase(3, find_all_rare('ab', 'abb', max_density=1), [0])
+        self.subcase(4, find_all_rare('xab', 'abxab', max_density=1), [2])
+        self.subcase(5, find_all_rare(b'ba', b'abab', max_density=1), [1])
+        self.subcase(6, find_all_rare(b'aa', b'aaaaa'), [0, 1, 2, 3])  # dense bytes, no fallback
+
+    def test_rare_index(self):
+        print('\nTest Rare Index')
+        counts, sampled = sample_frequencies('aaaabbc')
+        self.subcase(1, sampled, 7)
+        self.subcase(2, get_rare_index('abca', counts), 2)
+        self.subcase(3, get_rare_index('aa', counts), 1)
+        counts, sampled = sample_frequencies('ab' * 100, blocks=4, block_len=10)
+        self.subcase(4, (counts['a'], counts['b'], sampled), (20, 20, 40))
+
+    def test_fallback(self):
+        print('\nTest Fallback')
+        calls = []
+
+        def fallback(pat, text):
+            calls.append(pat)
+            return boyermoore(pat, text)
+
+        self.subcase(1, find_all_rare('aa', 'aaaaa', fallback=fallback), [0, 1, 2, 3])
+        self.subcase(2, calls, ['aa'])
+
+    def test_pat2(self):
+        print('\nTest Pat 2')
+        text, _, pat2 = load_test_files()
+        for index, pat in enumerate(pat2):
+            expected = [m.start() for m in re.finditer(f'(?={pat.strip()})', text)]
+            try:
+                self.assertEqual(find_all_rare(pat.strip(), text, max_density=1), expected)
+            except AssertionError as e:
+                print(index, pat)
+                raise e
+
+
+if __name__ == '__main__':
+    unittest.main()
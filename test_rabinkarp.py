@@ -0,0 +1,83 @@
+import unittest
+import re
+
+from stringalgos import rabinkarp
+from stringalgos.rabinkarp import NUMPY_MAX_LENGTH, find_all_multi, get_scan, scan_numpy, \
+    scan_python
+
+
+def load_test_files():
+    with open('./reference.txt') as f:
+        text = f.read()
+
+    with open('./pattern1.txt') as f:
+        pat1 = f.readlines()
+
+    with open('./pattern2.txt') as f:
+        pat2 = f.readlines()
+    return text, pat1, pat2
+
+
+BACKENDS = [False] + ([True] if rabinkarp.np is not None else [])
+
+
+class TestRabinKarp(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def test_empty(self):
+        print('\nTest Empty')
+        for use_numpy in BACKENDS:
+            self.subcase(1, find_all_multi([], 'abc', use_numpy), {})
+            self.subcase(2, find_all_multi(['', 'a'], '', use_numpy), {'': [0], 'a': []})
+
+    def test_match(self):
+        print('\nTest Match')
+        for use_numpy in BACKENDS:
+            self.subcase(1, find_all_multi(['aa', 'ab', 'b', 'aab'], 'aaaab', use_numpy),
+                         {'aa': [0, 1, 2], 'ab': [3], 'b': [4], 'aab': [2]})
+            self.subcase(2, find_all_multi(['bac', 'bac'], 'cbacd', use_numpy), {'bac': [1]})
+            self.subcase(3, find_all_multi([b'ba', b'ab'], b'abab', use_numpy),
+                         {b'ba': [1], b'ab': [0, 2]})
+            self.subcase(4, find_all_multi(['abcd'], 'abc', use_numpy), {'abcd': []})
+
+    def test_collision(self):
+        print('\nTest Collision')
+        rabinkarp.BASE, base = 1, rabinkarp.BASE  # hash becomes the sum of codes
+        try:
+            self.subcase(1, find_all_multi(['ab'], 'baab', False), {'ab': [2]})
+        finally:
+            rabinkarp.BASE = base
+
+    def test_backend(self):
+        print('\nTest Backend')
+        short = scan_numpy if rabinkarp.np is not None else scan_python
+        self.subcase(1, get_scan(NUMPY_MAX_LENGTH), short)
+        self.subcase(2, get_scan(NUMPY_MAX_LENGTH + 1), scan_python)  # O(n * L) beyond the limit
+        self.subcase(3, get_scan(8, False), scan_python)
+        text = 'ab' * 5000
+        pat = text[:NUMPY_MAX_LENGTH * 4]  # long pattern on the default backend
+        self.subcase(4, find_all_multi([pat, 'ba'], text),
+                     {pat: list(range(0, len(text) - len(pat) + 1, 2)),
+                      'ba': list(range(1, len(text) - 1, 2))})
+
+    @unittest.skipIf(rabinkarp.np is None, 'NumPy is not installed')
+    def test_numpy_required(self):
+        print('\nTest NumPy')
+        self.subcase(1, find_all_multi(['ab'], 'abab', True), {'ab': [0, 2]})
+
+    def test_pat1_pat2(self):
+        print('\nTest Pat 1 and Pat 2')
+        text, pat1, pat2 = load_test_files()
+        text = text[:200_000]
+        pats = [pat.strip() for pat in pat1 + pat2]
+        for use_numpy in BACKENDS:
+            actual = find_all_multi(pats, text, use_numpy)
+            for pat in pats:
+                expected = [m.start() for m in re.finditer(f'(?={pat})', text)]
+                self.assertEqual(actual[pat], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+import random
+
+from stringalgos import boyermoore, kmp, mirrored_boyermoore, modified_kmp, twoway, \
+    wildcard_matching
+from stringalgos.engines import ENGINES, get_compiler, find_all_regions
+
+
+def load_test_files():
+    with open('./reference.txt') as f:
+        text = f.read()
+
+    with open('./pattern1.txt') as f:
+        pat1 = f.readlines()
+    return text, pat1
+
+
+def sliced(find_all, text, start, end):
+    return [start + offset for offset in find_all(text[start:end])]
+
+
+class TestRegions(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def test_functions(self):
+        print('\nTest Functions')
+        text = 'abaababaab'
+        self.subcase(1, boyermoore.boyermoore('ab', text, start=1, end=7), [3, 5])
+        self.subcase(2, kmp.kmp('ab', text, start=1, end=7), [3, 5])
+        self.subcase(3, mirrored_boyermoore.mirrored_boyermoore('ab', text, start=1, end=7), [5, 3])
+        self.subcase(4, modified_kmp.kmp('ab', text, start=1, end=7), [3, 5])
+        self.subcase(5, wildcard_matching.find_all('a?', text, start=1, end=7), [2, 3, 5])
+        self.subcase(6, wildcard_matching.find_all('a[b]', text, start=1, end=7), [3, 5])
+        self.subcase(7, boyermoore.boyermoore('ab', text, start=-3), [8])
+        self.subcase(8, kmp.kmp('', text, start=4), [4])
+        self.subcase(9, wildcard_matching.find_all('ab', text, start=5, end=5), [])
+        self.subcase(10, boyermoore.boyermoore('AB', text, fold='case', start=4), [5, 8])
+        specialized = boyermoore.compile_pattern('aab', specialize=True)
+        self.subcase(11, specialized.find_all(text, 1, 9), [2])
+        self.subcase(12, twoway.twoway('ab', text, start=1, end=7), [3, 5])
+
+    def test_regions(self):
+        print('\nTest Regions')
+        text = 'abaababaab'
+        pattern = kmp.compile_pattern('ab')
+        self.subcase(1, find_all_regions(pattern, text, [(0, 2), (1, 7), (6, 10)]),
+                     [[0], [3, 5], [8]])
+        self.subcase(2, find_all_regions(get_compiler('rare')('ab'), text, [(2, 6)]), [[3]])
+        with self.assertRaises(ValueError):
+            find_all_regions(pattern, text, [(3, 5), (1, 2)])
+
+    def test_pat1(self):
+        print('\nTest Pat 1')
+        text, pat1 = load_test_files()
+        text = text[:20_000]
+        random.seed(0)
+        regions = sorted((start, start + random.randint(0, 2000))
+                         for start in random.sample(range(len(text)), 10))
+        for engine in ENGINES:
+            if ENGINES[engine][2] == 'multi':
+                continue
+            compile = get_compiler(engine)
+            for pat in pat1[:10]:
+                pat = pat.strip()
+                if engine == 'numpy':
+                    pattern, subject = compile(pat.encode()), text.encode()
+                else:
+                    pattern, subject = compile(pat), text
+                expected = [sliced(pattern.find_all, subject, start, end) for start, end in regions]
+                self.assertEqual(find_all_regions(pattern, subject, regions), expected, engine)
+
+
+if __name__ == '__main__':
+    unittest.main()
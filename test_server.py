@@ -0,0 +1,125 @@
+import unittest
+import os
+import re
+import socket
+import tempfile
+import threading
+
+from stringalgos.boyermoore import boyermoore
+from stringalgos.client import SearchClient, ServerError
+from stringalgos.server import SearchServer, write_message, read_message
+
+
+def load_test_files():
+    with open('./pattern1.txt') as f:
+        pat1 = f.readlines()
+    return pat1
+
+
+class TestServer(unittest.TestCase):
+    executor = 'thread'
+
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dna = os.path.join(tmp.name, 'dna.txt')
+        with open(self.dna, 'w') as f:
+            f.write('ACGTACGTTACG')
+        self.empty = os.path.join(tmp.name, 'empty.txt')
+        open(self.empty, 'w').close()
+        self.path = os.path.join(tmp.name, 'search.sock')
+        self.server = SearchServer(self.path, [self.dna, self.empty, './reference.txt'],
+                                   self.executor, workers=2)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+
+        def stop():
+            self.server.shutdown()
+            thread.join()
+            self.server.server_close()
+        self.addCleanup(stop)
+
+    def test_search(self):
+        print('\nTest Search')
+        with SearchClient(self.path) as client:
+            self.subcase(1, client.ping(), True)
+            self.subcase(2, client.references(),
+                         {'dna.txt': 12, 'empty.txt': 0, 'reference.txt': os.path.getsize('./reference.txt')})
+            self.subcase(3, client.search('ACG', 'dna.txt'), [0, 4, 9])
+            self.subcase(4, client.search('ACG', 'dna.txt', engine='mirrored-bm'), [9, 4, 0])
+            self.subcase(5, client.search('A?G', 'dna.txt', engine='wildcard'), [0, 4, 9])
+            self.subcase(6, client.search('CG', 'dna.txt', engine='numpy'), [1, 5, 10])
+            self.subcase(7, client.search('CG', 'dna.txt', engine='rabinkarp'), [1, 5, 10])
+            self.subcase(8, client.search('A', 'empty.txt'), [])
+
+    def test_errors(self):
+        print('\nTest Errors')
+        with SearchClient(self.path) as client:
+            for request in [{'op': 'search', 'reference': 'missing.txt', 'pattern': 'A'},
+                            {'op': 'search', 'reference': 'dna.txt', 'pattern': 'A', 'engine': 'grep'},
+                            {'op': 'search', 'reference': 'dna.txt', 'pattern': 1},
+                            {'op': 'search', 'reference': 'dna.txt', 'pattern': 'A', 'engine': ['bm']},
+                            {'op': 'search', 'reference': ['dna.txt'], 'pattern': 'A'},
+                            {'op': ['search'], 'reference': 'dna.txt', 'pattern': 'A'},
+                            {'op': 'shutdown'}]:
+                with self.assertRaises(ServerError):
+                    client.request(request)
+            with self.assertRaises(ServerError):  # raised by the engine in a worker
+                client.search('x{2,1}', 'dna.txt', engine='wildcard')
+            self.subcase(1, client.search('T', 'dna.txt'), [3, 7, 8])  # connection still usable
+
+    def test_framing(self):
+        print('\nTest Framing')
+        with socket.socket(socket.AF_UNIX) as sock:
+            sock.connect(self.path)
+            sock.sendall(b'\xff\xff\xff\xff')
+            reply = read_message(sock.makefile('rb'))
+            self.subcase(1, reply['id'], None)
+            self.assertIn('exceeds', reply['error'])
+        with socket.socket(socket.AF_UNIX) as sock:
+            sock.connect(self.path)
+            wfile = sock.makefile('wb')
+            write_message(wfile, ['not', 'an', 'object'])
+            self.assertIn('error', read_message(sock.makefile('rb')))
+        with socket.socket(socket.AF_UNIX) as sock:
+            sock.connect(self.path)
+            wfile, rfile = sock.makefile('wb'), sock.makefile('rb')
+            payload = b'{"op": "ping"'
+            wfile.write(len(payload).to_bytes(4, 'big') + payload)
+            wfile.flush()
+            self.assertIn('invalid JSON', read_message(rfile)['error'])
+            write_message(wfile, {'op': 'ping', 'id': 2})  # connection still usable
+            self.subcase(2, read_message(rfile), {'id': 2, 'pong': True})
+
+    def test_pipelining(self):
+        print('\nTest Pipelining')
+        with open('./reference.txt') as f:
+            text = f.read()
+        pats = [pat.strip() for pat in load_test_files()[:8]]
+        expected = [boyermoore(pat, text) for pat in pats]
+        results = {}
+
+        def query(n):
+            with SearchClient(self.path) as client:
+                results[n] = client.search_many(pats, 'reference.txt')
+
+        threads = [threading.Thread(target=query, args=(n,)) for n in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for n in range(3):
+            self.subcase(n + 1, results[n], expected)
+        self.subcase(4, expected[0], [m.start() for m in re.finditer(f'(?={pats[0]})', text)])
+
+
+class TestProcessServer(TestServer):
+    executor = 'process'
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+import os
+import tempfile
+
+from stringalgos.shards import ShardedIndex, build_shards, load_manifest
+from stringalgos.wildcard_matching import find_all
+
+
+class TestShards(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = tmp.name
+        self.directory = os.path.join(self.tmp, 'shards')
+        self.texts = {'a.txt': 'ACGTACGTTACGATT', 'b.txt': 'TTACGATTACG', 'c.txt': 'ACGTACGTTACGATT'}
+        self.paths = [self.write(name, text) for name, text in self.texts.items()]
+
+    def write(self, name, text):
+        path = os.path.join(self.tmp, name)
+        with open(path, 'w') as f:
+            f.write(text)
+        return path
+
+    def expected(self, pat):
+        return [(path, offset) for path in self.paths
+                for offset in find_all(pat, self.texts[os.path.basename(path)])]
+
+    def test_build(self):
+        print('\nTest Build')
+        manifest, built = build_shards(self.paths, self.directory, k=4)
+        self.subcase(1, built, self.paths[:2])  # c.txt has the same content as a.txt
+        self.subcase(2, [entry['length'] for entry in manifest['files']], [15, 11, 15])
+        self.subcase(3, load_manifest(self.directory), manifest)
+        self.subcase(4, len([name for name in os.listdir(self.directory) if name.endswith('.kmer')]),
+                     2)
+        with self.assertRaises(ValueError):
+            build_shards(self.paths, self.directory, executor='fibers')
+
+    def test_incremental(self):
+        print('\nTest Incremental')
+        build_shards(self.paths, self.directory, k=4, executor=None)
+        self.subcase(1, build_shards(self.paths, self.directory, k=4, executor=None)[1], [])
+        self.texts['b.txt'] = 'GATTACAGATTACA'
+        self.write('b.txt', self.texts['b.txt'])
+        manifest, built = build_shards(self.paths, self.directory, k=4, executor='thread')
+        self.subcase(2, built, [self.paths[1]])
+        self.subcase(3, len(os.listdir(self.directory)), 3)  # stale shard of b.txt removed
+        self.subcase(4, ShardedIndex(self.directory).find_all('GATTAC?'), self.expected('GATTAC?'))
+        self.subcase(5, build_shards(self.paths, self.directory, k=5, executor=None)[1],
+                     self.paths[:2])
+        self.subcase(6, len(os.listdir(self.directory)), 5)  # k=4 shards are kept
+        self.subcase(7, build_shards(self.paths, self.directory, k=4, executor=None)[1], [])
+        self.texts['a.txt'] = 'TTTTACGT'
+        self.write('a.txt', self.texts['a.txt'])
+        build_shards(self.paths, self.directory, k=5, executor=None)
+        self.subcase(8, sorted(name.split('.')[1] for name in os.listdir(self.directory)
+                               if name.endswith('.kmer')), ['k4', 'k4', 'k5', 'k5', 'k5'])
+
+    def test_query(self):
+        print('\nTest Query')
+        build_shards(self.paths, self.directory, k=4, executor='process', workers=2)
+        index = ShardedIndex(self.directory)
+        for n, pat in enumerate(['ACGT', 'TTACG?TT', 'A?G', 'ACGTACGTTACGATTX'], 1):
+            self.subcase(n, index.find_all(pat), self.expected(pat))
+        with ShardedIndex(self.directory, workers=2) as pooled:
+            self.subcase(5, pooled.find_all('TACG', 'thread'), self.expected('TACG'))
+            self.subcase(6, pooled.find_all('TACG', 'process'), self.expected('TACG'))
+            pool = pooled.pools['process']
+            self.subcase(7, pooled.find_all('ACGT', 'process'), self.expected('ACGT'))
+            self.subcase(8, pooled.pools['process'] is pool, True)  # kept across queries
+        self.subcase(9, pooled.pools, {})
+        with self.assertRaises(ValueError):
+            ShardedIndex(self.tmp)
+
+
+if __name__ == '__main__':
+    unittest.main()
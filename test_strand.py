@@ -0,0 +1,60 @@
+import unittest
+
+from stringalgos.boyermoore import boyermoore
+from stringalgos.strand import find_all_strands, reverse_complement, get_shared_shift
+
+
+def load_test_files():
+    with open('./reference.txt') as f:
+        text = f.read()
+
+    with open('./pattern1.txt') as f:
+        pat1 = f.readlines()
+    return text, pat1
+
+
+class TestStrand(unittest.TestCase):
+    def subcase(self, n, actual, expected):
+        print('Subcase', n)
+        self.assertEqual(actual, expected)
+
+    def test_reverse_complement(self):
+        print('\nTest Reverse Complement')
+        self.subcase(1, reverse_complement('AACGTN'), 'NACGTT')
+        self.subcase(2, reverse_complement('acgRY'), 'RYcgt')
+        self.subcase(3, reverse_complement(b'AAC'), b'GTT')
+        self.subcase(4, reverse_complement(''), '')
+
+    def test_shared_shift(self):
+        print('\nTest Shared Shift')
+        self.subcase(1, get_shared_shift(['ACG', 'CGT']), {'A': 2, 'C': 1, 'G': 1})
+
+    def test_empty(self):
+        print('\nTest Empty')
+        self.subcase(1, find_all_strands('', ''), [(0, '+')])
+        self.subcase(2, find_all_strands('ACG', ''), [])
+
+    def test_match(self):
+        print('\nTest Match')
+        self.subcase(1, find_all_strands('AAC', 'AACGTTAAC'), [(0, '+'), (3, '-'), (6, '+')])
+        self.subcase(2, find_all_strands('ACGT', 'ACGTACGT'), [(0, '+'), (4, '+')])  # palindrome
+        self.subcase(3, find_all_strands('AA', 'AAATTT'), [(0, '+'), (1, '+'), (3, '-'), (4, '-')])
+        self.subcase(4, find_all_strands(b'AC', b'ACGT'), [(0, '+'), (2, '-')])
+        self.subcase(5, find_all_strands('G', 'GCC'), [(0, '+'), (1, '-'), (2, '-')])
+
+    def test_pat1(self):
+        print('\nTest Pat 1')
+        text, pat1 = load_test_files()
+        text = text[:300_000]
+        for pat in pat1:
+            pat = pat.strip()
+            expected = [(j, '+') for j in boyermoore(pat, text)]
+            reverse = reverse_complement(pat)
+            if reverse != pat:
+                expected += [(j, '-') for j in boyermoore(reverse, text)]
+            expected.sort()
+            self.assertEqual(find_all_strands(pat, text), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()